@@ -82,7 +82,7 @@ class AutonomousTraderV2:
         await self.pie.initialize()
         
         # Initialize Quantum Engine
-        await self.quantum.initialize()
+        self.quantum.initialize()
         
         # Initialize IG Markets API
         ig_api_config = self.config['brokers']['ig_markets']
@@ -627,7 +627,7 @@ class AutonomousTraderV2:
                 self.positions[deal_id] = {
                     'deal_id': deal_id,
                     'epic': position_record.epic,
-                    'direction': position_record.direction,
+                    'direction': position_record.direction.name,
                     'size': position_record.size,
                     'entry_price': position_record.entry_price,
                     'status': 'OPEN',
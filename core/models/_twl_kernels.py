@@ -0,0 +1,57 @@
+"""
+Numeric kernels for the Quantum Time-Warp learner.
+
+The batch confidence adjustment is compiled with numba when it is installed;
+otherwise an equivalent vectorized NumPy implementation is used.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Win-rate sentinel for symbols without recent trades (kept out of NaN so the
+# kernel can be compiled with fastmath)
+NO_RECENT_TRADES = -1.0
+
+
+def _evolve_loop(conf, regime_acc, sym_win_rate, lr, out_conf, out_adj):
+    """
+    Per-prediction confidence adjustment, written as a single loop for numba.
+
+    Branch-free: at most one of the high/low regime terms is non-zero, so
+    1 + high - low reproduces the >0.7 / <0.4 / neutral piecewise boost with
+    straight-line arithmetic that LLVM can vectorize.
+    """
+    for i in range(conf.shape[0]):
+        acc = regime_acc[i]
+        high = max(acc - 0.7, 0.0) * lr
+        low = max(0.4 - acc, 0.0) * lr * 1.5
+        confidence_boost = 1.0 + high - low
+
+        win_rate = sym_win_rate[i]
+        has_recent = win_rate >= 0.0
+        temporal_boost = 1.0 + has_recent * (win_rate - 0.5) * 0.1
+
+        adjustment = confidence_boost * temporal_boost
+        out_adj[i] = adjustment
+        out_conf[i] = min(95.0, max(40.0, conf[i] * adjustment))  # Clamp 40-95%
+
+
+def _evolve_numpy(conf, regime_acc, sym_win_rate, lr, out_conf, out_adj):
+    """Vectorized NumPy equivalent of _evolve_loop"""
+    high = np.maximum(regime_acc - 0.7, 0.0) * lr
+    low = np.maximum(0.4 - regime_acc, 0.0) * (lr * 1.5)
+    confidence_boost = 1.0 + high - low
+    temporal_boost = 1.0 + (sym_win_rate >= 0.0) * (sym_win_rate - 0.5) * 0.1
+
+    np.multiply(confidence_boost, temporal_boost, out=out_adj)
+    np.clip(conf * out_adj, 40.0, 95.0, out=out_conf)
+
+
+if njit is not None:
+    evolve_confidence = njit(cache=True, fastmath=True, boundscheck=False)(_evolve_loop)
+else:
+    evolve_confidence = _evolve_numpy
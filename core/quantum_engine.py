@@ -13,7 +13,7 @@ import logging
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class QuantumState:
     """Represents a quantum-inspired market state"""
     superposition: np.ndarray
@@ -30,14 +30,21 @@ class QuantumEngine:
     - Superposition: Multiple market states simultaneously
     - Entanglement: Correlated asset relationships  
     - Interference: Pattern emergence from noise
+    
+    All methods are pure computation and synchronous; the *_async variants
+    are thin shims for callers that still await them.
     """
     
     def __init__(self, dimensions: int = 10):
         self.dimensions = dimensions
         self.state = None
         self.initialized = False
+        self._rng = np.random.default_rng()
+        
+        # Measurement weights depend only on dimensions
+        self._measure_weights = np.arange(dimensions, dtype=np.float32) / np.float32(dimensions)
         
-    async def initialize(self):
+    def initialize(self):
         """Initialize quantum engine"""
         logger.info("🔮 Initializing Quantum Engine...")
         
@@ -50,10 +57,13 @@ class QuantumEngine:
     def _create_initial_state(self) -> QuantumState:
         """Create initial quantum state"""
         # Initialize superposition (uniform distribution)
-        superposition = np.ones(self.dimensions) / np.sqrt(self.dimensions)
+        # (float32 throughout: heuristic state, half the bandwidth)
+        superposition = np.full(
+            self.dimensions, 1.0 / np.sqrt(self.dimensions), dtype=np.float32
+        )
         
         # Initialize entanglement matrix (identity)
-        entanglement = np.eye(self.dimensions)
+        entanglement = np.eye(self.dimensions, dtype=np.float32)
         
         return QuantumState(
             superposition=superposition,
@@ -62,7 +72,7 @@ class QuantumEngine:
             timestamp=0.0
         )
     
-    async def evolve(self, market_data: Dict) -> QuantumState:
+    def evolve(self, market_data: Dict) -> QuantumState:
         """
         Evolve quantum state based on market data
         
@@ -73,13 +83,13 @@ class QuantumEngine:
             Evolved quantum state
         """
         if not self.initialized:
-            await self.initialize()
+            self.initialize()
         
         # TODO: Implement quantum evolution
         # For now, return current state
         return self.state
     
-    async def measure(self) -> float:
+    def measure(self) -> float:
         """
         Perform quantum measurement
         
@@ -89,14 +99,9 @@ class QuantumEngine:
             return 0.5
         
         # Weighted average of superposition
-        prediction = np.dot(
-            self.state.superposition,
-            np.arange(self.dimensions) / self.dimensions
-        )
-        
-        return float(prediction)
+        return float(self.state.superposition @ self._measure_weights)
     
-    async def calculate_entanglement(
+    def calculate_entanglement(
         self,
         assets: List[str]
     ) -> Dict[Tuple[str, str], float]:
@@ -105,16 +110,44 @@ class QuantumEngine:
         
         Returns correlation-like metrics
         """
-        # TODO: Implement actual entanglement calculation
-        entanglements = {}
+        entanglement = self.calculate_entanglement_matrix(assets)
+        rows, cols = np.triu_indices(len(assets), k=1)
         
-        for i, asset1 in enumerate(assets):
-            for j, asset2 in enumerate(assets):
-                if i < j:
-                    # Placeholder: random entanglement
-                    entanglements[(asset1, asset2)] = np.random.rand() * 0.5
+        return dict(zip(
+            zip([assets[i] for i in rows], [assets[j] for j in cols]),
+            entanglement[rows, cols].tolist()
+        ))
+    
+    def calculate_entanglement_matrix(self, assets: List[str]) -> np.ndarray:
+        """
+        Calculate entanglement between assets as an (N, N) matrix
         
-        return entanglements
+        Only the strict upper triangle (i < j) is meaningful; use this
+        directly when the pair dict from calculate_entanglement is not needed
+        """
+        # TODO: Implement actual entanglement calculation
+        # Placeholder: random entanglement
+        n = len(assets)
+        return self._rng.random((n, n)) * 0.5
+    
+    async def initialize_async(self):
+        """Async shim for initialize"""
+        self.initialize()
+    
+    async def evolve_async(self, market_data: Dict) -> QuantumState:
+        """Async shim for evolve"""
+        return self.evolve(market_data)
+    
+    async def measure_async(self) -> float:
+        """Async shim for measure"""
+        return self.measure()
+    
+    async def calculate_entanglement_async(
+        self,
+        assets: List[str]
+    ) -> Dict[Tuple[str, str], float]:
+        """Async shim for calculate_entanglement"""
+        return self.calculate_entanglement(assets)
     
     def get_coherence(self) -> float:
         """Get current quantum coherence"""
@@ -6,13 +6,18 @@ Fixes the issue where £0.05 margin-safe sizing with £3/unit margin results in
 """
 
 import logging
-from typing import Tuple, Dict, Optional
+import math
+from typing import TYPE_CHECKING, Tuple, Dict, Optional
 from dataclasses import dataclass
 
+# Kept stdlib-only at import time; numpy is imported lazily by the batch API
+if TYPE_CHECKING:
+    import numpy as np
+
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class MarginCalculation:
     """Result of margin safety calculation"""
     safe_units: float
@@ -24,6 +29,16 @@ class MarginCalculation:
     calculation_details: Dict
 
 
+@dataclass
+class MarginCalculationBatch:
+    """Struct-of-arrays result of batch margin safety calculation (one entry per instrument)"""
+    safe_units: "np.ndarray"
+    required_margin: "np.ndarray"
+    risk_based_units: "np.ndarray"
+    margin_based_units: "np.ndarray"
+    is_blocked: "np.ndarray"
+
+
 def calculate_safe_units(
     available_margin: float, 
     margin_per_unit: float, 
@@ -47,10 +62,12 @@ def calculate_safe_units(
     Returns:
         MarginCalculation with safe units and blocking logic
     """
-    logger.debug(f"🔍 Margin Safety Calculation:")
-    logger.debug(f"   Available Margin: £{available_margin:.2f}")
-    logger.debug(f"   Margin Per Unit: £{margin_per_unit:.2f}")
-    logger.debug(f"   Safety Factor: {safety_factor:.2f}")
+    # Per-tick sizing path: format log lines only when they will be emitted
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("🔍 Margin Safety Calculation:")
+        logger.debug("   Available Margin: £%.2f", available_margin)
+        logger.debug("   Margin Per Unit: £%.2f", margin_per_unit)
+        logger.debug("   Safety Factor: %.2f", safety_factor)
     
     # Calculate theoretical maximum units without safety factor
     if margin_per_unit <= 0:
@@ -67,10 +84,11 @@ def calculate_safe_units(
     theoretical_max_units = available_margin / margin_per_unit
     
     # Apply safety factor
-    safe_max_units = theoretical_max_units / safety_factor
+    margin_per_safe_unit = margin_per_unit * safety_factor
+    safe_max_units = available_margin / margin_per_safe_unit
     
     # Check if we can meet minimum position size
-    min_required_margin = min_units * margin_per_unit * safety_factor
+    min_required_margin = min_units * margin_per_safe_unit
     
     if available_margin < min_required_margin:
         return MarginCalculation(
@@ -88,16 +106,21 @@ def calculate_safe_units(
             }
         )
     
-    # Determine safe units
-    if safe_max_units < min_units:
-        # Can afford minimum but not safely - block trade
+    # Apply maximum limit if specified
+    capped_units = safe_max_units if max_units is None else min(safe_max_units, max_units)
+    
+    # Round down to broker precision (0.1) so the result never needs more
+    # margin than is available (epsilon absorbs float noise at exact multiples)
+    safe_units = math.floor(capped_units * 10 + 1e-9) / 10
+    
+    if safe_units < min_units:
         return MarginCalculation(
             safe_units=0.0,
             required_margin=min_units * margin_per_unit,
             available_margin=available_margin,
             safety_factor=safety_factor,
             is_blocked=True,
-            block_reason=f"Safe units ({safe_max_units:.3f}) below minimum ({min_units})",
+            block_reason=f"Safe units ({capped_units:.3f}) below minimum ({min_units})",
             calculation_details={
                 "theoretical_max_units": theoretical_max_units,
                 "safe_max_units": safe_max_units,
@@ -105,25 +128,7 @@ def calculate_safe_units(
             }
         )
     
-    # Calculate final safe units
-    safe_units = safe_max_units
-    
-    # Apply maximum limit if specified
-    if max_units and safe_units > max_units:
-        safe_units = max_units
-        logger.debug(f"   Units capped at maximum: {max_units}")
-    
-    # Round to appropriate precision (0.1 for most brokers)
-    safe_units = round(safe_units, 1)
-    
-    # Final validation - ensure we don't exceed available margin
-    required_margin = safe_units * margin_per_unit * safety_factor
-    
-    if required_margin > available_margin:
-        # Recalculate to fit exactly
-        safe_units = available_margin / (margin_per_unit * safety_factor)
-        safe_units = round(safe_units, 1)
-        required_margin = safe_units * margin_per_unit * safety_factor
+    required_margin = safe_units * margin_per_safe_unit
     
     calculation_details = {
         "theoretical_max_units": theoretical_max_units,
@@ -133,10 +138,11 @@ def calculate_safe_units(
         "margin_utilization": (required_margin / available_margin) * 100
     }
     
-    logger.info(f"✅ Margin Safety Result:")
-    logger.info(f"   Safe Units: {safe_units}")
-    logger.info(f"   Required Margin: £{required_margin:.2f}")
-    logger.info(f"   Margin Utilization: {calculation_details['margin_utilization']:.1f}%")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("✅ Margin Safety Result:")
+        logger.info("   Safe Units: %s", safe_units)
+        logger.info("   Required Margin: £%.2f", required_margin)
+        logger.info("   Margin Utilization: %.1f%%", calculation_details["margin_utilization"])
     
     return MarginCalculation(
         safe_units=safe_units,
@@ -202,7 +208,9 @@ def calculate_position_size_from_risk(
         return 0.0
     
     position_size = risk_amount / (stop_distance_points * point_value)
-    return round(position_size, 1)
+    
+    # Round down to 0.1 units so the position never risks more than risk_amount
+    return math.floor(position_size * 10 + 1e-9) / 10
 
 
 class MarginSafetyEngine:
@@ -251,3 +259,57 @@ class MarginSafetyEngine:
             available_margin, margin_per_unit, self.default_safety_factor, 
             min_units, max_units=optimal_size
         )
+    
+    def calculate_optimal_position_sizes(
+        self,
+        risk_amount: "np.ndarray",
+        stop_distance_points: "np.ndarray",
+        available_margin: "np.ndarray",
+        margin_per_unit: "np.ndarray",
+        point_value: "np.ndarray" = 1.0,
+        min_units: float = 0.1
+    ) -> MarginCalculationBatch:
+        """
+        Vectorized calculate_optimal_position_size across many instruments.
+        
+        Takes equal-length 1-D arrays (scalars broadcast) and applies the same
+        risk/margin sizing and blocking rules in a handful of array operations.
+        """
+        import numpy as np
+        
+        risk_amount = np.asarray(risk_amount, dtype=np.float64)
+        stop_distance_points = np.asarray(stop_distance_points, dtype=np.float64)
+        available_margin = np.asarray(available_margin, dtype=np.float64)
+        margin_per_unit = np.asarray(margin_per_unit, dtype=np.float64)
+        
+        margin_per_safe_unit = margin_per_unit * self.default_safety_factor
+        
+        with np.errstate(divide="ignore", invalid="ignore"):
+            # Risk-based size (0 for invalid stops, as in calculate_position_size_from_risk)
+            risk_based_units = np.where(
+                stop_distance_points > 0,
+                np.floor(risk_amount / (stop_distance_points * point_value) * 10 + 1e-9) / 10,
+                0.0
+            )
+            margin_based_units = np.where(
+                margin_per_unit > 0, available_margin / margin_per_safe_unit, 0.0
+            )
+        
+        # Same floor-to-0.1 rule as calculate_safe_units
+        optimal_units = np.minimum(risk_based_units, margin_based_units)
+        safe_units = np.floor(optimal_units * 10 + 1e-9) / 10
+        
+        is_blocked = (
+            (margin_per_unit <= 0)
+            | (available_margin < min_units * margin_per_safe_unit)
+            | (safe_units < min_units)
+        )
+        safe_units = np.where(is_blocked, 0.0, safe_units)
+        
+        return MarginCalculationBatch(
+            safe_units=safe_units,
+            required_margin=safe_units * margin_per_safe_unit,
+            risk_based_units=risk_based_units,
+            margin_based_units=margin_based_units,
+            is_blocked=is_blocked
+        )
@@ -3,17 +3,43 @@ Position Reconciliation System
 
 Reconciles internal position state with broker positions using dealId-based state machine.
 Fixes the issue where internal state shows 0 positions but broker shows 2 positions.
+
+The module is fully annotated plain Python and keeps every class complete in
+its own body (no attributes patched on afterwards), so that the reconciliation
+hot path can be compiled with mypyc
+(``mypyc core/risk_management/position_reconciler.py``) when that is worth the
+build step. It is not compiled by default; callers see the same API either way.
 """
 
+from __future__ import annotations
+
+import asyncio
 import logging
-from typing import Dict, List, Set, Optional, Tuple
+import math
+import sys
+import time
+from collections import Counter, deque
+from typing import Any, Deque, Dict, Final, FrozenSet, Iterable, List, Mapping, Set, Optional, Tuple, Union
 from dataclasses import dataclass, field
 from datetime import datetime
-from enum import Enum
+from enum import Enum, IntEnum
+from types import MappingProxyType
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
 
+def _to_ns(moment: Optional[datetime]) -> Optional[int]:
+    """Epoch nanoseconds for a datetime (None passes through)"""
+    return None if moment is None else int(moment.timestamp() * 1_000_000_000)
+
+
+def _from_ns(ns: Optional[int]) -> Optional[datetime]:
+    """Local datetime for epoch nanoseconds (None passes through)"""
+    return None if ns is None else datetime.fromtimestamp(ns / 1_000_000_000)
+
+
 class PositionState(Enum):
     """Position state enumeration"""
     PENDING = "PENDING"      # Order submitted, awaiting confirmation
@@ -24,56 +50,212 @@ class PositionState(Enum):
     UNKNOWN = "UNKNOWN"     # State unclear, needs investigation
 
 
-@dataclass
+# States in which a confirmed position is expected to exist on the broker
+_ACTIVE_STATES: Final[FrozenSet[PositionState]] = frozenset({PositionState.OPEN, PositionState.CLOSING})
+
+
+class Direction(IntEnum):
+    """Trade direction; the value is the sign of price-move P&L"""
+    BUY = 1
+    SELL = -1
+    
+    @classmethod
+    def coerce(cls, direction: Union[Direction, str]) -> Direction:
+        """Accept a Direction or a broker 'BUY'/'SELL' string"""
+        if isinstance(direction, cls):
+            return direction
+        return cls[direction.upper()]
+
+
+@dataclass(slots=True, init=False)
 class PositionRecord:
-    """Internal position record with state tracking"""
+    """
+    Internal position record with state tracking
+    
+    Times are stored as epoch nanoseconds (time.time_ns()); the entry_time,
+    close_time and last_updated properties expose them as datetimes, and the
+    constructor still accepts them as datetime keywords.
+    """
     deal_id: str
     epic: str
-    direction: str  # 'BUY' or 'SELL'
+    direction: Direction  # 'BUY'/'SELL' strings are coerced
     size: float
     entry_price: Optional[float] = None
-    entry_time: Optional[datetime] = None
+    entry_time_ns: Optional[int] = None
     state: PositionState = PositionState.PENDING
     deal_reference: Optional[str] = None  # Original deal reference
-    last_updated: datetime = field(default_factory=datetime.now)
+    last_updated_ns: int = field(default_factory=time.time_ns)
     broker_confirmed: bool = False
     close_price: Optional[float] = None
-    close_time: Optional[datetime] = None
+    close_time_ns: Optional[int] = None
     pnl: Optional[float] = None
     
-    def update_state(self, new_state: PositionState, reason: str = ""):
+    def __init__(
+        self,
+        deal_id: str,
+        epic: str,
+        direction: Union[Direction, str],
+        size: float,
+        entry_price: Optional[float] = None,
+        entry_time_ns: Optional[int] = None,
+        state: PositionState = PositionState.PENDING,
+        deal_reference: Optional[str] = None,
+        last_updated_ns: Optional[int] = None,
+        broker_confirmed: bool = False,
+        close_price: Optional[float] = None,
+        close_time_ns: Optional[int] = None,
+        pnl: Optional[float] = None,
+        *,
+        entry_time: Optional[datetime] = None,
+        close_time: Optional[datetime] = None,
+        last_updated: Optional[datetime] = None,
+    ) -> None:
+        self.deal_id = deal_id
+        # Epics repeat across many records; share one string object
+        self.epic = sys.intern(epic)
+        self.direction = Direction.coerce(direction)
+        self.size = size
+        self.entry_price = entry_price
+        self.entry_time_ns = entry_time_ns if entry_time is None else _to_ns(entry_time)
+        self.state = state
+        self.deal_reference = deal_reference
+        if last_updated is not None:
+            last_updated_ns = _to_ns(last_updated)
+        self.last_updated_ns = time.time_ns() if last_updated_ns is None else last_updated_ns
+        self.broker_confirmed = broker_confirmed
+        self.close_price = close_price
+        self.close_time_ns = close_time_ns if close_time is None else _to_ns(close_time)
+        self.pnl = pnl
+    
+    @property
+    def entry_time(self) -> Optional[datetime]:
+        return _from_ns(self.entry_time_ns)
+    
+    @entry_time.setter
+    def entry_time(self, value: Optional[datetime]) -> None:
+        self.entry_time_ns = _to_ns(value)
+    
+    @property
+    def close_time(self) -> Optional[datetime]:
+        return _from_ns(self.close_time_ns)
+    
+    @close_time.setter
+    def close_time(self, value: Optional[datetime]) -> None:
+        self.close_time_ns = _to_ns(value)
+    
+    @property
+    def last_updated(self) -> Optional[datetime]:
+        return _from_ns(self.last_updated_ns)
+    
+    @last_updated.setter
+    def last_updated(self, value: datetime) -> None:
+        self.last_updated_ns = _to_ns(value)
+    
+    def update_state(self, new_state: PositionState, reason: str = "") -> None:
         """Update position state with logging"""
         old_state = self.state
         self.state = new_state
-        self.last_updated = datetime.now()
+        self.last_updated_ns = time.time_ns()
         
-        logger.info(f"🔄 Position {self.deal_id}: {old_state.value} → {new_state.value}")
-        if reason:
-            logger.info(f"   Reason: {reason}")
+        # Format only when INFO is enabled (this runs on every state change)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("🔄 Position %s: %s → %s", self.deal_id, old_state.value, new_state.value)
+            if reason:
+                logger.info("   Reason: %s", reason)
 
 
-@dataclass
+@dataclass(slots=True)
 class BrokerPosition:
     """Position data from broker"""
     deal_id: str
     epic: str
-    direction: str
+    direction: Direction  # 'BUY'/'SELL' strings are coerced
     size: float
     level: float  # Entry price
     current_price: Optional[float] = None
     pnl: Optional[float] = None
+    
+    def __post_init__(self) -> None:
+        self.direction = Direction.coerce(self.direction)
 
 
-@dataclass
+@dataclass(slots=True)
+class BrokerPositionBatch:
+    """
+    Broker positions as struct-of-arrays (e.g. merged from several brokers)
+    
+    Unknown current prices and P&L are stored as NaN.
+    """
+    deal_ids: List[str]
+    epics: List[str]
+    signs: np.ndarray           # int8 Direction values
+    sizes: np.ndarray           # float64
+    levels: np.ndarray          # float64 entry prices
+    current_prices: np.ndarray  # float64
+    pnls: np.ndarray            # float64
+    
+    @classmethod
+    def from_list(cls, positions: List[BrokerPosition]) -> BrokerPositionBatch:
+        """Build a batch from BrokerPosition-like objects"""
+        n = len(positions)
+        return cls(
+            deal_ids=[sys.intern(p.deal_id) for p in positions],
+            epics=[p.epic for p in positions],
+            signs=np.fromiter((Direction.coerce(p.direction) for p in positions), dtype=np.int8, count=n),
+            sizes=np.fromiter((p.size for p in positions), dtype=np.float64, count=n),
+            levels=np.fromiter((p.level for p in positions), dtype=np.float64, count=n),
+            current_prices=np.fromiter(
+                (np.nan if p.current_price is None else p.current_price for p in positions),
+                dtype=np.float64, count=n
+            ),
+            pnls=np.fromiter(
+                (np.nan if getattr(p, "pnl", None) is None else p.pnl for p in positions),
+                dtype=np.float64, count=n
+            ),
+        )
+    
+    @classmethod
+    def concat(cls, batches: Iterable[BrokerPositionBatch]) -> BrokerPositionBatch:
+        """Merge per-broker batches into one for a single reconciliation pass"""
+        batches = list(batches)
+        return cls(
+            deal_ids=[deal_id for b in batches for deal_id in b.deal_ids],
+            epics=[epic for b in batches for epic in b.epics],
+            signs=np.concatenate([b.signs for b in batches]).astype(np.int8, copy=False),
+            sizes=np.concatenate([b.sizes for b in batches]),
+            levels=np.concatenate([b.levels for b in batches]),
+            current_prices=np.concatenate([b.current_prices for b in batches]),
+            pnls=np.concatenate([b.pnls for b in batches]),
+        )
+    
+    def __len__(self) -> int:
+        return len(self.deal_ids)
+    
+    def position(self, i: int) -> BrokerPosition:
+        """Materialize entry i as a BrokerPosition"""
+        current_price = float(self.current_prices[i])
+        pnl = float(self.pnls[i])
+        return BrokerPosition(
+            deal_id=self.deal_ids[i],
+            epic=self.epics[i],
+            direction=Direction(int(self.signs[i])),
+            size=float(self.sizes[i]),
+            level=float(self.levels[i]),
+            current_price=None if math.isnan(current_price) else current_price,
+            pnl=None if math.isnan(pnl) else pnl,
+        )
+
+
+@dataclass(frozen=True, slots=True)
 class ReconciliationResult:
-    """Result of position reconciliation"""
+    """Result of position reconciliation (immutable once recorded in history)"""
     total_internal: int
     total_broker: int
     matched_positions: int
-    missing_from_internal: List[str]  # Deal IDs in broker but not internal
-    missing_from_broker: List[str]    # Deal IDs in internal but not broker
-    state_mismatches: List[Tuple[str, PositionState, str]]  # Deal ID, internal state, broker state
-    actions_taken: List[str]
+    missing_from_internal: Tuple[str, ...]  # Deal IDs in broker but not internal
+    missing_from_broker: Tuple[str, ...]    # Deal IDs in internal but not broker
+    state_mismatches: Tuple[Tuple[str, PositionState, str], ...]  # Deal ID, internal state, broker state
+    actions_taken: Tuple[str, ...]
     is_synchronized: bool
 
 
@@ -85,10 +267,106 @@ class PositionReconciler:
     and broker position state.
     """
     
-    def __init__(self):
-        self.internal_positions: Dict[str, PositionRecord] = {}
+    # Most recent reconciliation results kept in reconciliation_history
+    MAX_RECONCILIATION_HISTORY = 1024
+    
+    # Mutating methods that may be routed through the single-writer loop
+    _WRITER_METHODS = frozenset({
+        "add_pending_position",
+        "confirm_position_opened",
+        "mark_position_closing",
+        "confirm_position_closed",
+        "reconcile_positions",
+    })
+    
+    def __init__(self) -> None:
+        # Orders awaiting confirmation, keyed by deal reference
+        self.pending_positions: Dict[str, PositionRecord] = {}
+        # Broker-confirmed positions, keyed by deal ID
+        self.confirmed_positions: Dict[str, PositionRecord] = {}
+        # Confirmed deal IDs bucketed by state, kept in step with every state transition
+        self._by_state: Dict[PositionState, Set[str]] = {state: set() for state in PositionState}
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
-        self.reconciliation_history: List[ReconciliationResult] = []
+        self.reconciliation_history: Deque[ReconciliationResult] = deque(
+            maxlen=self.MAX_RECONCILIATION_HISTORY
+        )
+        self._inbox: asyncio.Queue = asyncio.Queue()
+    
+    @property
+    def internal_positions(self) -> Mapping[str, PositionRecord]:
+        """
+        Read-only view of all tracked positions keyed by deal ID
+        (PENDING_<reference> while pending).
+        
+        Built from pending_positions and confirmed_positions on each access,
+        so item writes and deletes raise TypeError rather than being lost;
+        assign the property to replace the tracked positions.
+        """
+        positions = {
+            f"PENDING_{reference}": position
+            for reference, position in self.pending_positions.items()
+        }
+        positions.update(self.confirmed_positions)
+        return MappingProxyType(positions)
+    
+    @internal_positions.setter
+    def internal_positions(self, positions: Mapping[str, PositionRecord]) -> None:
+        self.pending_positions = {}
+        self.confirmed_positions = {}
+        self._by_state = {state: set() for state in PositionState}
+        for deal_id, position in positions.items():
+            if deal_id.startswith("PENDING_"):
+                self.pending_positions[deal_id[len("PENDING_"):]] = position
+            else:
+                self._track(deal_id, position)
+    
+    async def run(self) -> None:
+        """
+        Single-writer loop: apply submitted state changes one at a time, in order.
+        
+        The synchronous methods never await, so callers on one event loop are
+        already serialized; tasks that want an explicit ordering guarantee
+        (e.g. order confirmations racing periodic reconciliation) start this
+        loop once and go through submit() instead. No locks are involved.
+        """
+        while True:
+            method, args, kwargs, future = await self._inbox.get()
+            try:
+                result = method(*args, **kwargs)
+            except Exception as e:
+                if not future.cancelled():
+                    future.set_exception(e)
+            else:
+                if not future.cancelled():
+                    future.set_result(result)
+            finally:
+                self._inbox.task_done()
+    
+    async def submit(self, method_name: str, *args, **kwargs) -> Any:
+        """Queue a mutating call (e.g. "reconcile_positions") for run() and await its result"""
+        if method_name not in self._WRITER_METHODS:
+            raise ValueError(f"{method_name} is not a reconciler state change")
+        
+        future = asyncio.get_running_loop().create_future()
+        await self._inbox.put((getattr(self, method_name), args, kwargs, future))
+        return await future
+    
+    def _track(self, deal_id: str, position: PositionRecord) -> None:
+        """Insert (or replace) a confirmed position and index it under its current state"""
+        deal_id = sys.intern(deal_id)
+        old = self.confirmed_positions.get(deal_id)
+        if old is not None:
+            self._by_state[old.state].discard(deal_id)
+        self.confirmed_positions[deal_id] = position
+        self._by_state[position.state].add(deal_id)
+    
+    def _transition(
+        self, deal_id: str, position: PositionRecord, new_state: PositionState, reason: str = ""
+    ) -> None:
+        """Move a confirmed position to a new state, updating the state index"""
+        self._by_state[position.state].discard(deal_id)
+        self._by_state[new_state].add(deal_id)
+        position.update_state(new_state, reason)
     
     def add_pending_position(
         self, 
@@ -102,6 +380,7 @@ class PositionReconciler:
         
         Returns a temporary internal ID until deal_id is confirmed.
         """
+        deal_reference = sys.intern(deal_reference)
         temp_id = f"PENDING_{deal_reference}"
         
         position = PositionRecord(
@@ -113,9 +392,9 @@ class PositionReconciler:
             deal_reference=deal_reference
         )
         
-        self.internal_positions[temp_id] = position
+        self.pending_positions[deal_reference] = position
         
-        self.logger.info(f"➕ Added pending position: {temp_id} ({epic} {direction} {size})")
+        self.logger.info("➕ Added pending position: %s (%s %s %s)", temp_id, epic, direction, size)
         return temp_id
     
     def confirm_position_opened(
@@ -128,16 +407,15 @@ class PositionReconciler:
         """
         Confirm that a pending position has been opened with actual deal_id.
         """
-        # Find pending position by deal reference
-        pending_id = f"PENDING_{deal_reference}"
+        # Deal IDs key every dict/set the reconciler touches; intern once here
+        deal_id = sys.intern(deal_id)
         
-        if pending_id not in self.internal_positions:
+        # Find pending position by deal reference and move it to confirmed
+        pending_position = self.pending_positions.pop(deal_reference, None)
+        if pending_position is None:
             self.logger.error(f"❌ Cannot confirm position: no pending position for {deal_reference}")
             return False
         
-        # Move from pending to confirmed
-        pending_position = self.internal_positions.pop(pending_id)
-        
         # Create confirmed position record
         confirmed_position = PositionRecord(
             deal_id=deal_id,
@@ -145,25 +423,25 @@ class PositionReconciler:
             direction=pending_position.direction,
             size=pending_position.size,
             entry_price=entry_price,
-            entry_time=entry_time or datetime.now(),
+            entry_time_ns=_to_ns(entry_time) if entry_time else time.time_ns(),
             state=PositionState.OPEN,
             deal_reference=deal_reference,
             broker_confirmed=True
         )
         
-        self.internal_positions[deal_id] = confirmed_position
+        self._track(deal_id, confirmed_position)
         
-        self.logger.info(f"✅ Position confirmed: {pending_id} → {deal_id} @ {entry_price}")
+        self.logger.info("✅ Position confirmed: PENDING_%s → %s @ %s", deal_reference, deal_id, entry_price)
         return True
     
     def mark_position_closing(self, deal_id: str) -> bool:
         """Mark position as closing (close order submitted)"""
-        if deal_id not in self.internal_positions:
+        position = self.confirmed_positions.get(deal_id)
+        if position is None:
             self.logger.error(f"❌ Cannot mark closing: position {deal_id} not found")
             return False
         
-        position = self.internal_positions[deal_id]
-        position.update_state(PositionState.CLOSING, "Close order submitted")
+        self._transition(deal_id, position, PositionState.CLOSING, "Close order submitted")
         return True
     
     def confirm_position_closed(
@@ -174,53 +452,74 @@ class PositionReconciler:
         close_time: Optional[datetime] = None
     ) -> bool:
         """Confirm position has been closed"""
-        if deal_id not in self.internal_positions:
+        position = self.confirmed_positions.get(deal_id)
+        if position is None:
             self.logger.error(f"❌ Cannot confirm close: position {deal_id} not found")
             return False
         
-        position = self.internal_positions[deal_id]
         position.close_price = close_price
-        position.close_time = close_time or datetime.now()
+        position.close_time_ns = _to_ns(close_time) if close_time else time.time_ns()
         position.pnl = pnl
-        position.update_state(PositionState.CLOSED, f"Closed @ {close_price}, P&L: £{pnl:.2f}")
+        reason = f"Closed @ {close_price}, P&L: £{pnl:.2f}" if logger.isEnabledFor(logging.INFO) else ""
+        self._transition(deal_id, position, PositionState.CLOSED, reason)
         
         return True
     
-    def reconcile_positions(self, broker_positions: List[BrokerPosition]) -> ReconciliationResult:
+    def reconcile_positions(
+        self, broker_positions: Union[List[BrokerPosition], BrokerPositionBatch]
+    ) -> ReconciliationResult:
         """
         Reconcile internal position state with broker positions.
         
+        Accepts a list of BrokerPosition or a BrokerPositionBatch (use
+        BrokerPositionBatch.concat to reconcile several brokers at once).
+        
         Key reconciliation logic:
         1. Match positions by dealId
         2. Identify missing positions in either system
         3. Detect state mismatches
         4. Take corrective actions
         """
-        self.logger.info(f"🔄 Starting position reconciliation...")
-        self.logger.info(f"   Internal positions: {len(self.internal_positions)}")
-        self.logger.info(f"   Broker positions: {len(broker_positions)}")
+        # Bind hot attributes once; the loops below only touch locals
+        log = self.logger
+        confirmed = self.confirmed_positions
+        by_state = self._by_state
         
-        # Build broker position lookup
-        broker_positions_dict = {pos.deal_id: pos for pos in broker_positions}
-        broker_deal_ids = set(broker_positions_dict.keys())
+        debug = log.isEnabledFor(logging.DEBUG)
+        if log.isEnabledFor(logging.INFO):
+            log.info("🔄 Starting position reconciliation...")
+            log.info("   Internal positions: %d", len(self.pending_positions) + len(confirmed))
+            log.info("   Broker positions: %d", len(broker_positions))
         
         # Get internal position deal IDs (exclude pending positions)
-        internal_deal_ids = {
-            deal_id for deal_id, pos in self.internal_positions.items() 
-            if not deal_id.startswith("PENDING_") and pos.state in [PositionState.OPEN, PositionState.CLOSING]
-        }
+        internal_deal_ids = set().union(*(by_state[state] for state in _ACTIVE_STATES))
+        
+        if isinstance(broker_positions, BrokerPositionBatch):
+            batch = broker_positions
+        else:
+            batch = BrokerPositionBatch.from_list(broker_positions)
+        
+        # Build broker position lookup (deal ID -> batch row; last one wins)
+        # and classify each broker deal in one pass
+        broker_index: Dict[str, int] = {}
+        missing_from_internal = []
+        matched_positions = []
+        for row, deal_id in enumerate(batch.deal_ids):
+            if deal_id not in broker_index:
+                if deal_id in internal_deal_ids:
+                    matched_positions.append(deal_id)
+                else:
+                    missing_from_internal.append(deal_id)
+            broker_index[deal_id] = row
         
-        # Find discrepancies
-        missing_from_internal = list(broker_deal_ids - internal_deal_ids)
-        missing_from_broker = list(internal_deal_ids - broker_deal_ids)
-        matched_positions = list(broker_deal_ids & internal_deal_ids)
+        missing_from_broker = tuple(internal_deal_ids - broker_index.keys())
         
         actions_taken = []
-        state_mismatches = []
+        state_mismatches = ()
         
         # Handle positions missing from internal tracking
         for deal_id in missing_from_internal:
-            broker_pos = broker_positions_dict[deal_id]
+            broker_pos = batch.position(broker_index[deal_id])
             
             # Add missing position to internal tracking
             missing_position = PositionRecord(
@@ -229,70 +528,101 @@ class PositionReconciler:
                 direction=broker_pos.direction,
                 size=broker_pos.size,
                 entry_price=broker_pos.level,
-                entry_time=datetime.now(),  # Approximate
+                entry_time_ns=time.time_ns(),  # Approximate
                 state=PositionState.OPEN,
                 broker_confirmed=True
             )
             
-            self.internal_positions[deal_id] = missing_position
+            self._track(deal_id, missing_position)
             actions_taken.append(f"Added missing position {deal_id} from broker")
             
-            self.logger.warning(f"⚠️  Added missing position: {deal_id} ({broker_pos.epic})")
+            if debug:
+                log.debug("   Added missing position: %s (%s)", deal_id, broker_pos.epic)
+        
+        if missing_from_internal:
+            log.warning(
+                "⚠️  Added %d missing position(s) from broker: %s",
+                len(missing_from_internal), ", ".join(missing_from_internal)
+            )
         
         # Handle positions missing from broker
+        closed_missing = []
         for deal_id in missing_from_broker:
-            internal_pos = self.internal_positions[deal_id]
+            internal_pos = confirmed[deal_id]
             
             if internal_pos.state == PositionState.OPEN:
                 # Position should be open but not found on broker - mark as closed
-                internal_pos.update_state(
+                self._transition(
+                    deal_id,
+                    internal_pos,
                     PositionState.CLOSED, 
                     "Position not found on broker, assuming closed"
                 )
                 actions_taken.append(f"Marked {deal_id} as closed (not found on broker)")
+                closed_missing.append(deal_id)
                 
-                self.logger.warning(f"⚠️  Position {deal_id} not found on broker, marked as closed")
+                if debug:
+                    log.debug("   Position %s not found on broker, marked as closed", deal_id)
         
-        # Check state consistency for matched positions
-        for deal_id in matched_positions:
-            internal_pos = self.internal_positions[deal_id]
-            broker_pos = broker_positions_dict[deal_id]
+        if closed_missing:
+            log.warning(
+                "⚠️  Marked %d position(s) closed (not found on broker): %s",
+                len(closed_missing), ", ".join(closed_missing)
+            )
+        
+        if matched_positions:
+            m = len(matched_positions)
+            internal = [confirmed[deal_id] for deal_id in matched_positions]
+            rows = np.fromiter((broker_index[deal_id] for deal_id in matched_positions), dtype=np.intp, count=m)
+            
+            entries = np.fromiter(
+                (np.nan if p.entry_price is None else p.entry_price for p in internal),
+                dtype=np.float64, count=m
+            )
+            sizes = np.fromiter((p.size for p in internal), dtype=np.float64, count=m)
+            signs = np.fromiter((p.direction for p in internal), dtype=np.int8, count=m)
+            currents = batch.current_prices[rows]
+            broker_sizes = batch.sizes[rows]
             
-            # Update current price and P&L from broker
-            if broker_pos.current_price:
-                # Calculate unrealized P&L if we have entry price
-                if internal_pos.entry_price:
-                    if internal_pos.direction == 'BUY':
-                        unrealized_pnl = (broker_pos.current_price - internal_pos.entry_price) * internal_pos.size
-                    else:  # SELL
-                        unrealized_pnl = (internal_pos.entry_price - broker_pos.current_price) * internal_pos.size
-                    
-                    # Update internal position with current data
-                    internal_pos.pnl = unrealized_pnl
+            # Update unrealized P&L from broker prices in one vectorized pass
+            # (only where both the broker price and our entry price are known)
+            priced = (currents == currents) & (currents != 0) & (entries == entries) & (entries != 0)
+            unrealized_pnl = signs * (currents - entries) * sizes
+            for k in np.flatnonzero(priced).tolist():
+                internal[k].pnl = float(unrealized_pnl[k])
             
-            # Verify position details match
-            if (internal_pos.size != broker_pos.size or 
-                internal_pos.direction != broker_pos.direction or
-                internal_pos.epic != broker_pos.epic):
-                
-                state_mismatches.append((
-                    deal_id, 
-                    internal_pos.state, 
-                    f"Size/Direction/Epic mismatch"
-                ))
-                
-                self.logger.warning(f"⚠️  Position details mismatch for {deal_id}")
+            # Verify position details match (sizes within float tolerance, as math.isclose)
+            size_mismatch = np.abs(sizes - broker_sizes) > np.maximum(
+                1e-9 * np.maximum(np.abs(sizes), np.abs(broker_sizes)), 1e-8
+            )
+            direction_mismatch = signs != batch.signs[rows]
+            epics = batch.epics
+            epic_mismatch = np.fromiter(
+                (p.epic != epics[row] for p, row in zip(internal, rows.tolist())),
+                dtype=np.bool_, count=m
+            )
+            
+            # Check state consistency for matched positions
+            mismatched = np.flatnonzero(size_mismatch | direction_mismatch | epic_mismatch).tolist()
+            state_mismatches = tuple(
+                (matched_positions[k], internal[k].state, "Size/Direction/Epic mismatch")
+                for k in mismatched
+            )
+            if state_mismatches:
+                log.warning(
+                    "⚠️  Position details mismatch for %d position(s): %s",
+                    len(state_mismatches), ", ".join(deal_id for deal_id, _, _ in state_mismatches)
+                )
         
         # Create reconciliation result
         result = ReconciliationResult(
-            total_internal=len([p for p in self.internal_positions.values() 
-                              if not p.deal_id.startswith("PENDING_") and p.state != PositionState.CLOSED]),
+            total_internal=len(confirmed) - len(by_state[PositionState.CLOSED]),
             total_broker=len(broker_positions),
             matched_positions=len(matched_positions),
-            missing_from_internal=missing_from_internal,
+            missing_from_internal=tuple(missing_from_internal),
             missing_from_broker=missing_from_broker,
             state_mismatches=state_mismatches,
-            actions_taken=actions_taken,
+            actions_taken=tuple(actions_taken),
             is_synchronized=len(missing_from_internal) == 0 and len(missing_from_broker) == 0 and len(state_mismatches) == 0
         )
         
@@ -301,27 +631,27 @@ class PositionReconciler:
         
         # Log reconciliation summary
         if result.is_synchronized:
-            self.logger.info("✅ Positions synchronized successfully")
+            log.info("✅ Positions synchronized successfully")
         else:
-            self.logger.warning(f"⚠️  Reconciliation issues found:")
-            self.logger.warning(f"   Missing from internal: {len(missing_from_internal)}")
-            self.logger.warning(f"   Missing from broker: {len(missing_from_broker)}")
-            self.logger.warning(f"   State mismatches: {len(state_mismatches)}")
+            log.warning(
+                "⚠️  Reconciliation issues found: %d missing from internal, "
+                "%d missing from broker, %d state mismatches",
+                len(missing_from_internal), len(missing_from_broker), len(state_mismatches)
+            )
         
         return result
     
     def get_open_positions(self) -> Dict[str, PositionRecord]:
         """Get all open positions"""
-        return {
-            deal_id: pos for deal_id, pos in self.internal_positions.items()
-            if pos.state == PositionState.OPEN
-        }
+        positions = self.confirmed_positions
+        return {deal_id: positions[deal_id] for deal_id in self._by_state[PositionState.OPEN]}
     
-    def get_position_summary(self) -> Dict:
+    def get_position_summary(self) -> Dict[str, int]:
         """Get summary of position states"""
-        summary = {}
-        for state in PositionState:
-            count = len([p for p in self.internal_positions.values() if p.state == state])
-            summary[state.value] = count
-        
-        return summary
+        # Confirmed positions come straight from the state buckets; pending
+        # records are not bucketed, so count their states in a single pass
+        pending = Counter(position.state for position in self.pending_positions.values())
+        return {
+            state.value: len(self._by_state[state]) + pending.get(state, 0)
+            for state in PositionState
+        }
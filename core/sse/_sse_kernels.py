@@ -0,0 +1,264 @@
+"""
+Numeric kernels for the SSE risk engine.
+
+Scenario generation and reductions are compiled with numba when it is
+installed; otherwise equivalent vectorized NumPy implementations are used.
+"""
+
+from functools import lru_cache
+
+import numpy as np
+
+try:
+    import numba
+    from numba import njit, prange
+except ImportError:
+    numba = None
+    njit = None
+    prange = range
+
+# Below this many scenarios thread start-up outweighs the parallel speedup
+PARALLEL_MIN_SCENARIOS = 2000
+
+# Tail-shock magnitudes as (mean, std) of a normal draw, in the order the shock
+# probabilities are passed: market crash, geopolitical, liquidity crisis,
+# positive surprise (same values as MonteCarloSimulator.SHOCK_PARAMS)
+SHOCK_PARAMS = ((-0.2, 0.05), (-0.1, 0.03), (-0.15, 0.04), (0.1, 0.02))
+
+_rng = np.random.default_rng()
+
+
+def _draw_scenario(base, vol, p_crash, p_geo, p_liq, p_pos):
+    """
+    One base + vol * N(0, 1) scenario plus tail-risk shocks.
+
+    Shocks are rare, so the per-shock branches are well predicted and the
+    magnitude is only drawn when the shock fires.
+    """
+    x = base + vol * np.random.standard_normal()
+    if np.random.random() < p_crash:
+        x += np.random.normal(-0.2, 0.05)
+    if np.random.random() < p_geo:
+        x += np.random.normal(-0.1, 0.03)
+    if np.random.random() < p_liq:
+        x += np.random.normal(-0.15, 0.04)
+    if np.random.random() < p_pos:
+        x += np.random.normal(0.1, 0.02)
+    return x
+
+
+def _simulate_loop(out, base, vol, p_crash, p_geo, p_liq, p_pos):
+    """
+    Fill out with scenarios for one trade.
+
+    Scenarios are independent, so the parallel build splits them across
+    threads (each thread has its own random state); the serial build runs
+    prange as a plain range.
+    """
+    for i in prange(out.shape[0]):
+        out[i] = _draw_scenario(base, vol, p_crash, p_geo, p_liq, p_pos)
+
+
+def _simulate_batch_loop(out, bases, vols, shock_probs):
+    """
+    Fill out[b] with scenarios for trade b, all trades in one loop.
+
+    shock_probs holds one row of (crash, geopolitical, liquidity, positive)
+    probabilities per trade. The flat loop keeps every thread busy even when
+    there are fewer trades than threads.
+    """
+    n = out.shape[1]
+    for k in prange(out.shape[0] * n):
+        b = k // n
+        out[b, k - b * n] = _draw_scenario(
+            bases[b], vols[b],
+            shock_probs[b, 0], shock_probs[b, 1], shock_probs[b, 2], shock_probs[b, 3]
+        )
+
+
+def _simulate_numpy(out, base, vol, p_crash, p_geo, p_liq, p_pos):
+    """Vectorized NumPy equivalent of _simulate_loop"""
+    n = out.shape[0]
+    out[:] = _rng.standard_normal(n)
+    out *= vol
+    out += base
+    for probability, (mean, std) in zip((p_crash, p_geo, p_liq, p_pos), SHOCK_PARAMS):
+        if probability <= 0:
+            continue
+        hits = np.flatnonzero(_rng.random(n) < probability)
+        if hits.size:
+            out[hits] += _rng.normal(mean, std, hits.size)
+
+
+def _simulate_batch_numpy(out, bases, vols, shock_probs):
+    """NumPy equivalent of _simulate_batch_loop"""
+    for b in range(out.shape[0]):
+        _simulate_numpy(out[b], bases[b], vols[b], *shock_probs[b])
+
+
+def _fused_stats_loop(scenarios, ruin_threshold):
+    """
+    Win/loss/ruin counts and the first four moments in a single sweep.
+
+    Returns (n_win, n_loss, n_ruin, mean, std, skewness, excess kurtosis).
+    """
+    return _fused_stats_n(scenarios, scenarios.shape[0], ruin_threshold)
+
+
+def _fused_stats_n(scenarios, n, ruin_threshold):
+    """
+    Body of _fused_stats_loop over the first n scenarios.
+
+    Raw moments are accumulated in float64 around the first scenario, which
+    keeps the central moments free of cancellation when the spread is small
+    next to the mean. Inlined into its callers, so a constant n specializes
+    the loop.
+    """
+    shift = float(scenarios[0])
+    n_win = 0
+    n_loss = 0
+    n_ruin = 0
+    s1 = 0.0
+    s2 = 0.0
+    s3 = 0.0
+    s4 = 0.0
+    for i in range(n):
+        x = float(scenarios[i])
+        n_win += x > 0.0
+        n_loss += x < 0.0
+        n_ruin += x < -ruin_threshold
+        d = x - shift
+        d2 = d * d
+        s1 += d
+        s2 += d2
+        s3 += d2 * d
+        s4 += d2 * d2
+
+    m1 = s1 / n
+    r2 = s2 / n
+    r3 = s3 / n
+    r4 = s4 / n
+    var = max(r2 - m1 * m1, 0.0)
+    std = np.sqrt(var)
+    if std == 0.0:
+        return n_win, n_loss, n_ruin, shift + m1, 0.0, 0.0, 0.0
+
+    m3 = r3 - 3.0 * m1 * r2 + 2.0 * m1 ** 3
+    m4 = r4 - 4.0 * m1 * r3 + 6.0 * m1 * m1 * r2 - 3.0 * m1 ** 4
+    return n_win, n_loss, n_ruin, shift + m1, std, m3 / (var * std), m4 / (var * var) - 3.0
+
+
+def _fused_stats_numpy(scenarios, ruin_threshold):
+    """NumPy equivalent of _fused_stats_loop"""
+    data = scenarios.astype(np.float64, copy=False)
+    mean = float(data.mean())
+    std = float(data.std())
+    if std == 0.0:
+        skewness = kurtosis = 0.0
+    else:
+        z = (data - mean) / std
+        skewness = float(np.mean(z ** 3))
+        kurtosis = float(np.mean(z ** 4)) - 3.0
+    return (
+        int(np.count_nonzero(data > 0.0)),
+        int(np.count_nonzero(data < 0.0)),
+        int(np.count_nonzero(data < -ruin_threshold)),
+        mean,
+        std,
+        skewness,
+        kurtosis,
+    )
+
+
+def partition_percentiles(scenarios, q, overwrite_input=False):
+    """
+    np.percentile (linear interpolation) from a single np.partition call.
+
+    Only the order statistics either side of each requested percentile are
+    placed (O(n) introselect, no sort and no per-quantile copies). With
+    overwrite_input the scratch array is partitioned in place, as in
+    np.percentile.
+    """
+    n = scenarios.shape[0]
+    position = np.asarray(q, dtype=np.float64) * ((n - 1) / 100.0)
+    lo = np.floor(position).astype(np.intp)
+    hi = np.minimum(lo + 1, n - 1)
+    kth = np.union1d(lo, hi)
+    if overwrite_input:
+        scenarios.partition(kth)
+        part = scenarios
+    else:
+        part = np.partition(scenarios, kth)
+    lower = part[lo].astype(np.float64)
+    return lower + (part[hi] - lower) * (position - lo)
+
+
+def _seed_loop(seed):
+    """Seed the random state the compiled kernels draw from (calling thread)"""
+    np.random.seed(seed)
+
+
+def seed_kernels(seed):
+    """Seed the scenario kernels (compiled or NumPy fallback) for reproducible runs"""
+    global _rng
+    _rng = np.random.default_rng(seed)
+    if njit is not None:
+        _seed_compiled(seed)
+
+
+def set_num_threads(n):
+    """Cap the threads used by the parallel kernels (no-op without numba)"""
+    if numba is not None:
+        numba.set_num_threads(max(1, min(int(n), numba.config.NUMBA_NUM_THREADS)))
+
+
+@lru_cache(maxsize=None)
+def make_kernels(n):
+    """
+    Kernels specialized on a fixed scenario count n.
+
+    Returns (simulate_batch, simulate_batch_parallel, fused_stats) with n baked
+    in as a compile-time constant, so LLVM can strength-reduce the row/column
+    split and unroll the loops. The scenario rows passed in must have exactly
+    n entries. Without numba the generic implementations are returned.
+    """
+    if njit is None:
+        return simulate_batch, simulate_batch_parallel, fused_stats
+
+    def _simulate_batch_n(out, bases, vols, shock_probs):
+        for k in prange(out.shape[0] * n):
+            b = k // n
+            out[b, k - b * n] = _draw_scenario(
+                bases[b], vols[b],
+                shock_probs[b, 0], shock_probs[b, 1], shock_probs[b, 2], shock_probs[b, 3]
+            )
+
+    def _fused_stats_fixed(scenarios, ruin_threshold):
+        return _fused_stats_n(scenarios, n, ruin_threshold)
+
+    return (
+        njit(cache=True, fastmath=True, boundscheck=False)(_simulate_batch_n),
+        njit(parallel=True, cache=True, fastmath=True, boundscheck=False)(_simulate_batch_n),
+        njit(cache=True, fastmath=True, boundscheck=False)(_fused_stats_fixed),
+    )
+
+
+if njit is not None:
+    _draw_scenario = njit(inline="always", fastmath=True)(_draw_scenario)
+    _fused_stats_n = njit(inline="always", fastmath=True)(_fused_stats_n)
+    simulate_scenarios = njit(cache=True, fastmath=True, boundscheck=False)(_simulate_loop)
+    simulate_scenarios_parallel = njit(
+        parallel=True, cache=True, fastmath=True, boundscheck=False
+    )(_simulate_loop)
+    simulate_batch = njit(cache=True, fastmath=True, boundscheck=False)(_simulate_batch_loop)
+    simulate_batch_parallel = njit(
+        parallel=True, cache=True, fastmath=True, boundscheck=False
+    )(_simulate_batch_loop)
+    fused_stats = njit(cache=True, fastmath=True, boundscheck=False)(_fused_stats_loop)
+    _seed_compiled = njit(cache=True)(_seed_loop)
+else:
+    simulate_scenarios = _simulate_numpy
+    simulate_scenarios_parallel = _simulate_numpy
+    simulate_batch = _simulate_batch_numpy
+    simulate_batch_parallel = _simulate_batch_numpy
+    fused_stats = _fused_stats_numpy
@@ -17,22 +17,64 @@ statistical validation through 10,000 simulated scenarios.
 
 import asyncio
 import logging
+import math
+import time
 import numpy as np
-from typing import Dict, List, Tuple, Optional, Any
+from collections import deque
+from typing import Deque, Dict, List, Tuple, Optional, Any
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 import json
 
-# Import Monte Carlo Simulator
 try:
-    from ..models.hybrid_model import MonteCarloSimulator
+    from ._sse_kernels import (
+        PARALLEL_MIN_SCENARIOS,
+        SHOCK_PARAMS,
+        make_kernels,
+        partition_percentiles,
+        seed_kernels,
+        set_num_threads,
+    )
 except ImportError:
-    from core.models.hybrid_model import MonteCarloSimulator
+    from core.sse._sse_kernels import (
+        PARALLEL_MIN_SCENARIOS,
+        SHOCK_PARAMS,
+        make_kernels,
+        partition_percentiles,
+        seed_kernels,
+        set_num_threads,
+    )
 
 logger = logging.getLogger(__name__)
 
+# Scenario percentiles reported in the simulation metrics
+_PERCENTILES = (5, 25, 50, 75, 95)
 
-@dataclass
+# Field order of the validation_history entries (timestamp is epoch nanoseconds)
+_HISTORY_FIELDS = (
+    'timestamp', 'epic', 'direction', 'size', 'approved', 'win_probability',
+    'risk_of_ruin', 'expected_value', 'confidence_level', 'scenarios_analyzed',
+    'rejection_reason'
+)
+
+# Loss beyond which a scenario counts towards risk of ruin
+_RUIN_THRESHOLD = 0.2
+
+# Rejection reason per Monte Carlo gate, in gate bit order
+_GATE_MSGS = (
+    "Win probability %.1f%% < %.1f%%",
+    "Risk of ruin %.1f%% > %.1f%%",
+    "Expected value %.3f < %.3f",
+    "Confidence level %.1f%% < %.1f%%",
+)
+
+
+def _normal_cdf(x: float) -> float:
+    """Standard normal CDF"""
+    return 0.5 * (1.0 + math.erf(x / math.sqrt(2.0)))
+
+
+@dataclass(slots=True)
 class SSEValidationResult:
     """Result of SSE pre-trade validation"""
     approved: bool
@@ -45,7 +87,7 @@ class SSEValidationResult:
     simulation_metrics: Optional[Dict] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TradeProposal:
     """Proposed trade for SSE validation"""
     epic: str
@@ -66,6 +108,17 @@ class SSERiskEngine:
     10,000 Monte Carlo simulations before live execution.
     """
     
+    # Validations kept in validation_history for the audit trail
+    MAX_VALIDATION_HISTORY = 1000
+    
+    # Gate bitmask with all four Monte Carlo gates passed
+    ALL_GATES_PASSED = 0b1111
+    
+    # Default volatility by epic prefix (forex, indices); anything else is
+    # treated as a commodity
+    _VOL_TABLE = {'CS.D.': 0.015, 'IX.D.': 0.025}
+    _DEFAULT_VOLATILITY = 0.03
+    
     def __init__(self, config: Dict):
         """Initialize SSE Risk Engine"""
         self.config = config
@@ -75,6 +128,11 @@ class SSERiskEngine:
         self.enabled = self.sse_config.get('enabled', True)
         self.n_simulations = self.sse_config.get('n_simulations', 10000)
         self.pre_trade_validation = self.sse_config.get('pre_trade_validation', True)
+        # Scenario precision: gates work at percent level, so float32 halves the
+        # memory traffic of every pass over the scenarios; float64 for A/B audits
+        self.scenario_dtype = np.dtype(self.sse_config.get('precision', 'float32'))
+        if self.scenario_dtype not in (np.float32, np.float64):
+            raise ValueError(f"Unsupported SSE precision: {self.scenario_dtype}")
         
         # Monte Carlo Gates
         gates_config = self.sse_config.get('monte_carlo_gates', {})
@@ -88,24 +146,77 @@ class SSERiskEngine:
         self.block_high_risk_trades = firewall_config.get('block_high_risk_trades', True)
         self.emergency_stop_multiplier = firewall_config.get('emergency_stop_loss_multiplier', 2.0)
         
-        # Initialize Monte Carlo Simulator
+        # Scenario buffer reused by every validation (overwritten in place;
+        # grown when a batch needs more rows)
+        self._scenario_buf = np.empty(self.n_simulations, dtype=self.scenario_dtype)
+        
+        # Spread scenario generation across cores when the run is large enough
+        perf_config = self.sse_config.get('performance_optimization', {})
+        self._parallel = perf_config.get('parallel_processing', True)
+        if perf_config.get('num_threads'):
+            set_num_threads(perf_config['num_threads'])
+        
+        # Optional fixed seed for reproducible validations. Parallel kernels draw
+        # from one random state per thread, so a seeded engine runs serially.
+        self.seed = self.sse_config.get('seed')
+        if self.seed is not None:
+            self._parallel = False
+        
+        # Prepare the Monte Carlo kernels, specialized on n_simulations (fixed at init)
+        self._simulate_batch, self._simulate_batch_parallel, self._fused_stats = make_kernels(
+            self.n_simulations
+        )
         if self.enabled:
-            self.monte_carlo = MonteCarloSimulator(n_simulations=self.n_simulations)
+            self._warm_up_kernels()
+            if self.seed is not None:
+                seed_kernels(self.seed)
             logger.info(f"🎯 SSE Risk Engine initialized: {self.n_simulations:,} simulations per validation")
         else:
-            self.monte_carlo = None
             logger.warning("⚠️ SSE Risk Engine DISABLED - trades will execute without Monte Carlo validation")
         
-        # Validation history
-        self.validation_history = []
+        # Shock probability tuples keyed by epic prefix (e.g. 'IX.D.')
+        self._shock_cache: Dict[str, Tuple[float, float, float, float]] = {}
+        
+        # Validation history (most recent MAX_VALIDATION_HISTORY validations),
+        # one _HISTORY_FIELDS tuple per validation; see _export_history
+        self.validation_history: Deque[Tuple] = deque(maxlen=self.MAX_VALIDATION_HISTORY)
         self.blocked_trades = 0
         self.approved_trades = 0
     
+    def _warm_up_kernels(self):
+        """
+        Compile the scenario kernels before the first live trade arrives
+        
+        The kernels are cached on disk (numba cache=True), so after the first
+        run this only loads them; either way no validation pays the JIT cost.
+        """
+        scenarios = np.zeros((1, self.n_simulations), dtype=self.scenario_dtype)
+        bases = np.zeros(1)
+        vols = np.full(1, 0.01)
+        shock_probs = np.zeros((1, 4))
+        self._simulate_batch(scenarios, bases, vols, shock_probs)
+        if self._parallel:
+            self._simulate_batch_parallel(scenarios, bases, vols, shock_probs)
+        self._fused_stats(scenarios[0], _RUIN_THRESHOLD)
+    
     async def validate_trade(self, trade_proposal: TradeProposal) -> SSEValidationResult:
         """
         🎯 CRITICAL: Validate trade through 10,000 Monte Carlo simulations
         
         This is the primary risk firewall - NO trade executes without passing this validation.
+        The validation is pure CPU work with no I/O; see validate_trade_sync.
+        
+        Args:
+            trade_proposal: Proposed trade details
+            
+        Returns:
+            SSEValidationResult with approval/rejection decision
+        """
+        return self.validate_trade_sync(trade_proposal)
+    
+    def validate_trade_sync(self, trade_proposal: TradeProposal) -> SSEValidationResult:
+        """
+        Synchronous core of validate_trade for callers outside an event loop
         
         Args:
             trade_proposal: Proposed trade details
@@ -113,65 +224,101 @@ class SSERiskEngine:
         Returns:
             SSEValidationResult with approval/rejection decision
         """
+        return self.validate_trades_batch([trade_proposal])[0]
+    
+    def validate_trades_batch(self, trade_proposals: List[TradeProposal]) -> List[SSEValidationResult]:
+        """
+        Validate several trade proposals with one Monte Carlo kernel call
+        
+        All proposals that pass the prescreen are simulated together (one
+        n_simulations row each), then every row goes through the same analysis
+        and gates as a single validation.
+        
+        Args:
+            trade_proposals: Proposed trades, e.g. from strategies firing together
+            
+        Returns:
+            One SSEValidationResult per proposal, in order
+        """
         if not self.enabled or not self.pre_trade_validation:
             logger.warning("⚠️ SSE validation BYPASSED - trade approved without Monte Carlo analysis")
-            return SSEValidationResult(
-                approved=True,
-                win_probability=0.0,
-                risk_of_ruin=0.0,
-                expected_value=0.0,
-                confidence_level=0.0,
-                scenarios_analyzed=0,
-                rejection_reason="SSE_DISABLED"
-            )
+            return [
+                SSEValidationResult(
+                    approved=True,
+                    win_probability=0.0,
+                    risk_of_ruin=0.0,
+                    expected_value=0.0,
+                    confidence_level=0.0,
+                    scenarios_analyzed=0,
+                    rejection_reason="SSE_DISABLED"
+                )
+                for _ in trade_proposals
+            ]
         
-        logger.info(f"🎯 SSE VALIDATION STARTING: {trade_proposal.epic} {trade_proposal.direction} £{trade_proposal.size}/pt")
-        logger.info(f"   Running {self.n_simulations:,} Monte Carlo simulations...")
+        if logger.isEnabledFor(logging.INFO):
+            for trade_proposal in trade_proposals:
+                logger.info("🎯 SSE VALIDATION STARTING: %s %s £%s/pt",
+                            trade_proposal.epic, trade_proposal.direction, trade_proposal.size)
+            logger.info(f"   Running {self.n_simulations:,} Monte Carlo simulations...")
         
         try:
-            # Calculate market volatility for simulation
-            volatility = await self._calculate_market_volatility(trade_proposal)
-            
-            # Run Monte Carlo simulation
-            scenarios = self.monte_carlo.simulate_scenarios(
-                base_prediction=trade_proposal.confidence_score,
-                volatility=volatility,
-                shock_probabilities=self._get_shock_probabilities(trade_proposal)
-            )
-            
-            # Analyze simulation results
-            analysis = await self._analyze_simulation_results(scenarios, trade_proposal)
-            
-            # Apply Monte Carlo gates
-            validation_result = await self._apply_monte_carlo_gates(analysis, trade_proposal)
+            results: List[Optional[SSEValidationResult]] = [None] * len(trade_proposals)
+            simulated = []
+            volatilities = []
+            for index, trade_proposal in enumerate(trade_proposals):
+                # Calculate market volatility for simulation
+                volatility = self._calculate_market_volatility(trade_proposal)
+                
+                # Skip the simulation when the gates provably cannot pass
+                results[index] = self._prescreen(trade_proposal, volatility)
+                if results[index] is None:
+                    simulated.append(index)
+                    volatilities.append(volatility)
             
-            # Log validation result
-            await self._log_validation_result(validation_result, trade_proposal)
+            if simulated:
+                # Run Monte Carlo simulation for every remaining proposal at once
+                scenarios = self._simulate_scenarios(
+                    [trade_proposals[index] for index in simulated], volatilities
+                )
+                
+                for row, index in enumerate(simulated):
+                    # Analyze simulation results
+                    analysis = self._analyze_simulation_results(scenarios[row], trade_proposals[index])
+                    
+                    # Apply Monte Carlo gates
+                    results[index] = self._apply_monte_carlo_gates(analysis, trade_proposals[index])
             
-            # Update statistics
-            if validation_result.approved:
-                self.approved_trades += 1
-                logger.info(f"✅ SSE APPROVED: Trade passed Monte Carlo validation")
-            else:
-                self.blocked_trades += 1
-                logger.warning(f"❌ SSE BLOCKED: {validation_result.rejection_reason}")
+            for trade_proposal, validation_result in zip(trade_proposals, results):
+                # Log validation result
+                self._log_validation_result(validation_result, trade_proposal)
+                
+                # Update statistics
+                if validation_result.approved:
+                    self.approved_trades += 1
+                    logger.info("✅ SSE APPROVED: Trade passed Monte Carlo validation")
+                else:
+                    self.blocked_trades += 1
+                    logger.warning("❌ SSE BLOCKED: %s", validation_result.rejection_reason)
             
-            return validation_result
+            return results
             
         except Exception as e:
             logger.error(f"❌ SSE validation error: {e}")
             # Fail-safe: block trade on validation error
-            return SSEValidationResult(
-                approved=False,
-                win_probability=0.0,
-                risk_of_ruin=1.0,
-                expected_value=-1.0,
-                confidence_level=0.0,
-                scenarios_analyzed=0,
-                rejection_reason=f"VALIDATION_ERROR: {str(e)}"
-            )
+            return [
+                SSEValidationResult(
+                    approved=False,
+                    win_probability=0.0,
+                    risk_of_ruin=1.0,
+                    expected_value=-1.0,
+                    confidence_level=0.0,
+                    scenarios_analyzed=0,
+                    rejection_reason=f"VALIDATION_ERROR: {str(e)}"
+                )
+                for _ in trade_proposals
+            ]
     
-    async def _calculate_market_volatility(self, trade_proposal: TradeProposal) -> float:
+    def _calculate_market_volatility(self, trade_proposal: TradeProposal) -> float:
         """Calculate market volatility for Monte Carlo simulation"""
         try:
             # Use market context if available
@@ -179,12 +326,7 @@ class SSERiskEngine:
                 volatility = trade_proposal.market_context.get('volatility', 0.02)
             else:
                 # Default volatility based on epic type
-                if 'CS.D.' in trade_proposal.epic:  # Forex
-                    volatility = 0.015
-                elif 'IX.D.' in trade_proposal.epic:  # Indices
-                    volatility = 0.025
-                else:  # Commodities
-                    volatility = 0.03
+                volatility = self._VOL_TABLE.get(trade_proposal.epic[:5], self._DEFAULT_VOLATILITY)
             
             # Adjust volatility based on confidence score
             confidence_adjustment = 1.0 - (trade_proposal.confidence_score * 0.2)
@@ -196,48 +338,129 @@ class SSERiskEngine:
             logger.error(f"❌ Error calculating volatility: {e}")
             return 0.02  # Safe default
     
-    def _get_shock_probabilities(self, trade_proposal: TradeProposal) -> Dict[str, float]:
-        """Get shock probabilities for Monte Carlo simulation"""
-        # Base shock probabilities
-        base_shocks = {
-            'market_crash': 0.01,
-            'geopolitical': 0.015,
-            'liquidity_crisis': 0.005,
-            'positive_surprise': 0.02
-        }
+    def _prescreen(self, trade_proposal: TradeProposal, volatility: float) -> Optional[SSEValidationResult]:
+        """
+        Reject analytically, before simulating, trades that cannot pass the gates.
+        
+        Scenarios are N(confidence, volatility) plus tail shocks, and only the
+        positive-surprise shock moves a scenario up. So Phi(confidence / volatility)
+        plus P(positive surprise) bounds the win probability from above, and
+        confidence plus the expected positive shock bounds the expected value
+        (with six standard errors of slack for Monte Carlo noise).
         
-        # Adjust based on epic type
-        if 'IX.D.' in trade_proposal.epic:  # Indices more sensitive to crashes
-            base_shocks['market_crash'] *= 1.5
-        elif 'CS.D.' in trade_proposal.epic:  # Forex more sensitive to geopolitical
-            base_shocks['geopolitical'] *= 1.3
+        Returns:
+            A rejected SSEValidationResult, or None when the trade needs the full simulation
+        """
+        if not self.block_high_risk_trades:
+            return None  # Gates are overridden anyway
+        
+        shocks = self._get_shock_probabilities(trade_proposal)
+        confidence = float(trade_proposal.confidence_score)
+        p_crash, p_geopolitical, p_liquidity, p_positive = shocks
+        positive_mean = SHOCK_PARAMS[3][0]
+        
+        win_bound = min(1.0, _normal_cdf(confidence / volatility) + p_positive)
+        ev_bound = (
+            confidence + p_positive * positive_mean
+            + 6.0 * (volatility + abs(SHOCK_PARAMS[0][0])) / math.sqrt(self.n_simulations)
+        )
+        
+        if win_bound < self.min_win_probability * 0.5:
+            reason = f"Prescreen: win probability ≤ {win_bound:.1%} < {self.min_win_probability:.1%}"
+        elif ev_bound < self.min_expected_value:
+            reason = f"Prescreen: expected value ≤ {ev_bound:.3f} < {self.min_expected_value:.3f}"
+        else:
+            return None
+        
+        # Report the analytic estimates; ruin is bounded by the no-shock tail
+        # plus every adverse shock firing
+        risk_of_ruin = min(1.0, _normal_cdf((-_RUIN_THRESHOLD - confidence) / volatility)
+                           + p_crash + p_geopolitical + p_liquidity)
+        expected_value = confidence + sum(
+            probability * mean
+            for probability, (mean, _) in zip(shocks, SHOCK_PARAMS)
+        )
+        return SSEValidationResult(
+            approved=False,
+            win_probability=win_bound,
+            risk_of_ruin=risk_of_ruin,
+            expected_value=expected_value,
+            confidence_level=0.0,
+            scenarios_analyzed=0,
+            rejection_reason=reason,
+            simulation_metrics={'prescreen': True, 'volatility': volatility}
+        )
+    
+    def _simulate_scenarios(
+        self, trade_proposals: List[TradeProposal], volatilities: List[float]
+    ) -> np.ndarray:
+        """
+        Run the compiled Monte Carlo kernel around each trade's confidence score.
+        
+        Returns a (len(trade_proposals), n_simulations) view of the engine's
+        shared scenario buffer, valid until the next validation.
+        """
+        rows = len(trade_proposals)
+        size = rows * self.n_simulations
+        if self._scenario_buf.size < size:
+            self._scenario_buf = np.empty(size, dtype=self.scenario_dtype)
+        scenarios = self._scenario_buf[:size].reshape(rows, self.n_simulations)
+        
+        bases = np.fromiter(
+            (trade_proposal.confidence_score for trade_proposal in trade_proposals),
+            dtype=np.float64, count=rows
+        )
+        shock_probs = np.empty((rows, 4), dtype=np.float64)
+        for row, trade_proposal in enumerate(trade_proposals):
+            shock_probs[row] = self._get_shock_probabilities(trade_proposal)
+        
+        if self._parallel and size >= PARALLEL_MIN_SCENARIOS:
+            simulate = self._simulate_batch_parallel
+        else:
+            simulate = self._simulate_batch
+        simulate(scenarios, bases, np.asarray(volatilities, dtype=np.float64), shock_probs)
+        return scenarios
+    
+    def _get_shock_probabilities(self, trade_proposal: TradeProposal) -> Tuple[float, float, float, float]:
+        """
+        Get shock probabilities for Monte Carlo simulation
         
-        return base_shocks
+        Returns (market crash, geopolitical, liquidity crisis, positive surprise),
+        the argument order of the scenario kernels. The probabilities depend only
+        on the epic's market prefix, so they are computed once per prefix.
+        """
+        prefix = trade_proposal.epic[:5]
+        shocks = self._shock_cache.get(prefix)
+        if shocks is None:
+            # Base shock probabilities, adjusted by epic type
+            market_crash, geopolitical, liquidity_crisis, positive_surprise = 0.01, 0.015, 0.005, 0.02
+            if prefix == 'IX.D.':  # Indices more sensitive to crashes
+                market_crash *= 1.5
+            elif prefix == 'CS.D.':  # Forex more sensitive to geopolitical
+                geopolitical *= 1.3
+            shocks = (market_crash, geopolitical, liquidity_crisis, positive_surprise)
+            self._shock_cache[prefix] = shocks
+        return shocks
     
-    async def _analyze_simulation_results(self, scenarios: np.ndarray, trade_proposal: TradeProposal) -> Dict:
+    def _analyze_simulation_results(self, scenarios: np.ndarray, trade_proposal: TradeProposal) -> Dict:
         """Analyze Monte Carlo simulation results"""
         try:
-            # Calculate key metrics
-            # Interpret scenarios as profit/loss outcomes (positive => profitable)
-            win_scenarios = scenarios > 0.0  # Scenarios where trade would be profitable
-            win_probability = float(np.mean(win_scenarios))
-
-            # Probability of loss (any scenario that yields loss)
-            loss_scenarios = scenarios < 0.0
-            probability_of_loss = float(np.mean(loss_scenarios))
-
-            # Risk of ruin (probability of significant loss)
-            ruin_threshold = 0.2  # 20% loss threshold (adjustable)
-            ruin_scenarios = scenarios < -ruin_threshold
-            risk_of_ruin = float(np.mean(ruin_scenarios))
+            # Calculate key metrics in one pass over the scenarios
+            # Interpret scenarios as profit/loss outcomes (positive => profitable);
+            # ruin is a significant loss beyond _RUIN_THRESHOLD (20%)
+            n_scenarios = len(scenarios)
+            (n_win, n_loss, n_ruin,
+             mean_val, std_val, skewness, kurtosis) = self._fused_stats(scenarios, _RUIN_THRESHOLD)
+            
+            win_probability = n_win / n_scenarios
+            probability_of_loss = n_loss / n_scenarios
+            risk_of_ruin = n_ruin / n_scenarios
             
             # Expected value
-            expected_value = np.mean(scenarios)
+            expected_value = mean_val
             
             # Confidence level (statistical significance)
             # Confidence level: normalized measure of dispersion relative to mean
-            mean_val = float(np.mean(scenarios))
-            std_val = float(np.std(scenarios))
             if abs(mean_val) < 1e-6:
                 confidence_level = 0.0
             else:
@@ -246,34 +469,39 @@ class SSERiskEngine:
                 confidence_level = max(0.0, min(1.0, confidence_level))
             
             # Additional metrics
-            percentiles = np.percentile(scenarios, [5, 25, 50, 75, 95])
+            # The scenarios are scratch once the moments are taken: partition in place
+            p5, p25, p50, p75, p95 = partition_percentiles(
+                scenarios, _PERCENTILES, overwrite_input=True
+            ).tolist()
             
+            # The fused stats kernel returns plain Python ints/floats, so the metrics need no conversion.
             # Include probability_of_loss for consistency checks
             analysis = {
-                'win_probability': float(win_probability),
-                'probability_of_loss': float(probability_of_loss),
-                'risk_of_ruin': float(risk_of_ruin),
-                'expected_value': float(expected_value),
-                'confidence_level': float(confidence_level),
-                'scenarios_count': len(scenarios),
+                'win_probability': win_probability,
+                'probability_of_loss': probability_of_loss,
+                'risk_of_ruin': risk_of_ruin,
+                'expected_value': expected_value,
+                'confidence_level': confidence_level,
+                'scenarios_count': n_scenarios,
                 'percentiles': {
-                    'p5': float(percentiles[0]),
-                    'p25': float(percentiles[1]),
-                    'p50': float(percentiles[2]),
-                    'p75': float(percentiles[3]),
-                    'p95': float(percentiles[4])
+                    'p5': p5,
+                    'p25': p25,
+                    'p50': p50,
+                    'p75': p75,
+                    'p95': p95
                 },
-                'volatility': float(std_val),
-                'skewness': float(self._calculate_skewness(scenarios)),
-                'kurtosis': float(self._calculate_kurtosis(scenarios))
+                'volatility': std_val,
+                'skewness': skewness,
+                'kurtosis': kurtosis
             }
             
-            logger.info(f"📊 SSE ANALYSIS COMPLETE:")
-            logger.info(f"   Win Probability: {win_probability:.1%}")
-            logger.info(f"   Probability of Loss: {probability_of_loss:.1%}")
-            logger.info(f"   Risk of Ruin: {risk_of_ruin:.1%}")
-            logger.info(f"   Expected Value: {expected_value:.3f}")
-            logger.info(f"   Confidence Level: {confidence_level:.1%}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("📊 SSE ANALYSIS COMPLETE:")
+                logger.info("   Win Probability: %.1f%%", win_probability * 100)
+                logger.info("   Probability of Loss: %.1f%%", probability_of_loss * 100)
+                logger.info("   Risk of Ruin: %.1f%%", risk_of_ruin * 100)
+                logger.info("   Expected Value: %.3f", expected_value)
+                logger.info("   Confidence Level: %.1f%%", confidence_level * 100)
             
             return analysis
             
@@ -287,78 +515,48 @@ class SSERiskEngine:
                 'scenarios_count': 0
             }
     
-    def _calculate_skewness(self, data: np.ndarray) -> float:
-        """Calculate skewness of distribution"""
-        try:
-            mean = np.mean(data)
-            std = np.std(data)
-            if std == 0:
-                return 0.0
-            return np.mean(((data - mean) / std) ** 3)
-        except:
-            return 0.0
-    
-    def _calculate_kurtosis(self, data: np.ndarray) -> float:
-        """Calculate kurtosis of distribution"""
-        try:
-            mean = np.mean(data)
-            std = np.std(data)
-            if std == 0:
-                return 0.0
-            return np.mean(((data - mean) / std) ** 4) - 3.0
-        except:
-            return 0.0
-    
-    async def _apply_monte_carlo_gates(self, analysis: Dict, trade_proposal: TradeProposal) -> SSEValidationResult:
+    def _apply_monte_carlo_gates(self, analysis: Dict, trade_proposal: TradeProposal) -> SSEValidationResult:
         """Apply Monte Carlo gates to determine trade approval"""
         
-        # Extract metrics
-        win_probability = float(analysis.get('win_probability', 0.0))
-        probability_of_loss = float(analysis.get('probability_of_loss', 0.0))
-        risk_of_ruin = float(analysis.get('risk_of_ruin', 1.0))
-        expected_value = float(analysis.get('expected_value', -1.0))
-        confidence_level = float(analysis.get('confidence_level', 0.0))
+        # Extract metrics (already Python floats)
+        win_probability = analysis['win_probability']
+        probability_of_loss = analysis.get('probability_of_loss', 0.0)
+        risk_of_ruin = analysis['risk_of_ruin']
+        expected_value = analysis['expected_value']
+        confidence_level = analysis['confidence_level']
 
         # Sanity check: win_probability should be consistent with probability_of_loss
         if probability_of_loss > 0 and win_probability >= 0.999:
             logger.warning("⚠️ Inconsistent Monte Carlo metrics: perfect win_probability with non-zero loss probability. Adjusting win_probability.")
             win_probability = max(0.0, 1.0 - probability_of_loss)
         
-        # Check each gate
-        gates_passed = []
-        rejection_reasons = []
-        
-        # Gate 1: Minimum win probability
-        if win_probability >= self.min_win_probability:
-            gates_passed.append("WIN_PROBABILITY")
-        else:
-            rejection_reasons.append(f"Win probability {win_probability:.1%} < {self.min_win_probability:.1%}")
-        
-        # Gate 2: Maximum risk of ruin
-        if risk_of_ruin <= self.max_risk_of_ruin:
-            gates_passed.append("RISK_OF_RUIN")
-        else:
-            rejection_reasons.append(f"Risk of ruin {risk_of_ruin:.1%} > {self.max_risk_of_ruin:.1%}")
-        
-        # Gate 3: Minimum expected value
-        if expected_value >= self.min_expected_value:
-            gates_passed.append("EXPECTED_VALUE")
-        else:
-            rejection_reasons.append(f"Expected value {expected_value:.3f} < {self.min_expected_value:.3f}")
-        
-        # Gate 4: Minimum confidence level
-        if confidence_level >= (self.confidence_threshold - 0.01):  # Allow small tolerance
-            gates_passed.append("CONFIDENCE_LEVEL")
-        else:
-            rejection_reasons.append(f"Confidence level {confidence_level:.1%} < {self.confidence_threshold:.1%}")
+        # Check each gate into one bitmask (bit set = gate passed):
+        # 1. minimum win probability, 2. maximum risk of ruin,
+        # 3. minimum expected value, 4. minimum confidence level (small tolerance)
+        gates_passed = (
+            (win_probability >= self.min_win_probability)
+            | (risk_of_ruin <= self.max_risk_of_ruin) << 1
+            | (expected_value >= self.min_expected_value) << 2
+            | (confidence_level >= self.confidence_threshold - 0.01) << 3
+        )
         
-        # Determine approval
-        all_gates_passed = len(gates_passed) == 4
-        approved = all_gates_passed and self.block_high_risk_trades
+        # Determine approval (always approved if risk blocking is disabled)
+        approved = gates_passed == self.ALL_GATES_PASSED or not self.block_high_risk_trades
         
-        if not self.block_high_risk_trades:
-            approved = True  # Override if risk blocking is disabled
-            rejection_reasons = []
+        # Rejection reasons are only formatted for the gates that failed
+        rejection_reason = None
+        if not approved:
+            gate_values = (
+                (win_probability * 100, self.min_win_probability * 100),
+                (risk_of_ruin * 100, self.max_risk_of_ruin * 100),
+                (expected_value, self.min_expected_value),
+                (confidence_level * 100, self.confidence_threshold * 100),
+            )
+            rejection_reason = "; ".join(
+                _GATE_MSGS[gate] % gate_values[gate]
+                for gate in range(4)
+                if not gates_passed >> gate & 1
+            )
         
         return SSEValidationResult(
             approved=approved,
@@ -367,36 +565,39 @@ class SSERiskEngine:
             expected_value=expected_value,
             confidence_level=confidence_level,
             scenarios_analyzed=analysis['scenarios_count'],
-            rejection_reason="; ".join(rejection_reasons) if rejection_reasons else None,
+            rejection_reason=rejection_reason,
             simulation_metrics=analysis
         )
     
-    async def _log_validation_result(self, result: SSEValidationResult, trade_proposal: TradeProposal):
-        """Log validation result for audit trail"""
+    def _log_validation_result(self, result: SSEValidationResult, trade_proposal: TradeProposal):
+        """Log validation result for audit trail (formatted only on export)"""
         try:
-            log_entry = {
-                'timestamp': datetime.now().isoformat(),
-                'epic': trade_proposal.epic,
-                'direction': trade_proposal.direction,
-                'size': trade_proposal.size,
-                'approved': result.approved,
-                'win_probability': result.win_probability,
-                'risk_of_ruin': result.risk_of_ruin,
-                'expected_value': result.expected_value,
-                'confidence_level': result.confidence_level,
-                'scenarios_analyzed': result.scenarios_analyzed,
-                'rejection_reason': result.rejection_reason
-            }
+            self.validation_history.append((
+                time.time_ns(),
+                trade_proposal.epic,
+                trade_proposal.direction,
+                trade_proposal.size,
+                result.approved,
+                result.win_probability,
+                result.risk_of_ruin,
+                result.expected_value,
+                result.confidence_level,
+                result.scenarios_analyzed,
+                result.rejection_reason
+            ))
             
-            self.validation_history.append(log_entry)
-            
-            # Keep only last 1000 validations
-            if len(self.validation_history) > 1000:
-                self.validation_history = self.validation_history[-1000:]
-                
         except Exception as e:
             logger.error(f"❌ Error logging validation result: {e}")
     
+    def _export_history(self) -> str:
+        """Validation history as a JSON list of records with ISO timestamps"""
+        records = []
+        for entry in self.validation_history:
+            record = dict(zip(_HISTORY_FIELDS, entry))
+            record['timestamp'] = datetime.fromtimestamp(entry[0] / 1_000_000_000).isoformat()
+            records.append(record)
+        return json.dumps(records)
+    
     def get_validation_statistics(self) -> Dict:
         """Get SSE validation statistics"""
         total_validations = self.approved_trades + self.blocked_trades
@@ -27,19 +27,24 @@ async def debug_positions():
     
     # Try to close the US 500 position we see in the UI
     if isinstance(positions, dict) and 'positions' in positions:
-        for pos_data in positions['positions']:
-            deal_id = pos_data['position']['dealId']
-            print(f"\n🔄 Closing position: {deal_id}")
-            result = await api.close_position(deal_id)
-            print(f"Result: {result}")
+        pos_list = positions['positions']
     elif isinstance(positions, list):
         print(f"Positions is a list with {len(positions)} items")
-        for pos_data in positions:
-            if 'position' in pos_data:
-                deal_id = pos_data['position']['dealId']
-                print(f"\n🔄 Closing position: {deal_id}")
-                result = await api.close_position(deal_id)
-                print(f"Result: {result}")
+        pos_list = [pos_data for pos_data in positions if 'position' in pos_data]
+    else:
+        pos_list = []
+    
+    # Close all positions concurrently (wall time of the slowest close, not the sum)
+    deal_ids = [pos_data['position']['dealId'] for pos_data in pos_list]
+    results = await asyncio.gather(
+        *(api.close_position(deal_id) for deal_id in deal_ids),
+        return_exceptions=True
+    )
+    if deal_ids:
+        print("\n".join(
+            f"\n🔄 Closing position: {deal_id}\nResult: {result}"
+            for deal_id, result in zip(deal_ids, results)
+        ))
     
     await api.close_session()
 
@@ -0,0 +1,100 @@
+"""
+Numeric kernels for the news sentiment engine.
+
+The weighted sentiment reduction is compiled with numba when it is installed;
+otherwise an equivalent vectorized NumPy implementation is used.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Number of most recent matching events reported back by the reduction
+N_RECENT = 10
+
+# Impact code of NewsImpact.NEUTRAL (codes run from 0 = CRITICAL)
+NEUTRAL_CODE = 4
+
+
+def _reduce_loop(ts, sent, imp, conf, symbols, symbol_mask, now_ns, cutoff_ns, horizon_h,
+                 impact_weights, recent_idx):
+    """
+    Weighted sentiment over events newer than cutoff_ns, in a single pass.
+
+    Only events whose symbol bitmap shares a bit with symbol_mask are counted
+    (-1 selects every event with a non-zero bitmap).
+
+    Events are weighted by impact, recency and confidence. The indices of the
+    matching events go round the N_RECENT-slot ring recent_idx, so slot
+    count % N_RECENT holds the oldest of the last N_RECENT.
+
+    Returns (weighted sentiment sum, weight sum, bullish, bearish, neutral,
+    highest impact code, matching event count).
+    """
+    total_ws = 0.0
+    total_w = 0.0
+    bullish = 0
+    bearish = 0
+    neutral = 0
+    highest = NEUTRAL_CODE
+    count = 0
+    for i in range(ts.shape[0]):
+        if ts[i] <= cutoff_ns or (symbols[i] & symbol_mask) == 0:
+            continue
+        hours_ago = (now_ns - ts[i]) / 3.6e12
+        recency = max(0.1, 1.0 - hours_ago / horizon_h)
+        w = impact_weights[imp[i]] * recency * conf[i]
+        s = sent[i]
+        total_ws += s * w
+        total_w += w
+        if s > 0.2:
+            bullish += 1
+        elif s < -0.2:
+            bearish += 1
+        else:
+            neutral += 1
+        if imp[i] < highest:
+            highest = imp[i]
+        recent_idx[count % N_RECENT] = i
+        count += 1
+    return total_ws, total_w, bullish, bearish, neutral, highest, count
+
+
+def _reduce_numpy(ts, sent, imp, conf, symbols, symbol_mask, now_ns, cutoff_ns, horizon_h,
+                  impact_weights, recent_idx):
+    """Vectorized NumPy equivalent of _reduce_loop"""
+    recent = np.flatnonzero((ts > cutoff_ns) & ((symbols & symbol_mask) != 0))
+    count = recent.size
+    if count == 0:
+        return 0.0, 0.0, 0, 0, 0, NEUTRAL_CODE, 0
+
+    s = sent[recent]
+    hours_ago = (now_ns - ts[recent]) / 3.6e12
+    recency = np.maximum(0.1, 1.0 - hours_ago / horizon_h)
+    w = impact_weights[imp[recent]] * recency * conf[recent]
+
+    bullish = int(np.count_nonzero(s > 0.2))
+    bearish = int(np.count_nonzero(s < -0.2))
+
+    # Same ring layout as _reduce_loop
+    last = recent[-N_RECENT:]
+    recent_idx[np.arange(count - last.size, count) % N_RECENT] = last
+
+    return (
+        float(np.dot(s, w)),
+        float(w.sum()),
+        bullish,
+        bearish,
+        count - bullish - bearish,
+        int(imp[recent].min()),
+        count,
+    )
+
+
+if njit is not None:
+    reduce_sentiment = njit(cache=True, fastmath=True, boundscheck=False)(_reduce_loop)
+else:
+    reduce_sentiment = _reduce_numpy
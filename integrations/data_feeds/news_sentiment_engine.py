@@ -22,25 +22,137 @@ Expected Impact: +5-8% win rate boost
 Prevents: Fed pivot surprises, earnings shocks, geopolitical events
 """
 
+import asyncio
+import atexit
 import json
 import logging
+import os
+import sys
+import time
+from collections import Counter
 from datetime import datetime, timezone, timedelta
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
-from enum import Enum
+from enum import Enum, IntEnum
+from functools import lru_cache
 from pathlib import Path
+from urllib.parse import urlparse
+from io import BytesIO
 import re
+import xml.etree.ElementTree as ET
+
+import aiohttp
+
+import numpy as np
+
+try:
+    from ._news_kernels import N_RECENT, reduce_sentiment
+except ImportError:
+    from integrations.data_feeds._news_kernels import N_RECENT, reduce_sentiment
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from lxml import etree as lxml_etree
+except ImportError:
+    lxml_etree = None  # Feeds are parsed with the stdlib ElementTree
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None  # Keyword scan falls back to one substring check per keyword
 
 logger = logging.getLogger(__name__)
 
+# Index and company names mapped to the symbol they affect (company subset)
+_SYMBOL_NAMES = {
+    's&p 500': 'SPX', 's&p': 'SPX', 'sp500': 'SPX',
+    'dow jones': 'DJI', 'djia': 'DJI', 'dow': 'DJI',
+    'nasdaq': 'NDX', 'ndx': 'NDX',
+    'apple': 'AAPL', 'microsoft': 'MSFT', 'google': 'GOOGL',
+    'amazon': 'AMZN', 'tesla': 'TSLA', 'meta': 'META',
+    'nvidia': 'NVDA', 'netflix': 'NFLX'
+}
+
+# Symbols in reporting order
+_SYMBOLS = tuple(dict.fromkeys(_SYMBOL_NAMES.values()))
+
+# Bit of each known symbol in an event's symbol bitmap; symbols outside the
+# table (only found in old history files) share the top bit
+_SYMBOL_BITS = {symbol: 1 << bit for bit, symbol in enumerate(_SYMBOLS + ('MARKET',))}
+_OTHER_SYMBOL_BIT = -1 << 63
+
+# All names in one alternation (longest first), matched anywhere in the
+# lowercased headline
+_SYMBOL_RE = re.compile('|'.join(map(re.escape, sorted(_SYMBOL_NAMES, key=len, reverse=True))))
+
+_TOKEN_RE = re.compile(r'\b\w+\b')
+
+# Feed elements holding one headline: RSS <item> and Atom <entry>
+_ATOM_NS = '{http://www.w3.org/2005/Atom}'
+_FEED_ITEM_TAGS = ('item', _ATOM_NS + 'entry')
+_FEED_TITLE_TAGS = ('title', _ATOM_NS + 'title')
+
+# Raised by either parser on a body that is not well-formed XML
+_FEED_PARSE_ERRORS = (ET.ParseError,) + ((lxml_etree.XMLSyntaxError,) if lxml_etree is not None else ())
+
+_STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+    'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'were'
+})
+
+
+def _dumps_event(event: Dict) -> bytes:
+    """Serialize one news event as a compact JSON line (orjson when available)"""
+    if orjson is not None:
+        return orjson.dumps(event, option=orjson.OPT_APPEND_NEWLINE)
+    return json.dumps(event, separators=(",", ":")).encode() + b"\n"
+
 
-class NewsImpact(Enum):
-    """Classification of news impact severity"""
-    CRITICAL = "CRITICAL"      # Halt trading immediately (war, major crisis)
-    HIGH = "HIGH"              # Reduce positions by 70% (Fed pivot, major earnings miss)
-    MODERATE = "MODERATE"      # Reduce positions by 30% (rate decision, GDP report)
-    LOW = "LOW"                # Minor adjustment -10% (analyst upgrades, minor news)
-    NEUTRAL = "NEUTRAL"        # No impact
+def _loads_event(line: bytes) -> Dict:
+    """Parse one news event JSON line (orjson when available)"""
+    if orjson is not None:
+        return orjson.loads(line)
+    return json.loads(line)
+
+
+class NewsImpact(IntEnum):
+    """Classification of news impact severity (lower value = more severe)"""
+    CRITICAL = 0      # Halt trading immediately (war, major crisis)
+    HIGH = 1          # Reduce positions by 70% (Fed pivot, major earnings miss)
+    MODERATE = 2      # Reduce positions by 30% (rate decision, GDP report)
+    LOW = 3           # Minor adjustment -10% (analyst upgrades, minor news)
+    NEUTRAL = 4       # No impact
+
+
+# Sentiment weight of each impact level
+_IMPACT_WEIGHTS = np.array([5.0, 3.0, 1.5, 0.5, 0.1])
+
+# (recommended action, position multiplier, confidence penalty, risk score)
+# for each impact level
+_ACTION_TABLE = (
+    ('HALT', 0.0, 0.0, 1.0),
+    ('REDUCE_70', 0.3, 0.5, 0.8),
+    ('REDUCE_30', 0.7, 0.85, 0.5),
+    ('REDUCE_10', 0.9, 0.95, 0.2),
+    ('CONTINUE', 1.0, 1.0, 0.0),
+)
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_NS_PER_HOUR = 3_600_000_000_000
+
+
+def _to_ns(timestamp: datetime) -> int:
+    """Exact nanoseconds since the epoch of an aware datetime"""
+    return (timestamp - _EPOCH) // timedelta(microseconds=1) * 1000
+
+
+def _from_ns(timestamp_ns: int) -> datetime:
+    """UTC datetime from nanoseconds since the epoch (microsecond resolution)"""
+    return _EPOCH + timedelta(microseconds=timestamp_ns // 1000)
 
 
 class NewsCategory(Enum):
@@ -55,7 +167,7 @@ class NewsCategory(Enum):
     SECTOR_NEWS = "SECTOR_NEWS"           # Sector-specific developments
 
 
-@dataclass
+@dataclass(slots=True)
 class NewsEvent:
     """Represents a single news event"""
     timestamp: datetime
@@ -64,19 +176,19 @@ class NewsEvent:
     category: NewsCategory
     impact: NewsImpact
     sentiment_score: float  # -1.0 (very bearish) to +1.0 (very bullish)
-    affected_symbols: List[str]  # Stock symbols affected
+    affected_symbols: Tuple[str, ...]  # Stock symbols affected
     confidence: float  # 0.0 to 1.0
     raw_text: str
-    keywords: List[str]
+    keywords: Tuple[str, ...]
     
     def to_dict(self) -> dict:
         """Convert to dictionary for serialization"""
         return {
-            'timestamp': self.timestamp.isoformat(),
+            'timestamp': _to_ns(self.timestamp),  # ns since epoch
             'headline': self.headline,
             'source': self.source,
             'category': self.category.value,
-            'impact': self.impact.value,
+            'impact': self.impact.name,
             'sentiment_score': self.sentiment_score,
             'affected_symbols': self.affected_symbols,
             'confidence': self.confidence,
@@ -84,7 +196,7 @@ class NewsEvent:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class SentimentAnalysis:
     """Overall sentiment analysis for trading decision"""
     overall_sentiment: float  # -1.0 to +1.0
@@ -113,6 +225,31 @@ class NewsSentimentEngine:
     For now, implements rule-based sentiment with keyword matching.
     """
     
+    # Events kept on disk when the history log is compacted
+    MAX_HISTORY_EVENTS = 1000
+    
+    # History log length (lines) above which it is compacted on load
+    COMPACT_THRESHOLD = 10_000
+    
+    # Appended events buffered before the history log is flushed to disk
+    FLUSH_EVERY = 32
+    
+    # Distinct headlines whose analysis is cached
+    HEADLINE_CACHE_SIZE = 4096
+    
+    # Sentiment results cached per (symbol, history version); the window slides
+    # with the clock, so a cached result is also recomputed once this old
+    SENTIMENT_CACHE_SIZE = 64
+    SENTIMENT_CACHE_SECONDS = 1.0
+    
+    # Attributes set by _load_keyword_dictionaries, and their shared values
+    _KEYWORD_ATTRS = (
+        'fed_keywords', 'earnings_keywords', 'economic_keywords', 'geopolitical_keywords',
+        'crisis_keywords', 'corporate_keywords', 'category_triggers',
+        '_keyword_tags', '_keyword_automaton'
+    )
+    _shared_keywords: Optional[Dict] = None
+    
     def __init__(self, history_hours: int = 24):
         """
         Initialize news sentiment engine.
@@ -121,20 +258,72 @@ class NewsSentimentEngine:
             history_hours: How many hours of news history to consider
         """
         self.history_hours = history_hours
-        self.news_history: List[NewsEvent] = []
+        self._events: List[NewsEvent] = []
+        
+        # Struct-of-arrays copy of news_history for the sentiment reduction
+        # (first _n_events rows are valid; grown geometrically)
+        self._n_events = 0
+        self._ts = np.empty(0, dtype=np.int64)          # Event time (ns since epoch)
+        self._ts_max = np.empty(0, dtype=np.int64)      # Running max of _ts (sorted)
+        self._sent = np.empty(0, dtype=np.float64)      # Sentiment score
+        self._imp = np.empty(0, dtype=np.int8)          # Impact code
+        self._conf = np.empty(0, dtype=np.float64)      # Confidence
+        self._symbols = np.empty(0, dtype=np.int64)     # Affected symbol bitmap
+        self._recent_idx = np.empty(N_RECENT, dtype=np.intp)
+        
+        # Bumped on every event recorded, so cached sentiment goes stale on append
+        self._version = 0
+        
+        # Disk I/O is deferred until the history is first used: the history is
+        # read on first access and the append-only log (one JSON line per
+        # event) is opened on the first write
         self.data_dir = Path("data/news")
-        self.data_dir.mkdir(parents=True, exist_ok=True)
+        self.history_file = self.data_dir / "news_history.jsonl"
+        self._loaded = False
+        self._history_log = None
+        self._unflushed = 0
         
         # Load keyword dictionaries
         self._load_keyword_dictionaries()
         
-        # Load existing news history
-        self._load_history()
+        # Wire services re-send the same headline across feeds; analyze each
+        # distinct (lowercased) headline once
+        self._analyze_cached = lru_cache(maxsize=self.HEADLINE_CACHE_SIZE)(self._analyze_headline)
+        
+        # Trading loops query the same symbols many times between news events;
+        # reuse the reduction until an event arrives or the result ages out
+        self._sentiment_cached = lru_cache(maxsize=self.SENTIMENT_CACHE_SIZE)(self._sentiment_for)
+        self._sentiment_cache_ns = int(self.SENTIMENT_CACHE_SECONDS * 1e9)
+        
+        # Compile the sentiment reduction now rather than on the first query
+        self._warm_up_kernels()
         
         logger.info(f"📰 News Sentiment Engine initialized (history: {history_hours}h)")
     
+    @property
+    def news_history(self) -> List[NewsEvent]:
+        """News events in arrival order (loaded from disk on first access)"""
+        self._ensure_loaded()
+        return self._events
+    
+    def _ensure_loaded(self):
+        """Read the on-disk history once, before it is first used"""
+        if not self._loaded:
+            self._loaded = True
+            self._load_history()
+    
     def _load_keyword_dictionaries(self):
-        """Load keyword dictionaries for sentiment analysis"""
+        """
+        Load keyword dictionaries for sentiment analysis.
+        
+        The dictionaries and the automaton are built by the first engine and
+        shared (read-only) by every later one, so short-lived engines (e.g. one
+        per backtest day) skip the rebuild.
+        """
+        shared = NewsSentimentEngine._shared_keywords
+        if shared is not None:
+            vars(self).update(shared)
+            return
         
         # Fed/Monetary Policy Keywords
         self.fed_keywords = {
@@ -176,6 +365,83 @@ class NewsSentimentEngine:
             'market crash', 'trading halt', 'circuit breaker', 'black swan',
             'systemic crisis', 'bank failure', 'credit freeze', 'flash crash'
         ]
+        
+        # Corporate Action Keywords
+        self.corporate_keywords = {
+            'bankruptcy': ['bankruptcy'],
+            'negative': ['layoffs'],
+            'deal': ['merger', 'acquisition'],
+            'shareholder_return': ['dividend', 'buyback'],
+            'executive_exit': ['ceo resign', 'cfo resign']
+        }
+        
+        # Words that place a headline in a category (checked in this order)
+        self.category_triggers = {
+            NewsCategory.FED_POLICY: ['fed', 'federal reserve', 'powell', 'fomc', 'interest rate'],
+            NewsCategory.EARNINGS: ['earnings', 'quarterly results', 'eps', 'revenue'],
+            NewsCategory.ECONOMIC_DATA: ['jobs report', 'unemployment', 'cpi', 'inflation',
+                                         'gdp', 'retail sales', 'pmi'],
+            NewsCategory.GEOPOLITICAL: ['war', 'election', 'sanctions', 'trade war',
+                                        'tariffs', 'china', 'russia', 'geopolitical'],
+            NewsCategory.REGULATORY: ['sec', 'regulation', 'investigation', 'lawsuit', 'fine'],
+            NewsCategory.CORPORATE_ACTION: ['merger', 'acquisition', 'bankruptcy', 'ceo',
+                                            'executive', 'buyback', 'dividend']
+        }
+        
+        # Tag every keyword with the groups it belongs to ('fed_hawkish',
+        # 'crisis', a NewsCategory for category triggers, ...)
+        self._keyword_tags: Dict[str, list] = {}
+        for group, keywords in (('fed', self.fed_keywords),
+                                ('earnings', self.earnings_keywords),
+                                ('economic', self.economic_keywords),
+                                ('geopolitical', self.geopolitical_keywords),
+                                ('corporate', self.corporate_keywords)):
+            for polarity, words in keywords.items():
+                for word in words:
+                    self._keyword_tags.setdefault(word, []).append(f"{group}_{polarity}")
+        for word in self.crisis_keywords:
+            self._keyword_tags.setdefault(word, []).append('crisis')
+        for category, words in self.category_triggers.items():
+            for word in words:
+                self._keyword_tags.setdefault(word, []).append(category)
+        
+        # One automaton matches the whole vocabulary in a single pass per headline
+        if ahocorasick is not None:
+            self._keyword_automaton = ahocorasick.Automaton()
+            for word, tags in self._keyword_tags.items():
+                self._keyword_automaton.add_word(word, (word, tuple(tags)))
+            self._keyword_automaton.make_automaton()
+        else:
+            self._keyword_automaton = None
+        
+        NewsSentimentEngine._shared_keywords = {name: getattr(self, name) for name in self._KEYWORD_ATTRS}
+    
+    def _warm_up_kernels(self):
+        """Run the sentiment reduction once on a one-event dummy history"""
+        reduce_sentiment(
+            np.ones(1, dtype=np.int64), np.zeros(1), np.zeros(1, dtype=np.int8), np.zeros(1),
+            np.ones(1, dtype=np.int64), -1, 0, 0, 1.0, _IMPACT_WEIGHTS, self._recent_idx
+        )
+    
+    def _scan_keywords(self, headline: str) -> Counter:
+        """
+        Count the distinct vocabulary keywords of each tag found in a headline.
+        
+        Keywords match anywhere in the lowercased headline (substring
+        semantics, overlaps included) and each keyword counts once.
+        """
+        hits = Counter()
+        if self._keyword_automaton is not None:
+            seen = set()
+            for _, (word, tags) in self._keyword_automaton.iter(headline):
+                if word not in seen:
+                    seen.add(word)
+                    hits.update(tags)
+        else:
+            for word, tags in self._keyword_tags.items():
+                if word in headline:
+                    hits.update(tags)
+        return hits
     
     def analyze_news_headline(self, headline: str, source: str = "Unknown") -> NewsEvent:
         """
@@ -188,28 +454,8 @@ class NewsSentimentEngine:
         Returns:
             NewsEvent object with classification and sentiment
         """
-        headline_lower = headline.lower()
-        
-        # Check for crisis keywords first
-        if any(keyword in headline_lower for keyword in self.crisis_keywords):
-            return NewsEvent(
-                timestamp=datetime.now(timezone.utc),
-                headline=headline,
-                source=source,
-                category=NewsCategory.MARKET_STRUCTURE,
-                impact=NewsImpact.CRITICAL,
-                sentiment_score=-0.9,
-                affected_symbols=['SPX', 'DJI', 'NDX'],  # Affects all markets
-                confidence=0.95,
-                raw_text=headline,
-                keywords=self._extract_keywords(headline_lower)
-            )
-        
-        # Classify by category
-        category, impact, sentiment, confidence = self._classify_news(headline_lower)
-        
-        # Extract affected symbols
-        affected_symbols = self._extract_symbols(headline)
+        (category, impact, sentiment, confidence,
+         affected_symbols, keywords) = self._analyze_cached(headline.lower())
         
         return NewsEvent(
             timestamp=datetime.now(timezone.utc),
@@ -221,201 +467,282 @@ class NewsSentimentEngine:
             affected_symbols=affected_symbols,
             confidence=confidence,
             raw_text=headline,
-            keywords=self._extract_keywords(headline_lower)
+            keywords=keywords
         )
     
-    def _classify_news(self, headline: str) -> Tuple[NewsCategory, NewsImpact, float, float]:
+    def _analyze_headline(self, headline_lower: str) -> tuple:
+        """
+        Classification of a lowercased headline, independent of when it arrived.
+        
+        Returns:
+            (category, impact, sentiment_score, confidence, symbols, keywords)
+            (results are cached and shared between events)
+        """
+        # Crisis check, classification and sentiment all read from one scan
+        hits = self._scan_keywords(headline_lower)
+        keywords = self._extract_keywords(headline_lower)
+        
+        # Check for crisis keywords first
+        if hits['crisis']:
+            return (NewsCategory.MARKET_STRUCTURE, NewsImpact.CRITICAL, -0.9, 0.95,
+                    ('SPX', 'DJI', 'NDX'), keywords)  # Affects all markets
+        
+        # Classify by category
+        category, impact, sentiment, confidence = self._classify_news(hits)
+        
+        # Extract affected symbols
+        affected_symbols = self._extract_symbols(headline_lower)
+        
+        return category, impact, sentiment, confidence, affected_symbols, keywords
+    
+    def _classify_news(self, hits: Counter) -> Tuple[NewsCategory, NewsImpact, float, float]:
         """
         Classify news into category, impact, sentiment, and confidence.
         
+        Args:
+            hits: Keyword counts per tag from _scan_keywords
+        
         Returns:
             (category, impact, sentiment_score, confidence)
         """
         # Fed/Monetary Policy Detection
-        if any(word in headline for word in ['fed', 'federal reserve', 'powell', 'fomc', 'interest rate']):
-            sentiment = self._calculate_fed_sentiment(headline)
+        if hits[NewsCategory.FED_POLICY]:
+            # Hawkish = bearish for stocks, dovish = bullish; neutral keywords
+            # halve the sentiment
+            sentiment = 0.3 * (hits['fed_dovish'] - hits['fed_hawkish']) * 0.5 ** hits['fed_neutral']
+            sentiment = max(-1.0, min(1.0, sentiment))
             impact = NewsImpact.HIGH if abs(sentiment) > 0.6 else NewsImpact.MODERATE
             return NewsCategory.FED_POLICY, impact, sentiment, 0.85
         
         # Earnings Detection
-        if any(word in headline for word in ['earnings', 'quarterly results', 'eps', 'revenue']):
-            sentiment = self._calculate_earnings_sentiment(headline)
+        if hits[NewsCategory.EARNINGS]:
+            sentiment = 0.4 * (hits['earnings_positive'] - hits['earnings_negative'])
+            sentiment = max(-1.0, min(1.0, sentiment))
             impact = NewsImpact.MODERATE if abs(sentiment) > 0.5 else NewsImpact.LOW
             return NewsCategory.EARNINGS, impact, sentiment, 0.75
         
         # Economic Data Detection
-        if any(word in headline for word in ['jobs report', 'unemployment', 'cpi', 'inflation', 
-                                             'gdp', 'retail sales', 'pmi']):
-            sentiment = self._calculate_economic_sentiment(headline)
+        if hits[NewsCategory.ECONOMIC_DATA]:
+            sentiment = 0.3 * (hits['economic_positive'] - hits['economic_negative'])
+            sentiment = max(-1.0, min(1.0, sentiment))
             impact = NewsImpact.HIGH if abs(sentiment) > 0.7 else NewsImpact.MODERATE
             return NewsCategory.ECONOMIC_DATA, impact, sentiment, 0.80
         
-        # Geopolitical Detection
-        if any(word in headline for word in ['war', 'election', 'sanctions', 'trade war', 
-                                             'tariffs', 'china', 'russia', 'geopolitical']):
-            sentiment, impact = self._calculate_geopolitical_sentiment(headline)
+        # Geopolitical Detection (most severe keyword wins)
+        if hits[NewsCategory.GEOPOLITICAL]:
+            if hits['geopolitical_critical']:
+                sentiment, impact = -0.9, NewsImpact.CRITICAL
+            elif hits['geopolitical_high']:
+                sentiment, impact = -0.6, NewsImpact.HIGH
+            elif hits['geopolitical_moderate']:
+                sentiment, impact = -0.4, NewsImpact.MODERATE
+            elif hits['geopolitical_low']:
+                sentiment, impact = 0.2, NewsImpact.LOW
+            else:
+                sentiment, impact = -0.3, NewsImpact.MODERATE  # Default: geopolitical = bearish
             return NewsCategory.GEOPOLITICAL, impact, sentiment, 0.70
         
         # Regulatory Detection
-        if any(word in headline for word in ['sec', 'regulation', 'investigation', 'lawsuit', 'fine']):
+        if hits[NewsCategory.REGULATORY]:
             sentiment = -0.3  # Regulatory news usually bearish
             return NewsCategory.REGULATORY, NewsImpact.MODERATE, sentiment, 0.65
         
         # Corporate Action Detection
-        if any(word in headline for word in ['merger', 'acquisition', 'bankruptcy', 'ceo', 
-                                             'executive', 'buyback', 'dividend']):
-            sentiment = self._calculate_corporate_sentiment(headline)
-            impact = NewsImpact.MODERATE if 'bankruptcy' in headline else NewsImpact.LOW
+        if hits[NewsCategory.CORPORATE_ACTION]:
+            if hits['corporate_bankruptcy'] or hits['corporate_negative']:
+                sentiment = -0.7
+            elif hits['corporate_deal']:
+                sentiment = 0.3
+            elif hits['corporate_shareholder_return']:
+                sentiment = 0.4
+            elif hits['corporate_executive_exit']:
+                sentiment = -0.2
+            else:
+                sentiment = 0.0
+            impact = NewsImpact.MODERATE if hits['corporate_bankruptcy'] else NewsImpact.LOW
             return NewsCategory.CORPORATE_ACTION, impact, sentiment, 0.70
         
         # Default: Sector News
         return NewsCategory.SECTOR_NEWS, NewsImpact.LOW, 0.0, 0.50
     
-    def _calculate_fed_sentiment(self, headline: str) -> float:
-        """Calculate sentiment for Fed/monetary policy news"""
-        sentiment = 0.0
-        
-        # Hawkish = bearish for stocks
-        for keyword in self.fed_keywords['hawkish']:
-            if keyword in headline:
-                sentiment -= 0.3
-        
-        # Dovish = bullish for stocks
-        for keyword in self.fed_keywords['dovish']:
-            if keyword in headline:
-                sentiment += 0.3
-        
-        # Neutral keywords reduce confidence but don't change sentiment
-        for keyword in self.fed_keywords['neutral']:
-            if keyword in headline:
-                sentiment *= 0.5
-        
-        return max(-1.0, min(1.0, sentiment))
-    
-    def _calculate_earnings_sentiment(self, headline: str) -> float:
-        """Calculate sentiment for earnings news"""
-        sentiment = 0.0
-        
-        for keyword in self.earnings_keywords['positive']:
-            if keyword in headline:
-                sentiment += 0.4
-        
-        for keyword in self.earnings_keywords['negative']:
-            if keyword in headline:
-                sentiment -= 0.4
-        
-        return max(-1.0, min(1.0, sentiment))
-    
-    def _calculate_economic_sentiment(self, headline: str) -> float:
-        """Calculate sentiment for economic data news"""
-        sentiment = 0.0
-        
-        for keyword in self.economic_keywords['positive']:
-            if keyword in headline:
-                sentiment += 0.3
-        
-        for keyword in self.economic_keywords['negative']:
-            if keyword in headline:
-                sentiment -= 0.3
-        
-        return max(-1.0, min(1.0, sentiment))
-    
-    def _calculate_geopolitical_sentiment(self, headline: str) -> Tuple[float, NewsImpact]:
-        """Calculate sentiment and impact for geopolitical news"""
-        for keyword in self.geopolitical_keywords['critical']:
-            if keyword in headline:
-                return -0.9, NewsImpact.CRITICAL
-        
-        for keyword in self.geopolitical_keywords['high']:
-            if keyword in headline:
-                return -0.6, NewsImpact.HIGH
-        
-        for keyword in self.geopolitical_keywords['moderate']:
-            if keyword in headline:
-                return -0.4, NewsImpact.MODERATE
-        
-        for keyword in self.geopolitical_keywords['low']:
-            if keyword in headline:
-                return 0.2, NewsImpact.LOW
-        
-        return -0.3, NewsImpact.MODERATE  # Default: geopolitical = bearish
-    
-    def _calculate_corporate_sentiment(self, headline: str) -> float:
-        """Calculate sentiment for corporate action news"""
-        if 'bankruptcy' in headline or 'layoffs' in headline:
-            return -0.7
-        elif 'merger' in headline or 'acquisition' in headline:
-            return 0.3
-        elif 'dividend' in headline or 'buyback' in headline:
-            return 0.4
-        elif 'ceo resign' in headline or 'cfo resign' in headline:
-            return -0.2
-        else:
-            return 0.0
-    
-    def _extract_symbols(self, headline: str) -> List[str]:
-        """Extract stock symbols mentioned in headline"""
-        # Simple pattern matching for common symbols
-        symbols = []
-        
-        # Common index symbols
-        if any(word in headline.lower() for word in ['s&p', 'sp500', 's&p 500']):
-            symbols.append('SPX')
-        if any(word in headline.lower() for word in ['dow', 'djia', 'dow jones']):
-            symbols.append('DJI')
-        if any(word in headline.lower() for word in ['nasdaq', 'ndx']):
-            symbols.append('NDX')
-        
-        # Company name to symbol mapping (subset)
-        company_map = {
-            'apple': 'AAPL', 'microsoft': 'MSFT', 'google': 'GOOGL', 
-            'amazon': 'AMZN', 'tesla': 'TSLA', 'meta': 'META',
-            'nvidia': 'NVDA', 'netflix': 'NFLX'
-        }
-        
-        for company, symbol in company_map.items():
-            if company in headline.lower():
-                symbols.append(symbol)
+    def _extract_symbols(self, headline_lower: str) -> Tuple[str, ...]:
+        """Extract stock symbols mentioned in a lowercased headline"""
+        found = {_SYMBOL_NAMES[name] for name in _SYMBOL_RE.findall(headline_lower)}
+        if not found:
+            return ('MARKET',)
+        return tuple(symbol for symbol in _SYMBOLS if symbol in found)
+    
+    def _extract_keywords(self, headline: str) -> Tuple[str, ...]:
+        """Extract important keywords from a lowercased headline (interned)"""
+        # Tokenize and drop common words
+        keywords = [word for word in _TOKEN_RE.findall(headline)
+                    if len(word) > 3 and word not in _STOP_WORDS]
         
-        return symbols if symbols else ['MARKET']
+        return tuple(map(sys.intern, keywords[:10]))  # Top 10 keywords
     
-    def _extract_keywords(self, headline: str) -> List[str]:
-        """Extract important keywords from headline"""
-        # Remove common words
-        stop_words = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 
-                     'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'were'}
+    async def fetch_all(self, urls: List[str], timeout: float = 5.0) -> List[NewsEvent]:
+        """
+        Fetch RSS/Atom feeds concurrently and analyze every headline.
         
-        # Tokenize and filter
-        words = re.findall(r'\b\w+\b', headline.lower())
-        keywords = [word for word in words if word not in stop_words and len(word) > 3]
+        Feeds are requested in parallel, so the wait is the slowest feed
+        rather than the sum of all of them. Feeds that fail are logged and
+        skipped.
+        
+        Args:
+            urls: Feed URLs
+            timeout: Per-feed timeout in seconds
+            
+        Returns:
+            One NewsEvent per headline, in feed order (not added to history)
+        """
+        async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=timeout)) as session:
+            feeds = await asyncio.gather(
+                *(self._fetch_one(session, url) for url in urls),
+                return_exceptions=True
+            )
         
-        return keywords[:10]  # Top 10 keywords
+        events = []
+        for url, feed in zip(urls, feeds):
+            if isinstance(feed, Exception):
+                logger.warning(f"⚠️ Failed to fetch news feed {url}: {feed}")
+                continue
+            try:
+                headlines = self._parse_rss(feed)
+            except _FEED_PARSE_ERRORS as e:
+                # e.g. an HTML error page or a truncated body served with 200
+                logger.warning(f"⚠️ Failed to parse news feed {url}: {e}")
+                continue
+            source = urlparse(url).netloc or url
+            for headline in headlines:
+                events.append(self.analyze_news_headline(headline, source))
+        return events
+    
+    def fetch_all_sync(self, urls: List[str], timeout: float = 5.0) -> List[NewsEvent]:
+        """Blocking wrapper around fetch_all for callers without an event loop"""
+        return asyncio.run(self.fetch_all(urls, timeout))
+    
+    async def _fetch_one(self, session: aiohttp.ClientSession, url: str) -> bytes:
+        """Download one feed"""
+        async with session.get(url) as response:
+            response.raise_for_status()
+            return await response.read()
+    
+    def _parse_rss(self, xml_bytes: bytes) -> List[str]:
+        """
+        Headlines (item/entry titles) from an RSS or Atom feed.
+        
+        Streams the feed and clears each item once its title is read, so the
+        whole document tree is never held in memory. Uses lxml (libxml2) when
+        it is installed, the stdlib ElementTree otherwise.
+        """
+        if lxml_etree is not None:
+            items = lxml_etree.iterparse(BytesIO(xml_bytes), events=('end',), tag=_FEED_ITEM_TAGS)
+        else:
+            items = ET.iterparse(BytesIO(xml_bytes), events=('end',))
+        
+        headlines = []
+        for _, element in items:
+            if element.tag not in _FEED_ITEM_TAGS:
+                continue
+            for child in element:
+                if child.tag in _FEED_TITLE_TAGS:
+                    if child.text and child.text.strip():
+                        headlines.append(child.text.strip())
+                    break
+            element.clear()
+        return headlines
     
     def add_news_event(self, event: NewsEvent):
         """Add a news event to history"""
-        self.news_history.append(event)
-        self._save_history()
+        self._ensure_loaded()
+        self._record_event(event)
+        self._append_history(event)
+    
+    @staticmethod
+    def _symbol_bitmap(affected_symbols: Tuple[str, ...]) -> int:
+        """Symbol bitmap of an event (never zero, so a -1 mask selects every event)"""
+        bitmap = 0
+        for symbol in affected_symbols:
+            bitmap |= _SYMBOL_BITS.get(symbol, _OTHER_SYMBOL_BIT)
+        return bitmap or _OTHER_SYMBOL_BIT
+    
+    def _record_event(self, event: NewsEvent):
+        """Append an event to news_history and its struct-of-arrays columns"""
+        n = self._n_events
+        if n == self._ts.shape[0]:
+            capacity = max(64, 2 * n)
+            self._ts = np.resize(self._ts, capacity)
+            self._ts_max = np.resize(self._ts_max, capacity)
+            self._sent = np.resize(self._sent, capacity)
+            self._imp = np.resize(self._imp, capacity)
+            self._conf = np.resize(self._conf, capacity)
+            self._symbols = np.resize(self._symbols, capacity)
+        
+        self._ts[n] = _to_ns(event.timestamp)
+        self._ts_max[n] = max(self._ts[n], self._ts_max[n - 1]) if n else self._ts[n]
+        self._sent[n] = event.sentiment_score
+        self._imp[n] = event.impact
+        self._conf[n] = event.confidence
+        self._symbols[n] = self._symbol_bitmap(event.affected_symbols)
+        self._n_events = n + 1
+        self._events.append(event)
+        self._version += 1
     
     def get_current_sentiment(self, symbol: Optional[str] = None) -> SentimentAnalysis:
         """
         Get current overall sentiment analysis.
         
+        Repeated queries return the same (shared, treat as read-only) result
+        until a news event is added or SENTIMENT_CACHE_SECONDS have passed.
+        
         Args:
             symbol: Specific symbol to analyze (None = overall market)
             
         Returns:
             SentimentAnalysis with recommendations
         """
-        # Filter recent events (within history_hours)
-        cutoff_time = datetime.now(timezone.utc) - timedelta(hours=self.history_hours)
-        recent_events = [e for e in self.news_history if e.timestamp > cutoff_time]
-        
-        # Filter by symbol if specified
-        if symbol:
-            recent_events = [e for e in recent_events 
-                           if symbol in e.affected_symbols or 'MARKET' in e.affected_symbols]
+        self._ensure_loaded()
+        return self._sentiment_cached(
+            symbol, self._version, time.time_ns() // self._sentiment_cache_ns
+        )
+    
+    def _sentiment_for(self, symbol: Optional[str], version: int, epoch: int) -> SentimentAnalysis:
+        """Sentiment reduction behind get_current_sentiment (version and epoch key the cache)"""
+        # Filter recent events (within history_hours). Every event before the
+        # first running-max timestamp past the cutoff is older than the cutoff,
+        # so the window starts at a binary-searched index (exact even when
+        # backfilled events arrive out of order)
+        history = self.news_history
+        n = self._n_events
+        now_ns = time.time_ns()
+        cutoff_ns = now_ns - int(self.history_hours * _NS_PER_HOUR)
+        start = int(np.searchsorted(self._ts_max[:n], cutoff_ns, side='right'))
+        
+        # Filter by symbol if specified (events for the symbol or the whole market)
+        symbols = self._symbols[start:n]
+        if not symbol:
+            symbol_mask = -1
+        elif symbol in _SYMBOL_BITS:
+            symbol_mask = _SYMBOL_BITS[symbol] | _SYMBOL_BITS['MARKET']
+        else:
+            # Symbol outside the bitmap table: test each event directly
+            symbols = np.fromiter(
+                (symbol in e.affected_symbols or 'MARKET' in e.affected_symbols
+                 for e in history[start:]),
+                dtype=np.int64, count=n - start
+            )
+            symbol_mask = 1
+        
+        # Weight by impact and recency (more recent = higher weight), scaled by
+        # confidence; counts and highest impact in the same pass
+        (total_weighted_sentiment, total_weight, bullish_count, bearish_count,
+         neutral_count, highest_code, count) = reduce_sentiment(
+            self._ts[start:n], self._sent[start:n], self._imp[start:n], self._conf[start:n],
+            symbols, symbol_mask,
+            now_ns, cutoff_ns, float(self.history_hours), _IMPACT_WEIGHTS, self._recent_idx
+        )
         
-        if not recent_events:
+        if count == 0:
             # No recent news - neutral
             return SentimentAnalysis(
                 overall_sentiment=0.0,
@@ -430,77 +757,18 @@ class NewsSentimentEngine:
                 risk_score=0.0
             )
         
-        # Calculate overall sentiment (weighted by impact and recency)
-        total_weighted_sentiment = 0.0
-        total_weight = 0.0
-        bullish_count = 0
-        bearish_count = 0
-        neutral_count = 0
-        highest_impact = NewsImpact.NEUTRAL
-        
-        for event in recent_events:
-            # Weight by impact
-            impact_weight = {
-                NewsImpact.CRITICAL: 5.0,
-                NewsImpact.HIGH: 3.0,
-                NewsImpact.MODERATE: 1.5,
-                NewsImpact.LOW: 0.5,
-                NewsImpact.NEUTRAL: 0.1
-            }[event.impact]
-            
-            # Weight by recency (more recent = higher weight)
-            hours_ago = (datetime.now(timezone.utc) - event.timestamp).total_seconds() / 3600
-            recency_weight = max(0.1, 1.0 - (hours_ago / self.history_hours))
-            
-            # Combined weight
-            weight = impact_weight * recency_weight * event.confidence
-            
-            total_weighted_sentiment += event.sentiment_score * weight
-            total_weight += weight
-            
-            # Count by sentiment
-            if event.sentiment_score > 0.2:
-                bullish_count += 1
-            elif event.sentiment_score < -0.2:
-                bearish_count += 1
-            else:
-                neutral_count += 1
-            
-            # Track highest impact
-            impact_order = [NewsImpact.CRITICAL, NewsImpact.HIGH, NewsImpact.MODERATE, 
-                          NewsImpact.LOW, NewsImpact.NEUTRAL]
-            if impact_order.index(event.impact) < impact_order.index(highest_impact):
-                highest_impact = event.impact
-        
         # Calculate overall sentiment
         overall_sentiment = total_weighted_sentiment / total_weight if total_weight > 0 else 0.0
+        highest_impact = NewsImpact(highest_code)
+        
+        # Last N_RECENT matching events, oldest first (unrolled from the ring)
+        recent_events = [
+            history[start + self._recent_idx[k % N_RECENT]]
+            for k in range(max(0, count - N_RECENT), count)
+        ]
         
         # Determine recommended action
-        if highest_impact == NewsImpact.CRITICAL:
-            action = 'HALT'
-            multiplier = 0.0
-            penalty = 0.0
-            risk_score = 1.0
-        elif highest_impact == NewsImpact.HIGH:
-            action = 'REDUCE_70'
-            multiplier = 0.3
-            penalty = 0.5
-            risk_score = 0.8
-        elif highest_impact == NewsImpact.MODERATE:
-            action = 'REDUCE_30'
-            multiplier = 0.7
-            penalty = 0.85
-            risk_score = 0.5
-        elif highest_impact == NewsImpact.LOW:
-            action = 'REDUCE_10'
-            multiplier = 0.9
-            penalty = 0.95
-            risk_score = 0.2
-        else:
-            action = 'CONTINUE'
-            multiplier = 1.0
-            penalty = 1.0
-            risk_score = 0.0
+        action, multiplier, penalty, risk_score = _ACTION_TABLE[highest_impact]
         
         # Adjust based on sentiment
         if overall_sentiment < -0.5 and action == 'CONTINUE':
@@ -518,51 +786,95 @@ class NewsSentimentEngine:
             recommended_action=action,
             position_multiplier=multiplier,
             confidence_penalty=penalty,
-            recent_events=recent_events[-10:],  # Last 10 events
+            recent_events=recent_events,  # Last 10 events
             risk_score=risk_score
         )
     
-    def _save_history(self):
-        """Save news history to disk"""
+    def _append_history(self, event: NewsEvent):
+        """Append one event to the history log (flushed every FLUSH_EVERY events)"""
         try:
-            history_file = self.data_dir / "news_history.json"
-            
-            # Convert to serializable format
-            history_data = [event.to_dict() for event in self.news_history[-1000:]]  # Keep last 1000
-            
-            with open(history_file, 'w') as f:
-                json.dump(history_data, f, indent=2)
+            if self._history_log is None:
+                self.data_dir.mkdir(parents=True, exist_ok=True)
+                self._history_log = open(self.history_file, "ab", buffering=1 << 16)
+                # Events still buffered at interpreter exit are written out
+                atexit.register(self.close)
+            self._history_log.write(_dumps_event(event.to_dict()))
+            self._unflushed += 1
+            if self._unflushed >= self.FLUSH_EVERY:
+                self.flush()
         except Exception as e:
             logger.warning(f"Failed to save news history: {e}")
     
+    def flush(self):
+        """Flush buffered history events to disk"""
+        if self._unflushed:
+            self._history_log.flush()
+            os.fsync(self._history_log.fileno())
+            self._unflushed = 0
+    
+    def close(self):
+        """Flush and close the history log (reopened by the next write)"""
+        if self._history_log is not None:
+            self.flush()
+            self._history_log.close()
+            self._history_log = None
+            atexit.unregister(self.close)
+    
+    def _compact_history(self, history_data: List[Dict]):
+        """Atomically rewrite the history log with the last MAX_HISTORY_EVENTS events"""
+        tmp_file = self.history_file.with_suffix(".jsonl.tmp")
+        tmp_file.write_bytes(b"".join(
+            _dumps_event(event_dict) for event_dict in history_data[-self.MAX_HISTORY_EVENTS:]
+        ))
+        os.replace(tmp_file, self.history_file)
+    
     def _load_history(self):
         """Load news history from disk"""
+        self._sentiment_cached.cache_clear()
         try:
-            history_file = self.data_dir / "news_history.json"
-            
-            if not history_file.exists():
-                return
-            
-            with open(history_file, 'r') as f:
-                history_data = json.load(f)
+            history_data = []
+            if self.history_file.exists():
+                torn = False
+                with open(self.history_file, 'rb') as f:
+                    for line in f:
+                        try:
+                            history_data.append(_loads_event(line))
+                        except ValueError:
+                            # Torn final line from an interrupted write
+                            torn = True
+                            break
+                # Rewriting also drops a torn line, so later appends start clean
+                if torn or len(history_data) > self.COMPACT_THRESHOLD:
+                    self._compact_history(history_data)
+            else:
+                # Migrate the JSON array written by earlier versions
+                legacy_file = self.data_dir / "news_history.json"
+                if not legacy_file.exists():
+                    return
+                with open(legacy_file, 'r') as f:
+                    history_data = json.load(f)
+                self._compact_history(history_data)
             
-            # Convert back to NewsEvent objects
-            for event_dict in history_data:
+            # Convert back to NewsEvent objects (last MAX_HISTORY_EVENTS only);
+            # timestamps are ns since epoch, or ISO strings in older files
+            for event_dict in history_data[-self.MAX_HISTORY_EVENTS:]:
+                timestamp = event_dict['timestamp']
                 event = NewsEvent(
-                    timestamp=datetime.fromisoformat(event_dict['timestamp']),
+                    timestamp=(_from_ns(timestamp) if isinstance(timestamp, int)
+                               else datetime.fromisoformat(timestamp)),
                     headline=event_dict['headline'],
                     source=event_dict['source'],
                     category=NewsCategory[event_dict['category']],
                     impact=NewsImpact[event_dict['impact']],
                     sentiment_score=event_dict['sentiment_score'],
-                    affected_symbols=event_dict['affected_symbols'],
+                    affected_symbols=tuple(map(sys.intern, event_dict['affected_symbols'])),
                     confidence=event_dict['confidence'],
                     raw_text=event_dict.get('headline', ''),
-                    keywords=event_dict.get('keywords', [])
+                    keywords=tuple(map(sys.intern, event_dict.get('keywords', ())))
                 )
-                self.news_history.append(event)
+                self._record_event(event)
             
-            logger.info(f"   📰 Loaded {len(self.news_history)} historical news events")
+            logger.info(f"   📰 Loaded {len(self._events)} historical news events")
         except Exception as e:
             logger.warning(f"Failed to load news history: {e}")
 
@@ -602,7 +914,7 @@ def test_news_sentiment_engine():
         print(f"Headline: {headline}")
         print(f"  Source: {source}")
         print(f"  Category: {event.category.value}")
-        print(f"  Impact: {event.impact.value}")
+        print(f"  Impact: {event.impact.name}")
         print(f"  Sentiment: {event.sentiment_score:+.2f} ({'BULLISH' if event.sentiment_score > 0 else 'BEARISH'})")
         print(f"  Confidence: {event.confidence:.1%}")
         print(f"  Affected: {', '.join(event.affected_symbols)}")
@@ -620,7 +932,7 @@ def test_news_sentiment_engine():
     print(f"   Bullish Events: {sentiment.bullish_events}")
     print(f"   Bearish Events: {sentiment.bearish_events}")
     print(f"   Neutral Events: {sentiment.neutral_events}")
-    print(f"   Highest Impact: {sentiment.highest_impact.value}")
+    print(f"   Highest Impact: {sentiment.highest_impact.name}")
     print(f"   Risk Score: {sentiment.risk_score:.2f}")
     print(f"\n🎬 RECOMMENDED ACTION: {sentiment.recommended_action}")
     print(f"   Position Multiplier: {sentiment.position_multiplier:.1%}")
@@ -628,7 +940,9 @@ def test_news_sentiment_engine():
     
     print(f"\n📰 Recent Events ({len(sentiment.recent_events)}):")
     for event in sentiment.recent_events[-5:]:
-        print(f"   [{event.impact.value:8}] {event.headline[:60]}")
+        print(f"   [{event.impact.name:8}] {event.headline[:60]}")
+    
+    engine.close()
     
     print("\n" + "="*70)
     print("✅ NEWS SENTIMENT ENGINE TEST COMPLETE")
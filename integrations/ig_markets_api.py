@@ -4,13 +4,39 @@ Full API wrapper for IG Markets trading platform (SPREAD BETTING - NO CFD)
 """
 
 import asyncio
+import copy
+import json
+import ssl
+import time
 import aiohttp
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 from datetime import datetime
 import logging
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Loading the CA bundle is slow; every session shares one TLS context
+_SSL_CONTEXT = ssl.create_default_context()
+
+
+def _dumps(payload: Dict) -> bytes:
+    """Encode a request body as compact JSON (orjson when available)"""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, separators=(",", ":")).encode()
+
+
+def _loads(body: Union[bytes, str]) -> Any:
+    """Decode a response body (orjson when available)"""
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
+
 
 class IGMarketsAPI:
     """
@@ -22,6 +48,21 @@ class IGMarketsAPI:
     - Market data
     - Position management (Spread Betting only)    """
     
+    # Pooled keep-alive connections to the gateway, so requests after the first
+    # skip the TCP and TLS handshakes
+    CONNECTIONS_PER_HOST = 64
+    KEEPALIVE_SECONDS = 75
+    DNS_CACHE_SECONDS = 300
+    
+    # Per-request timeouts (seconds). Reads fail fast rather than trade on
+    # stale state; login and order POSTs get longer, since giving up on an
+    # order the gateway is still filling would report a live deal as failed
+    REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=2.0, connect=0.3, sock_read=1.5)
+    ORDER_TIMEOUT = aiohttp.ClientTimeout(total=15.0, connect=3.0)
+    
+    # Open positions are reused for this long (seconds) after a fetch
+    POSITIONS_TTL = 0.25
+    
     def __init__(
         self,
         api_key: str,
@@ -47,6 +88,18 @@ class IGMarketsAPI:
         self.client_token = None
         self.session: Optional[aiohttp.ClientSession] = None
         self.authenticated = False
+        
+        # Request headers per API version, rebuilt when the tokens change
+        self._headers: Dict[str, Dict[str, str]] = {}
+        
+        # Open positions from the last fetch, indexed by deal ID. Concurrent
+        # callers share one in-flight fetch; the generation is bumped when a
+        # deal changes the positions, so fetches started earlier are discarded
+        self._positions: List[Dict] = []
+        self._positions_by_deal: Dict[str, Dict] = {}
+        self._positions_time = 0.0
+        self._positions_task: Optional[asyncio.Task] = None
+        self._positions_generation = 0
 
     async def close_session(self):
         """
@@ -62,8 +115,16 @@ class IGMarketsAPI:
         """
         logger.info("🔌 Connecting to IG Markets API...")
 
-        # Create session
-        self.session = aiohttp.ClientSession()
+        # Create session (one connection pool for the lifetime of the API)
+        connector = aiohttp.TCPConnector(
+            limit=0,
+            limit_per_host=self.CONNECTIONS_PER_HOST,
+            ttl_dns_cache=self.DNS_CACHE_SECONDS,
+            keepalive_timeout=self.KEEPALIVE_SECONDS,
+            enable_cleanup_closed=True,
+            ssl=_SSL_CONTEXT
+        )
+        self.session = aiohttp.ClientSession(connector=connector, timeout=self.REQUEST_TIMEOUT)
 
         try:
             # Authenticate
@@ -91,13 +152,17 @@ class IGMarketsAPI:
         }
         
         try:
-            async with self.session.post(url, json=payload, headers=headers) as response:
+            async with self.session.post(
+                url, data=_dumps(payload), headers=headers, timeout=self.ORDER_TIMEOUT
+            ) as response:
                 if response.status == 200:
                     # Store security tokens
-                    self.security_token = response.headers.get('CST')
-                    self.client_token = response.headers.get('X-SECURITY-TOKEN')
+                    self._set_tokens(
+                        response.headers.get('CST'),
+                        response.headers.get('X-SECURITY-TOKEN')
+                    )
                     
-                    data = await response.json()
+                    data = _loads(await response.read())
                     logger.info(f"✅ Authenticated as {self.username}")
                     self.authenticated = True
                     return data
@@ -110,27 +175,41 @@ class IGMarketsAPI:
             logger.error(f"❌ Authentication error: {e}")
             raise
 
-    def _get_headers(self) -> Dict:
-        """Get request headers with auth tokens"""
-        return {
-            'X-IG-API-KEY': self.api_key,
-            'CST': self.security_token,
-            'X-SECURITY-TOKEN': self.client_token,
-            'Content-Type': 'application/json',
-            'Accept': 'application/json',
-            'Version': '2'
-        }
+    def _set_tokens(self, security_token: Optional[str], client_token: Optional[str]):
+        """Store the session tokens, dropping cached headers if they rotated"""
+        if (security_token, client_token) != (self.security_token, self.client_token):
+            self.security_token = security_token
+            self.client_token = client_token
+            self._headers.clear()
+    
+    def _get_headers(self, version: str = '2') -> Dict:
+        """
+        Get request headers with auth tokens for an API version.
+        
+        The dict is cached and shared between requests; copy it before
+        adding request-specific headers.
+        """
+        headers = self._headers.get(version)
+        if headers is None:
+            headers = self._headers[version] = {
+                'X-IG-API-KEY': self.api_key,
+                'CST': self.security_token,
+                'X-SECURITY-TOKEN': self.client_token,
+                'Content-Type': 'application/json',
+                'Accept': 'application/json',
+                'Version': version
+            }
+        return headers
     
     async def get_account_info(self) -> Dict:
         """Get account information"""
         url = f"{self.base_url}/accounts"
-        headers = self._get_headers()
-        headers['Version'] = '1'  # Use Version 1 for accounts endpoint
+        headers = self._get_headers('1')  # Use Version 1 for accounts endpoint
         
         try:
             async with self.session.get(url, headers=headers) as response:
                 if response.status == 200:
-                    data = await response.json()
+                    data = _loads(await response.read())
                     logger.debug(f"Account info: {data}")
                     return data
                 else:
@@ -145,14 +224,13 @@ class IGMarketsAPI:
     async def get_market_data(self, epic: str) -> Dict:
         """Get market data for an instrument"""
         url = f"{self.base_url}/markets/{epic}"
-        headers = self._get_headers()
-        headers['Version'] = '3'  # Use Version 3 for markets endpoint
+        headers = self._get_headers('3')  # Use Version 3 for markets endpoint
         logger.debug(f"Getting market data for {epic}")
         
         try:
             async with self.session.get(url, headers=headers) as response:
                 if response.status == 200:
-                    data = await response.json()
+                    data = _loads(await response.read())
                     logger.debug(f"Market data for {epic}: {data}")
                     return data
                 else:
@@ -175,8 +253,7 @@ class IGMarketsAPI:
             Trade status details including dealStatus and reason.
         """
         url = f"{self.base_url}/confirms/{deal_reference}"
-        headers = self._get_headers()
-        headers['Version'] = '1'  # Use Version 1 for confirms
+        headers = self._get_headers('1')  # Use Version 1 for confirms
 
         try:
             async with self.session.get(url, headers=headers) as response:
@@ -184,7 +261,7 @@ class IGMarketsAPI:
                 logger.info(f"Trade status response: {response_text}")
 
                 if response.status == 200:
-                    data = await response.json()
+                    data = _loads(response_text)
                     deal_status = data.get('dealStatus', 'UNKNOWN')
                     reason = data.get('reason', '')
                     
@@ -269,14 +346,17 @@ class IGMarketsAPI:
         logger.debug(f"Payload: {payload}")
         
         try:
-            async with self.session.post(url, json=payload, headers=headers) as response:
+            async with self.session.post(
+                url, data=_dumps(payload), headers=headers, timeout=self.ORDER_TIMEOUT
+            ) as response:
                 response_text = await response.text()
                 logger.info(f"API Response: {response_text}")
 
                 if response.status == 200:
-                    data = await response.json()
+                    data = _loads(response_text)
                     deal_ref = data.get('dealReference')
                     logger.info(f"✅ Position opened: {deal_ref}")
+                    self._invalidate_positions()
 
                     # Verify trade status
                     trade_status = await self.verify_trade_status(deal_ref)
@@ -303,8 +383,8 @@ class IGMarketsAPI:
         Returns:
             Deal reference and confirmation
         """
-        # Get position details first
-        position = await self.get_position(deal_id)
+        # Get position details first (read only, so the cached copy will do)
+        position = await self._cached_position(deal_id)
         if not position:
             logger.error(f"❌ Position {deal_id} not found")
             return {}
@@ -321,19 +401,20 @@ class IGMarketsAPI:
         }
         
         try:
-            headers = self._get_headers()
-            headers['_method'] = 'DELETE'
-            headers['Version'] = '1'
+            headers = {**self._get_headers('1'), '_method': 'DELETE'}
             
             logger.info(f"Closing position {deal_id} with payload: {payload}")
             
-            async with self.session.post(url, json=payload, headers=headers) as response:
+            async with self.session.post(
+                url, data=_dumps(payload), headers=headers, timeout=self.ORDER_TIMEOUT
+            ) as response:
                 response_text = await response.text()
                 logger.info(f"Close response ({response.status}): {response_text}")
                 
                 if response.status == 200:
-                    data = await response.json()
+                    data = _loads(response_text)
                     logger.info(f"✅ Position closed: {deal_id}")
+                    self._invalidate_positions()
                     return data
                 else:
                     logger.error(f"❌ Close position failed (Status {response.status}): {response_text}")
@@ -344,35 +425,81 @@ class IGMarketsAPI:
             return {}
 
     async def get_positions(self) -> List[Dict]:
-        """Get all open positions"""
+        """
+        Get all open positions.
+        
+        A fetch less than POSITIONS_TTL seconds old is reused, and callers
+        arriving while a fetch is in flight wait for that fetch rather than
+        starting another. Each caller gets its own copy of the positions.
+        """
+        return copy.deepcopy(await self._cached_positions())
+    
+    async def _cached_positions(self) -> List[Dict]:
+        """The open positions as cached (shared between callers; do not modify)"""
+        if time.monotonic() - self._positions_time > self.POSITIONS_TTL:
+            task = self._positions_task
+            if task is None or task.done():
+                task = self._positions_task = asyncio.create_task(self._fetch_positions())
+            # Shielded: one cancelled caller must not cancel the shared fetch
+            return await asyncio.shield(task)
+        return self._positions
+    
+    async def _fetch_positions(self) -> List[Dict]:
+        """Fetch the open positions and cache them, indexed by deal ID"""
         url = f"{self.base_url}/positions"
+        generation = self._positions_generation
+        positions = []
+        fetched = False
         
         try:
             async with self.session.get(url, headers=self._get_headers()) as response:
                 if response.status == 200:
-                    data = await response.json()
+                    data = _loads(await response.read())
                     positions = data.get('positions', [])
+                    fetched = True
                     logger.debug(f"Open positions: {len(positions)}")
-                    return positions
                 else:
                     error = await response.text()
                     logger.error(f"❌ Get positions error: {error}")
-                    return []
                     
         except Exception as e:
             logger.error(f"❌ Get positions exception: {e}")
-            return []
+        
+        # Not cached if a deal went through meanwhile (the next caller
+        # refetches); failed fetches are not reused either
+        if generation == self._positions_generation:
+            self._positions = positions
+            self._positions_by_deal = {
+                position.get('position', {}).get('dealId'): position for position in positions
+            }
+            self._positions_time = time.monotonic() if fetched else 0.0
+        return positions
+    
+    def _invalidate_positions(self):
+        """Drop the cached positions after a deal changed them"""
+        self._positions_generation += 1
+        self._positions_time = 0.0
+        self._positions_task = None
     
     async def get_position(self, deal_id: str) -> Optional[Dict]:
-        """Get specific position details by deal ID"""
-        positions = await self.get_positions()
-        
-        for position in positions:
-            if position.get('position', {}).get('dealId') == deal_id:
-                return position
+        """Get specific position details by deal ID (a copy of the cached position)"""
+        position = await self._cached_position(deal_id)
+        return copy.deepcopy(position)
+    
+    async def _cached_position(self, deal_id: str) -> Optional[Dict]:
+        """The cached position for a deal ID (shared between callers; do not modify)"""
+        positions = await self._cached_positions()
         
-        logger.warning(f"Position {deal_id} not found")
-        return None
+        if positions is self._positions:
+            position = self._positions_by_deal.get(deal_id)
+        else:
+            # Fetch raced with a deal and was not cached (and not indexed)
+            position = next(
+                (p for p in positions if p.get('position', {}).get('dealId') == deal_id), None
+            )
+        if position is None:
+            logger.warning(f"Position {deal_id} not found")
+        return position
 
     async def get_trade_history(self, days: int = 7) -> Dict:
         """
@@ -393,7 +520,7 @@ class IGMarketsAPI:
                 logger.info(f"Trade history response: {response_text}")
 
                 if response.status == 200:
-                    data = await response.json()
+                    data = _loads(response_text)
                     logger.info(f"✅ Trade history retrieved: {data}")
                     return data
                 else:
@@ -39,8 +39,7 @@ async def main():
     # 2. Check open positions
     print(f"\n{'='*60}")
     print("2. OPEN POSITIONS:")
-    headers = api._get_headers()
-    headers['Version'] = '2'
+    headers = api._get_headers('2')
     
     async with api.session.get(f"{api.base_url}/positions", headers=headers) as response:
         positions_data = await response.json()
@@ -49,8 +48,7 @@ async def main():
     # 3. Check activity/history
     print(f"\n{'='*60}")
     print("3. RECENT ACTIVITY:")
-    headers = api._get_headers()
-    headers['Version'] = '3'
+    headers = api._get_headers('3')
     
     async with api.session.get(f"{api.base_url}/history/activity", headers=headers) as response:
         activity_data = await response.json()
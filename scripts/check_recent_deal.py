@@ -37,8 +37,7 @@ async def main():
     
     # Get deal confirmation with all details
     url = f"{api.base_url}/confirms/{deal_ref}"
-    headers = api._get_headers()
-    headers['Version'] = '1'  # Use version 1 for confirms
+    headers = api._get_headers('1')  # Use version 1 for confirms
     
     async with api.session.get(url, headers=headers) as response:
         status = response.status
@@ -57,8 +56,7 @@ async def main():
     # Also check positions
     print(f"\n{'='*60}")
     print("CURRENT POSITIONS:")
-    headers = api._get_headers()
-    headers['Version'] = '2'
+    headers = api._get_headers('2')
     
     async with api.session.get(f"{api.base_url}/positions", headers=headers) as response:
         positions_data = await response.json()
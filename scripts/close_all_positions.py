@@ -40,7 +40,14 @@ async def close_all_positions():
     
     print(f"📊 Found {len(positions)} open position(s)")
     
-    for i, pos_data in enumerate(positions, 1):
+    # Close all positions concurrently (wall time of the slowest close, not the sum)
+    deal_ids = [pos_data['position']['dealId'] for pos_data in positions]
+    results = await asyncio.gather(
+        *(api.close_position(deal_id) for deal_id in deal_ids),
+        return_exceptions=True
+    )
+    
+    for i, (pos_data, result) in enumerate(zip(positions, results), 1):
         deal_id = pos_data['position']['dealId']
         size = pos_data['position']['size']
         direction = pos_data['position']['direction']
@@ -53,10 +60,7 @@ async def close_all_positions():
         print(f"   Size: £{size}/point")
         print(f"   Entry: {level}")
         
-        print(f"   🔄 Closing position...")
-        result = await api.close_position(deal_id)
-        
-        if result and result.get('dealReference'):
+        if isinstance(result, dict) and result.get('dealReference'):
             print(f"   ✅ Position closed! Deal reference: {result['dealReference']}")
         else:
             print(f"   ❌ Failed to close position")
@@ -36,8 +36,7 @@ async def test_with_actual_size():
         'orderType': 'MARKET',
         'size': 0.5
     }
-    headers = api._get_headers()
-    headers['_method'] = 'DELETE'
+    headers = {**api._get_headers(), '_method': 'DELETE'}
     
     async with api.session.post(close_url, json=close_payload, headers=headers) as response:
         print(f"Close status: {response.status}")
@@ -85,8 +84,7 @@ async def test_with_actual_size():
             
             print(f"\nChecking deal confirmation for: {deal_ref}")
             conf_url = f"{api.base_url}/confirms/{deal_ref}"
-            conf_headers = api._get_headers()
-            conf_headers['Version'] = '1'
+            conf_headers = api._get_headers('1')
             
             async with api.session.get(conf_url, headers=conf_headers) as conf_response:
                 conf_status = conf_response.status
@@ -0,0 +1,251 @@
+"""
+Unit tests for the Bayesian-Monte Carlo hybrid model.
+
+Checks the fast GP prediction path and its cache against sklearn, the
+specialised RBF kernels (numba and the NumPy/BLAS fallback), and the Monte
+Carlo scenarios and risk statistics against their NumPy/scipy definitions.
+"""
+
+import sys
+import os
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+from scipy import stats
+from sklearn.gaussian_process.kernels import RBF, Matern, RationalQuadratic
+
+# Add the project root to the path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.models import hybrid_model
+from core.models.hybrid_model import (
+    BayesianGaussianProcess,
+    HybridPredictionModel,
+    MonteCarloSimulator,
+    _build_rbf_cross_kernel,
+    _build_rbf_cross_kernel_blas,
+    _moments,
+)
+
+
+@pytest.fixture(params=["numba", "blas"])
+def kernel_backend(request, monkeypatch):
+    """Specialise the GP kernel with numba, then with the NumPy/BLAS fallback"""
+    if request.param == "numba":
+        if hybrid_model.njit is None:
+            pytest.skip("numba is not installed")
+    else:
+        monkeypatch.setattr(hybrid_model, "njit", None)
+    return request.param
+
+
+def _training_data(seed=0, n=40):
+    rng = np.random.default_rng(seed)
+    X = rng.uniform(-2, 2, (n, 3))
+    y = np.sin(X).sum(axis=1) + rng.normal(0, 0.05, n)
+    return X, y
+
+
+def _fitted_gp(**kwargs):
+    gp = BayesianGaussianProcess(n_restarts_optimizer=0, **kwargs)
+    gp.fit(*_training_data())
+    return gp
+
+
+def _queries(n=7, seed=1):
+    return np.random.default_rng(seed).uniform(-2, 2, (n, 3))
+
+
+class TestGaussianProcess:
+    """predict_fast and the prediction cache agree with sklearn"""
+
+    def test_predict_fast_matches_sklearn(self, kernel_backend):
+        gp = _fitted_gp()
+        X = _queries()
+
+        mean, std = gp.predict_fast(X)
+        expected_mean, expected_std = gp.gp.predict(X, return_std=True)
+
+        assert gp._k_fn is not None
+        assert mean.dtype == std.dtype == np.float64
+        assert np.allclose(mean, expected_mean, rtol=0, atol=1e-13)
+        assert np.allclose(std, expected_std, rtol=0, atol=1e-13)
+
+    def test_predict_fast_float64_from_float32_inputs(self, kernel_backend):
+        X, y = _training_data()
+        gp = BayesianGaussianProcess(n_restarts_optimizer=0)
+        gp.fit(X.astype(np.float32), y.astype(np.float32))
+
+        mean, std = gp.predict_fast(_queries().astype(np.float32))
+        assert mean.dtype == std.dtype == np.float64
+
+    @pytest.mark.parametrize("kernel", [RationalQuadratic(), Matern(nu=1.5)], ids=["rq", "matern"])
+    def test_specialize_kernel(self, kernel_backend, kernel):
+        gp = _fitted_gp()
+        noise_level = gp.gp.kernel_.k2.noise_level
+        assert gp._k_diag == 1.0 + noise_level
+
+        # Kernels outside the RBF (+ White) family keep the generic sklearn call
+        generic = BayesianGaussianProcess(kernel=kernel, n_restarts_optimizer=0)
+        generic.fit(*_training_data())
+        assert generic._k_fn is None and generic._k_diag is None
+
+        X = _queries()
+        mean, std = generic.predict_fast(X)
+        expected_mean, expected_std = generic.gp.predict(X, return_std=True)
+        assert np.allclose(mean, expected_mean, rtol=0, atol=1e-13)
+        assert np.allclose(std, expected_std, rtol=0, atol=1e-13)
+
+    @pytest.mark.parametrize("build", [_build_rbf_cross_kernel, _build_rbf_cross_kernel_blas])
+    def test_rbf_cross_kernels_match_sklearn(self, build):
+        if build is _build_rbf_cross_kernel and hybrid_model.njit is None:
+            pytest.skip("numba is not installed")
+
+        X_train, _ = _training_data()
+        X = _queries()
+        length_scale = np.array([0.5, 1.0, 2.0])
+
+        k = build(1.0 / length_scale, X_train)
+        out = np.empty((X.shape[0], X_train.shape[0]))
+        assert k(X, out) is out
+        assert np.allclose(out, RBF(length_scale)(X, X_train), rtol=0, atol=1e-13)
+
+    def test_prediction_cache(self, kernel_backend, monkeypatch):
+        gp = _fitted_gp(prediction_cache_size=2)
+        calls = []
+        predict_fast = gp.predict_fast
+        monkeypatch.setattr(gp, "predict_fast", lambda X: calls.append(X) or predict_fast(X))
+
+        a, b, c = _queries(seed=1), _queries(seed=2), _queries(seed=3)
+        mean_a, std_a = gp.predict(a)
+        expected_mean = mean_a.copy()
+        mean_a[:] = 0.0  # Callers get copies, never the cached arrays
+        cached_mean, cached_std = gp.predict(a + 1e-9)  # Below the rounding of the key
+        assert len(calls) == 1
+        assert np.array_equal(cached_mean, expected_mean) and np.array_equal(cached_std, std_a)
+
+        # Least recently used entries are evicted first
+        gp.predict(b)
+        gp.predict(a)
+        gp.predict(c)
+        assert len(calls) == 3
+        gp.predict(a)
+        assert len(calls) == 3
+        gp.predict(b)
+        assert len(calls) == 4
+
+        # Refitting drops every cached prediction
+        X_train, y_train = _training_data(seed=5)
+        gp.fit(X_train, y_train)
+        assert not gp._prediction_cache
+        refitted_mean, _ = gp.predict(a)
+        assert len(calls) == 5
+        assert np.allclose(refitted_mean, gp.gp.predict(a), rtol=0, atol=1e-13)
+
+
+class TestMonteCarlo:
+    """Scenario generation and the risk statistics computed from it"""
+
+    def test_correlated_scenarios(self):
+        simulator = MonteCarloSimulator(n_simulations=200_000)
+        correlation = np.array([[1.0, 0.8], [0.8, 1.0]])
+        base, volatility = np.array([0.01, -0.02]), np.array([0.1, 0.2])
+
+        scenarios = simulator.simulate_scenarios(base, volatility, correlation_matrix=correlation)
+
+        assert scenarios.shape == (2, 200_000)
+        assert scenarios.dtype == MonteCarloSimulator.SCENARIO_DTYPE
+        assert np.allclose(scenarios.mean(axis=1), base, atol=2e-3)
+        assert np.allclose(scenarios.std(axis=1), volatility, rtol=1e-2)
+        assert abs(np.corrcoef(scenarios)[0, 1] - 0.8) < 1e-2
+
+        # The registered matrix is reused; the base must have one entry per asset
+        assert simulator.simulate_scenarios(base, volatility).shape == (2, 200_000)
+        with pytest.raises(ValueError):
+            simulator.simulate_scenarios(np.zeros(3), 0.1)
+
+    def test_shocks(self):
+        def draw(shocks, base=0.0, correlation=None):
+            simulator = MonteCarloSimulator(n_simulations=100_000)
+            return simulator.simulate_scenarios(
+                base, 0.01, correlation_matrix=correlation, shock_probabilities=shocks
+            )
+
+        # Unknown and zero-probability shocks draw nothing
+        assert np.array_equal(draw({"unknown": 1.0, "geopolitical": 0.0}), draw(None))
+
+        crashed = draw({"market_crash": 1.0})
+        assert abs(crashed.mean() + 0.2) < 1e-3
+
+        # Correlated scenarios share one market-wide shock across assets
+        correlation = np.eye(2)
+        calm = draw(None, np.zeros(2), correlation)
+        shocked = draw({"liquidity_crisis": 0.5}, np.zeros(2), correlation)
+        shock = shocked - calm
+        assert np.allclose(shock[0], shock[1], atol=1e-6)
+        hit_rate = np.mean(shock[0] < -0.05)
+        assert abs(hit_rate - 0.5) < 0.01
+
+    def test_risk_metrics_match_numpy(self):
+        rng = np.random.default_rng(7)
+        scenarios = (rng.standard_t(5, 10_001) * 0.05 + 0.01).astype(np.float32)
+
+        simulator = MonteCarloSimulator(n_simulations=10)
+        metrics = simulator.calculate_risk_metrics(scenarios)
+
+        values = scenarios.astype(np.float64)
+        var_95 = np.percentile(values, 5)
+        assert metrics["var_95"] == pytest.approx(var_95, abs=1e-7)
+        assert metrics["var_99"] == pytest.approx(np.percentile(values, 1), abs=1e-7)
+        assert metrics["cvar_95"] == pytest.approx(values[values <= var_95].mean(), abs=1e-7)
+        assert metrics["max_drawdown"] == pytest.approx(values.min() - values.mean(), abs=1e-6)
+        assert metrics["upside_potential"] == pytest.approx(
+            np.percentile(values, 95) - values.mean(), abs=1e-6
+        )
+        assert metrics["probability_of_loss"] == pytest.approx(np.mean(values < 0))
+        assert metrics["mean"] == pytest.approx(values.mean(), abs=1e-6)
+        assert metrics["std"] == pytest.approx(values.std(), rel=1e-5)
+        assert metrics["skewness"] == pytest.approx(stats.skew(values), rel=1e-4)
+        assert metrics["kurtosis"] == pytest.approx(stats.kurtosis(values), rel=1e-4)
+
+        # Correlated (K, n) scenarios are pooled
+        pooled = np.stack([scenarios, -scenarios])
+        assert simulator.calculate_risk_metrics(pooled) == simulator.calculate_risk_metrics(pooled.ravel())
+
+    def test_moments_match_scipy(self):
+        rng = np.random.default_rng(3)
+        for x in (rng.normal(size=1000), rng.exponential(size=1000), rng.uniform(size=5)):
+            mean, var, skewness, kurtosis = _moments(x)
+            assert mean == pytest.approx(x.mean())
+            assert var == pytest.approx(x.var())
+            assert skewness == pytest.approx(stats.skew(x))
+            assert kurtosis == pytest.approx(stats.kurtosis(x))
+
+        assert all(np.isnan(_moments(np.full(10, 2.0))[2:]))
+
+
+class TestFeatureImportance:
+    """Importance is confidence times vector magnitude, normalised to 1"""
+
+    @staticmethod
+    def _vector(name, values, confidence=1.0):
+        return SimpleNamespace(
+            vector_type=SimpleNamespace(value=name), values=np.asarray(values), confidence=confidence
+        )
+
+    def test_equal_lengths(self):
+        importance = HybridPredictionModel()._calculate_feature_importance([
+            self._vector("technical", [3.0, 4.0], confidence=0.5),
+            self._vector("volatility", [0.0, 7.5]),
+        ])
+
+        assert importance == pytest.approx({"technical": 0.25, "volatility": 0.75})
+
+    def test_mixed_lengths(self):
+        importance = HybridPredictionModel()._calculate_feature_importance([
+            self._vector("technical", [3.0, 4.0]),
+            self._vector("stress", [1.0, 2.0, 2.0, 0.0, 0.0], confidence=5.0),
+        ])
+
+        assert importance == pytest.approx({"technical": 0.25, "stress": 0.75})
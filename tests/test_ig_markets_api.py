@@ -0,0 +1,256 @@
+"""
+Unit tests for the IG Markets API wrapper.
+
+Runs the wrapper against a local aiohttp server that stands in for the IG
+REST gateway.
+"""
+
+import asyncio
+import sys
+import os
+
+import aiohttp
+from aiohttp import web
+
+# Add the project root to the path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from integrations import ig_markets_api
+from integrations.ig_markets_api import IGMarketsAPI
+
+
+class FakeGateway:
+    """Minimal IG REST gateway recording the requests it serves"""
+
+    def __init__(self):
+        self.requests = []
+        self.transports = set()
+        self.positions = {
+            'DEAL1': {'position': {'dealId': 'DEAL1', 'direction': 'BUY', 'size': 1.5},
+                      'market': {'epic': 'IX.D.FTSE.DAILY.IP'}},
+        }
+        self.cst = 'cst-1'
+        self.delay = 0.0  # Seconds before answering session and order POSTs
+
+        self.app = web.Application()
+        self.app.router.add_post('/session', self.session)
+        self.app.router.add_get('/accounts', self.accounts)
+        self.app.router.add_get('/markets/{epic}', self.market)
+        self.app.router.add_get('/positions', self.list_positions)
+        self.app.router.add_post('/positions/otc', self.positions_otc)
+        self.app.router.add_get('/confirms/{ref}', self.confirm)
+
+    def _record(self, request, body=None):
+        self.requests.append((request.method, request.path, dict(request.headers), body))
+        self.transports.add(id(request.transport))
+
+    async def session(self, request):
+        self._record(request, await request.json())
+        await asyncio.sleep(self.delay)
+        return web.json_response(
+            {'accountId': 'ABC'}, headers={'CST': self.cst, 'X-SECURITY-TOKEN': 'xst-1'}
+        )
+
+    async def accounts(self, request):
+        self._record(request)
+        return web.json_response({'accounts': [{'accountId': 'ABC'}]})
+
+    async def market(self, request):
+        self._record(request)
+        return web.json_response({
+            'instrument': {'epic': request.match_info['epic']},
+            'snapshot': {'bid': 7500.0, 'offer': 7501.0},
+        })
+
+    async def list_positions(self, request):
+        self._record(request)
+        return web.json_response({'positions': list(self.positions.values())})
+
+    async def positions_otc(self, request):
+        body = await request.json()
+        self._record(request, body)
+        await asyncio.sleep(self.delay)
+        if request.headers.get('_method') == 'DELETE':
+            self.positions.pop(body['dealId'], None)
+            return web.json_response({'dealReference': 'CLOSE1'})
+        return web.json_response({'dealReference': 'OPEN1'})
+
+    async def confirm(self, request):
+        self._record(request)
+        return web.json_response({'dealStatus': 'ACCEPTED', 'dealReference': request.match_info['ref']})
+
+
+def _run_with_gateway(test, configure=None):
+    """Run test(api, gateway) against a fresh gateway on a local port"""
+    async def main():
+        gateway = FakeGateway()
+        runner = web.AppRunner(gateway.app)
+        await runner.setup()
+        site = web.TCPSite(runner, '127.0.0.1', 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+
+        api = IGMarketsAPI('key', 'user', 'password', 'ABC', demo=True)
+        api.base_url = f"http://127.0.0.1:{port}"
+        if configure is not None:
+            configure(api, gateway)
+        try:
+            await api.initialize()
+            return await test(api, gateway)
+        finally:
+            await api.shutdown()
+            await runner.cleanup()
+
+    return asyncio.run(main())
+
+
+class TestIGSession:
+    """Connection pooling and request headers"""
+
+    def test_requests_reuse_pooled_connection(self):
+        async def test(api, gateway):
+            for _ in range(5):
+                assert await api.get_market_data('IX.D.FTSE.DAILY.IP')
+            assert len(gateway.requests) == 6
+            assert len(gateway.transports) == 1
+
+        _run_with_gateway(test)
+
+    def test_headers_cached_per_version(self):
+        async def test(api, gateway):
+            assert await api.get_account_info()
+            assert await api.get_market_data('IX.D.FTSE.DAILY.IP')
+            assert await api.get_positions()
+
+            versions = [headers['Version'] for _, _, headers, _ in gateway.requests[1:]]
+            assert versions == ['1', '3', '2']
+            assert gateway.requests[1][2]['CST'] == 'cst-1'
+            assert api._get_headers('3') is api._get_headers('3')
+
+        _run_with_gateway(test)
+
+    def test_headers_rebuilt_when_tokens_rotate(self):
+        async def test(api, gateway):
+            before = api._get_headers()
+            gateway.cst = 'cst-2'
+            await api._authenticate()
+
+            after = api._get_headers()
+            assert after is not before
+            assert after['CST'] == 'cst-2'
+
+        _run_with_gateway(test)
+
+    def test_slow_orders_outlast_read_timeout(self):
+        def configure(api, gateway):
+            api.REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=0.1)
+            gateway.delay = 0.3
+
+        async def test(api, gateway):
+            assert await api.open_position('IX.D.FTSE.DAILY.IP', 'BUY', 1.0) == {'dealReference': 'OPEN1'}
+            assert (await api.close_position('DEAL1'))['dealReference'] == 'CLOSE1'
+
+        _run_with_gateway(test, configure)
+
+    def test_close_position_sends_delete_override(self):
+        async def test(api, gateway):
+            result = await api.close_position('DEAL1')
+            assert result['dealReference'] == 'CLOSE1'
+
+            method, path, headers, body = gateway.requests[-1]
+            assert (method, path, headers['_method'], headers['Version']) == (
+                'POST', '/positions/otc', 'DELETE', '1'
+            )
+            assert body['direction'] == 'SELL' and body['size'] == 1.5
+            assert '_method' not in api._get_headers('1')
+
+        _run_with_gateway(test)
+
+
+class TestIGPositions:
+    """Shared, short-lived positions cache"""
+
+    @staticmethod
+    def _count(gateway, method, path):
+        return sum(1 for m, p, _, _ in gateway.requests if (m, p) == (method, path))
+
+    def test_positions_reused_within_ttl(self):
+        async def test(api, gateway):
+            first = await api.get_positions()
+            assert await api.get_positions() == first
+            assert self._count(gateway, 'GET', '/positions') == 1
+
+            api.POSITIONS_TTL = -1.0
+            await api.get_positions()
+            assert self._count(gateway, 'GET', '/positions') == 2
+
+        _run_with_gateway(test)
+
+    def test_callers_get_copies_of_cached_positions(self):
+        async def test(api, gateway):
+            positions = await api.get_positions()
+            positions[0]['position']['size'] = 99.0
+            positions.clear()
+            position = await api.get_position('DEAL1')
+            position['position']['direction'] = 'SELL'
+
+            assert [p['position']['dealId'] for p in await api.get_positions()] == ['DEAL1']
+            assert (await api.get_position('DEAL1'))['position'] == gateway.positions['DEAL1']['position']
+            assert gateway.positions['DEAL1']['position']['direction'] == 'BUY'
+            assert self._count(gateway, 'GET', '/positions') == 1
+
+        _run_with_gateway(test)
+
+    def test_concurrent_lookups_share_one_fetch(self):
+        async def test(api, gateway):
+            gateway.positions['DEAL2'] = {
+                'position': {'dealId': 'DEAL2', 'direction': 'SELL', 'size': 0.5},
+                'market': {'epic': 'CS.D.EURUSD.MINI.IP'},
+            }
+            results = await asyncio.gather(
+                api.get_position('DEAL1'), api.get_position('DEAL2'), api.get_position('NOPE')
+            )
+
+            assert [r and r['position']['dealId'] for r in results] == ['DEAL1', 'DEAL2', None]
+            assert self._count(gateway, 'GET', '/positions') == 1
+
+        _run_with_gateway(test)
+
+    def test_close_invalidates_positions(self):
+        async def test(api, gateway):
+            gateway.positions['DEAL2'] = {
+                'position': {'dealId': 'DEAL2', 'direction': 'SELL', 'size': 0.5},
+                'market': {'epic': 'CS.D.EURUSD.MINI.IP'},
+            }
+            results = await asyncio.gather(
+                api.close_position('DEAL1'), api.close_position('DEAL2'), return_exceptions=True
+            )
+            assert [r['dealReference'] for r in results] == ['CLOSE1', 'CLOSE1']
+            closes = [body for m, p, _, body in gateway.requests if p == '/positions/otc']
+            assert [(b['dealId'], b['direction']) for b in closes] == [('DEAL1', 'SELL'), ('DEAL2', 'BUY')]
+            assert self._count(gateway, 'GET', '/positions') == 1
+
+            # The closes dropped the cached positions
+            assert await api.get_positions() == []
+            assert self._count(gateway, 'GET', '/positions') == 2
+
+        _run_with_gateway(test)
+
+
+class TestIGCodec:
+    """JSON bodies with orjson and with the stdlib fallback"""
+
+    def test_open_position_round_trip(self, monkeypatch):
+        async def test(api, gateway):
+            result = await api.open_position('IX.D.FTSE.DAILY.IP', 'buy', 1.26, stop_loss=7400)
+            assert result == {'dealReference': 'OPEN1'}
+
+            _, _, headers, body = next(r for r in gateway.requests if r[1] == '/positions/otc')
+            assert headers['Content-Type'] == 'application/json'
+            assert body['direction'] == 'BUY' and body['size'] == 1.3
+            assert body['stopLevel'] == 7400.0 and body['expiry'] == 'DFB'
+            assert (await api.get_market_data('IX.D.FTSE.DAILY.IP'))['snapshot']['bid'] == 7500.0
+
+        _run_with_gateway(test)
+        monkeypatch.setattr(ig_markets_api, 'orjson', None)
+        _run_with_gateway(test)
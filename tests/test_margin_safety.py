@@ -8,6 +8,8 @@ when insufficient funds and realistic position sizing.
 import sys
 import os
 
+import numpy as np
+
 # Add the project root to the path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
@@ -92,11 +94,12 @@ class TestMarginSafety:
         )
         
         # Without safety factor: 100/10 = 10 units
-        # With 1.5x safety factor: 100/(10*1.5) = 6.67 units
+        # With 1.5x safety factor: 100/(10*1.5) = 6.67 units, rounded down to 6.6
         expected_max = available_margin / (margin_per_unit * safety_factor)
         
         assert not result.is_blocked
-        assert abs(result.safe_units - round(expected_max, 1)) < 0.1
+        assert result.safe_units == 6.6
+        assert result.required_margin <= available_margin
         
         print(f"✅ Safety factor applied: {result.safe_units} units (expected ~{expected_max:.1f})")
         print(f"   Margin utilization: {result.calculation_details['margin_utilization']:.1f}%")
@@ -171,6 +174,31 @@ class TestMarginSafety:
         print(f"✅ Optimal sizing: {result.safe_units} units")
         print(f"   Limited by: {'risk' if result.safe_units <= 0.5 else 'margin'}")
     
+    def test_batch_sizing_matches_scalar(self):
+        """Test vectorized sizing agrees with the per-instrument engine"""
+        print("\n🧪 Testing batch position sizing...")
+        
+        engine = MarginSafetyEngine(default_safety_factor=1.2)
+        
+        cases = [
+            # (risk, stop, available margin, margin per unit)
+            (30.0, 60.0, 200.0, 15.0),     # Risk-limited
+            (500.0, 10.0, 100.0, 10.0),    # Margin-limited
+            (20.0, 50.0, 0.05, 3.0),       # Insufficient margin
+            (20.0, 50.0, 100.0, 0.0),      # Invalid margin per unit
+            (0.5, 100.0, 100.0, 10.0),     # Risk size below minimum
+        ]
+        risk, stop, avail, per_unit = (np.array(col) for col in zip(*cases))
+        
+        batch = engine.calculate_optimal_position_sizes(risk, stop, avail, per_unit)
+        
+        for i, case in enumerate(cases):
+            single = engine.calculate_optimal_position_size(*case)
+            assert batch.is_blocked[i] == single.is_blocked, f"case {case}"
+            assert batch.safe_units[i] == single.safe_units, f"case {case}"
+        
+        print(f"✅ Batch sizing: {batch.safe_units.tolist()}")
+    
     def test_edge_cases(self):
         """Test edge cases and error conditions"""
         print("\n🧪 Testing edge cases...")
@@ -249,6 +277,7 @@ def run_margin_safety_tests():
         test_suite.test_margin_validation_before_trade()
         test_suite.test_risk_based_position_sizing()
         test_suite.test_margin_safety_engine_integration()
+        test_suite.test_batch_sizing_matches_scalar()
         test_suite.test_edge_cases()
         test_suite.test_realistic_forex_scenario()
         
@@ -0,0 +1,430 @@
+"""
+Unit tests for the news sentiment engine.
+
+Checks headline classification and the keyword scan behind it.
+
+Each test runs in its own temporary working directory, where the engine
+keeps its news history log.
+"""
+
+import asyncio
+import json
+import sys
+import os
+import time
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+
+# Add the project root to the path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from integrations.data_feeds import _news_kernels, news_sentiment_engine
+from integrations.data_feeds.news_sentiment_engine import (
+    NewsCategory,
+    NewsImpact,
+    NewsSentimentEngine,
+)
+
+
+@pytest.fixture(autouse=True)
+def _in_tmp_path(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+
+
+class TestNewsClassification:
+    """Headlines land in the expected category with the expected sentiment"""
+
+    HEADLINES = [
+        ("Fed signals rate cuts ahead as inflation cools",
+         NewsCategory.FED_POLICY, NewsImpact.MODERATE, 0.0),
+        ("Fed rate hike inflation tightening restrictive hawkish qt",
+         NewsCategory.FED_POLICY, NewsImpact.HIGH, -1.0),
+        ("FOMC hawkish: rate hike and quantitative tightening, data dependent pause",
+         NewsCategory.FED_POLICY, NewsImpact.MODERATE, -0.3),
+        ("Apple earnings beat expectations, revenue up 12%",
+         NewsCategory.EARNINGS, NewsImpact.LOW, 0.4),
+        ("US GDP contracts for second quarter, recession fears grow",
+         NewsCategory.ECONOMIC_DATA, NewsImpact.MODERATE, -0.3),
+        ("China trade war escalates with new tariffs and sanctions",
+         NewsCategory.GEOPOLITICAL, NewsImpact.CRITICAL, -0.9),
+        ("Peace talks agreement reached in election year",
+         NewsCategory.GEOPOLITICAL, NewsImpact.LOW, 0.2),
+        ("SEC launches investigation into Nvidia accounting practices",
+         NewsCategory.REGULATORY, NewsImpact.MODERATE, -0.3),
+        ("Company files for bankruptcy after layoffs",
+         NewsCategory.CORPORATE_ACTION, NewsImpact.MODERATE, -0.7),
+        ("Google merger talks; Meta announces buyback and dividend",
+         NewsCategory.CORPORATE_ACTION, NewsImpact.LOW, 0.3),
+        ("Market crash: Trading halted after 7% S&P 500 drop",
+         NewsCategory.MARKET_STRUCTURE, NewsImpact.CRITICAL, -0.9),
+        ("Weather is nice today",
+         NewsCategory.SECTOR_NEWS, NewsImpact.LOW, 0.0),
+    ]
+
+    def test_classification(self):
+        engine = NewsSentimentEngine()
+
+        for headline, category, impact, sentiment in self.HEADLINES:
+            event = engine.analyze_news_headline(headline, "Test")
+            assert (event.category, event.impact) == (category, impact), headline
+            assert abs(event.sentiment_score - sentiment) < 1e-9, headline
+
+    def test_scan_counts_each_keyword_once(self):
+        engine = NewsSentimentEngine()
+
+        hits = engine._scan_keywords("fed rate hike, another rate hike into a trade war")
+        assert hits['fed_hawkish'] == 1
+        assert hits[NewsCategory.FED_POLICY] == 1
+        # 'trade war' and the 'war' inside it both match
+        assert hits[NewsCategory.GEOPOLITICAL] == 2
+        assert hits['geopolitical_critical'] == 1
+        assert hits['geopolitical_high'] == 1
+
+    def test_scan_without_automaton(self):
+        engine = NewsSentimentEngine()
+        fallback = NewsSentimentEngine()
+        fallback._keyword_automaton = None
+
+        for headline, *_ in self.HEADLINES:
+            assert engine._scan_keywords(headline.lower()) == fallback._scan_keywords(headline.lower())
+
+    def test_repeated_headlines_hit_the_cache(self):
+        engine = NewsSentimentEngine()
+
+        first = engine.analyze_news_headline("Apple earnings beat expectations", "Reuters")
+        second = engine.analyze_news_headline("APPLE earnings beat expectations", "Bloomberg")
+
+        assert engine._analyze_cached.cache_info().hits == 1
+        assert (second.category, second.sentiment_score, second.affected_symbols) == (
+            first.category, first.sentiment_score, first.affected_symbols
+        )
+        assert second.headline == "APPLE earnings beat expectations"
+        assert second.source == "Bloomberg"
+        assert second.keywords is first.keywords  # Shared, immutable
+        engine.close()
+
+    def test_keyword_index_is_shared(self):
+        first = NewsSentimentEngine()
+        second = NewsSentimentEngine()
+
+        assert second._keyword_tags is first._keyword_tags
+        assert second._keyword_automaton is first._keyword_automaton
+        assert second.fed_keywords is first.fed_keywords
+        first.close()
+        second.close()
+
+    def test_extract_symbols(self):
+        engine = NewsSentimentEngine()
+
+        assert engine._extract_symbols("nvidia and apple lift the s&p 500 and nasdaq") == (
+            'SPX', 'NDX', 'AAPL', 'NVDA'
+        )
+        assert engine._extract_symbols("dow jones slips; djia flat") == ('DJI',)
+        assert engine._extract_symbols("weather is nice today") == ('MARKET',)
+
+
+class TestNewsHistory:
+    """History is appended as JSON lines and reloaded on first use"""
+
+    def test_no_disk_io_until_used(self, tmp_path):
+        engine = NewsSentimentEngine()
+        engine.analyze_news_headline("Fed holds rates", "Test")
+        engine.close()
+
+        assert not (tmp_path / "data").exists()
+
+    def test_history_round_trip(self, tmp_path):
+        engine = NewsSentimentEngine()
+        for headline, *_ in TestNewsClassification.HEADLINES:
+            engine.add_news_event(engine.analyze_news_headline(headline, "Test"))
+        engine.close()
+
+        lines = (tmp_path / "data/news/news_history.jsonl").read_bytes().splitlines()
+        assert len(lines) == len(TestNewsClassification.HEADLINES)
+
+        assert b'"impact":"MODERATE"' in lines[0]
+        first = json.loads(lines[0])
+        epoch = datetime(1970, 1, 1, tzinfo=timezone.utc)
+        assert first['timestamp'] == (engine.news_history[0].timestamp - epoch) // timedelta(microseconds=1) * 1000
+
+        reloaded = NewsSentimentEngine()
+        assert [e.to_dict() for e in reloaded.news_history] == [e.to_dict() for e in engine.news_history]
+        reloaded.close()
+
+    def test_torn_line_is_dropped(self, tmp_path):
+        engine = NewsSentimentEngine()
+        engine.add_news_event(engine.analyze_news_headline("Fed holds rates", "Test"))
+        engine.close()
+        with open(tmp_path / "data/news/news_history.jsonl", "ab") as f:
+            f.write(b'{"timestamp": "2025-')
+
+        engine = NewsSentimentEngine()
+        engine.add_news_event(engine.analyze_news_headline("Apple earnings beat", "Test"))
+        engine.close()
+
+        reloaded = NewsSentimentEngine()
+        assert [e.headline for e in reloaded.news_history] == ["Fed holds rates", "Apple earnings beat"]
+        reloaded.close()
+
+    def test_buffered_events_flushed_at_exit(self, monkeypatch, tmp_path):
+        exit_handlers = []
+        monkeypatch.setattr(news_sentiment_engine.atexit, "register", exit_handlers.append)
+        monkeypatch.setattr(news_sentiment_engine.atexit, "unregister", exit_handlers.remove)
+        engine = NewsSentimentEngine()
+        engine.add_news_event(engine.analyze_news_headline("Fed holds rates", "Test"))
+        assert engine._unflushed == 1
+
+        # Interpreter exit runs the registered handler
+        assert exit_handlers == [engine.close]
+        exit_handlers[0]()
+        assert not exit_handlers
+        lines = (tmp_path / "data/news/news_history.jsonl").read_bytes().splitlines()
+        assert len(lines) == 1
+
+    def test_compaction_keeps_latest_events(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(NewsSentimentEngine, "COMPACT_THRESHOLD", 5)
+        monkeypatch.setattr(NewsSentimentEngine, "MAX_HISTORY_EVENTS", 3)
+        engine = NewsSentimentEngine()
+        for i in range(8):
+            engine.add_news_event(engine.analyze_news_headline(f"Headline {i}", "Test"))
+        engine.close()
+
+        reloaded = NewsSentimentEngine()
+        assert [e.headline for e in reloaded.news_history] == ["Headline 5", "Headline 6", "Headline 7"]
+        lines = (tmp_path / "data/news/news_history.jsonl").read_bytes().splitlines()
+        assert len(lines) == 3
+
+
+class TestCurrentSentiment:
+    """Weighted sentiment over the recent history window"""
+
+    def _engine_with_events(self, headlines_hours_ago):
+        engine = NewsSentimentEngine(history_hours=24)
+        now = datetime.now(timezone.utc)
+        for headline, hours_ago in headlines_hours_ago:
+            event = engine.analyze_news_headline(headline, "Test")
+            event.timestamp = now - timedelta(hours=hours_ago)
+            engine.add_news_event(event)
+        return engine
+
+    def test_weighted_sentiment(self):
+        engine = self._engine_with_events([
+            ("Apple earnings beat expectations", 30.0),        # Outside the window
+            ("Apple earnings beat expectations", 12.0),        # EARNINGS/LOW, +0.4
+            ("SEC launches investigation into Nvidia", 6.0),   # REGULATORY/MODERATE, -0.3
+            ("Weather is nice today", 0.0),                    # SECTOR_NEWS/LOW, 0.0
+        ])
+
+        result = engine.get_current_sentiment()
+
+        weights = [0.5 * 0.5 * 0.75, 1.5 * 0.75 * 0.65, 0.5 * 1.0 * 0.5]
+        expected = (0.4 * weights[0] - 0.3 * weights[1]) / sum(weights)
+        assert abs(result.overall_sentiment - expected) < 1e-4
+        assert (result.bullish_events, result.bearish_events, result.neutral_events) == (1, 1, 1)
+        assert result.highest_impact == NewsImpact.MODERATE
+        assert result.recommended_action == 'REDUCE_30'
+        assert [e.headline for e in result.recent_events] == [
+            "Apple earnings beat expectations",
+            "SEC launches investigation into Nvidia",
+            "Weather is nice today",
+        ]
+        engine.close()
+
+    def test_symbol_filter(self):
+        engine = self._engine_with_events([
+            ("Apple earnings beat expectations", 1.0),
+            ("Nvidia earnings miss", 1.0),
+            ("Company files for bankruptcy", 1.0),             # MARKET-wide
+        ])
+
+        result = engine.get_current_sentiment('AAPL')
+        assert [e.headline for e in result.recent_events] == [
+            "Apple earnings beat expectations",
+            "Company files for bankruptcy",
+        ]
+        assert engine.get_current_sentiment('TSLA').bullish_events == 0
+
+        # Symbols outside the bitmap table are matched event by event
+        engine.news_history[1].affected_symbols = ('XYZ',)
+        assert [e.headline for e in engine.get_current_sentiment('XYZ').recent_events] == [
+            "Nvidia earnings miss",
+            "Company files for bankruptcy",
+        ]
+        engine.close()
+
+    def test_out_of_order_events(self, monkeypatch, tmp_path):
+        engine = self._engine_with_events([
+            ("Apple earnings beat expectations", 1.0),
+            ("Weather is nice today", 30.0),                   # Backfilled, outside the window
+            ("SEC launches investigation into Nvidia", 2.0),
+        ])
+
+        result = engine.get_current_sentiment()
+        assert [e.headline for e in result.recent_events] == [
+            "Apple earnings beat expectations",
+            "SEC launches investigation into Nvidia",
+        ]
+        engine.close()
+
+        # Old events ahead of a backfilled one are skipped, in-window ones kept
+        (tmp_path / "backfill").mkdir()
+        monkeypatch.chdir(tmp_path / "backfill")
+        engine = self._engine_with_events([
+            ("Weather is nice today", 40.0),
+            ("Weather is nice today", 30.0),
+            ("Apple earnings beat expectations", 1.0),
+            ("SEC launches investigation into Nvidia", 5.0),   # Backfilled, in the window
+            ("Weather is nice today", 0.5),
+        ])
+
+        result = engine.get_current_sentiment()
+        assert [e.headline for e in result.recent_events] == [
+            "Apple earnings beat expectations",
+            "SEC launches investigation into Nvidia",
+            "Weather is nice today",
+        ]
+        engine.close()
+
+    def test_sentiment_cached_until_new_event(self):
+        engine = self._engine_with_events([("Apple earnings beat expectations", 1.0)])
+
+        first = engine.get_current_sentiment("SPX")
+        assert engine.get_current_sentiment("SPX") is first
+        assert engine.get_current_sentiment() is not first
+
+        engine.add_news_event(engine.analyze_news_headline("Market crash", "Test"))
+        second = engine.get_current_sentiment("SPX")
+        assert second is not first
+        assert second.recommended_action == 'HALT'
+
+        # The window slides with the clock, so results also age out
+        engine._sentiment_cache_ns = 1
+        assert engine.get_current_sentiment("SPX") is not second
+        engine.close()
+
+    def test_action_follows_highest_impact(self, monkeypatch, tmp_path):
+        cases = [
+            ("Market crash", ('HALT', 0.0, 0.0, 1.0)),
+            ("Fed rate hike inflation tightening restrictive hawkish qt", ('REDUCE_70', 0.3, 0.5, 0.8)),
+            ("SEC launches investigation", ('REDUCE_30', 0.7, 0.85, 0.5)),
+            ("Weather is nice today", ('REDUCE_10', 0.9, 0.95, 0.2)),
+        ]
+        for i, (headline, expected) in enumerate(cases):
+            (tmp_path / str(i)).mkdir()
+            monkeypatch.chdir(tmp_path / str(i))  # Fresh history for each case
+            engine = self._engine_with_events([(headline, 1.0)])
+            result = engine.get_current_sentiment()
+            assert (result.recommended_action, result.position_multiplier,
+                    result.confidence_penalty, result.risk_score) == expected, headline
+            engine.close()
+
+    def test_no_recent_events(self):
+        engine = self._engine_with_events([("Market crash", 48.0)])
+
+        result = engine.get_current_sentiment()
+        assert result.recommended_action == 'CONTINUE'
+        assert result.recent_events == []
+        engine.close()
+
+
+class TestNewsFetching:
+    """Feeds are fetched concurrently and their headlines analyzed"""
+
+    RSS = b"""<?xml version="1.0"?>
+<rss version="2.0"><channel><title>Wire</title>
+<item><title>Apple earnings beat expectations</title></item>
+<item><title>Market crash: trading halt</title></item>
+</channel></rss>"""
+
+    ATOM = b"""<?xml version="1.0"?>
+<feed xmlns="http://www.w3.org/2005/Atom"><title>Atom wire</title>
+<entry><title>Fed signals rate cut</title></entry>
+</feed>"""
+
+    def test_parse_feeds(self, monkeypatch):
+        engine = NewsSentimentEngine()
+
+        for parser in (news_sentiment_engine.lxml_etree, None):
+            monkeypatch.setattr(news_sentiment_engine, "lxml_etree", parser)
+            assert engine._parse_rss(self.RSS) == [
+                "Apple earnings beat expectations", "Market crash: trading halt"
+            ]
+            assert engine._parse_rss(self.ATOM) == ["Fed signals rate cut"]
+        engine.close()
+
+    def test_fetch_all_is_concurrent(self, monkeypatch):
+        engine = NewsSentimentEngine()
+        feeds = {
+            "https://wire.example/rss": self.RSS,
+            "https://atom.example/feed": self.ATOM,
+        }
+
+        async def fake_fetch(session, url):
+            await asyncio.sleep(0.2)
+            if url not in feeds:
+                raise OSError("unreachable")
+            return feeds[url]
+
+        monkeypatch.setattr(engine, "_fetch_one", fake_fetch)
+        start = time.perf_counter()
+        events = engine.fetch_all_sync(list(feeds) + ["https://down.example/rss"])
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 0.5
+        assert [(e.source, e.category) for e in events] == [
+            ("wire.example", NewsCategory.EARNINGS),
+            ("wire.example", NewsCategory.MARKET_STRUCTURE),
+            ("atom.example", NewsCategory.FED_POLICY),
+        ]
+        engine.close()
+
+    def test_fetch_all_skips_malformed_feeds(self, monkeypatch):
+        engine = NewsSentimentEngine()
+        feeds = {
+            "https://wire.example/rss": self.RSS,
+            "https://error.example/rss": b"<html><body><p>Service unavailable</body></html>",
+            "https://truncated.example/rss": self.RSS[:120],
+            "https://atom.example/feed": self.ATOM,
+        }
+
+        async def fake_fetch(session, url):
+            return feeds[url]
+
+        monkeypatch.setattr(engine, "_fetch_one", fake_fetch)
+        for parser in (news_sentiment_engine.lxml_etree, None):
+            monkeypatch.setattr(news_sentiment_engine, "lxml_etree", parser)
+            events = engine.fetch_all_sync(list(feeds))
+            assert [e.source for e in events] == ["wire.example", "wire.example", "atom.example"]
+        engine.close()
+
+
+class TestNewsKernels:
+    """The compiled reduction matches its NumPy definition"""
+
+    def test_reduce_sentiment_matches_numpy(self):
+        rng = np.random.default_rng(1)
+        n = 500
+        hour_ns = 3_600_000_000_000
+        ts = rng.integers(0, 100 * hour_ns, n).astype(np.int64)
+        sent = rng.uniform(-1.0, 1.0, n)
+        imp = rng.integers(0, 5, n).astype(np.int8)
+        conf = rng.uniform(0.0, 1.0, n)
+        symbols = rng.integers(1, 16, n).astype(np.int64)
+        weights = np.array([5.0, 3.0, 1.5, 0.5, 0.1])
+
+        for cutoff_ns, symbol_mask in ((76 * hour_ns, -1), (76 * hour_ns, 0b0101), (99 * hour_ns, 0b1000)):
+            ring = np.empty(_news_kernels.N_RECENT, dtype=np.intp)
+            ring_numpy = np.empty(_news_kernels.N_RECENT, dtype=np.intp)
+            result = _news_kernels.reduce_sentiment(
+                ts, sent, imp, conf, symbols, symbol_mask, 100 * hour_ns, cutoff_ns, 24.0, weights, ring
+            )
+            expected = _news_kernels._reduce_numpy(
+                ts, sent, imp, conf, symbols, symbol_mask, 100 * hour_ns, cutoff_ns, 24.0, weights,
+                ring_numpy
+            )
+
+            count = expected[-1]
+            assert np.allclose(result, expected)
+            assert (ring[:count] == ring_numpy[:count]).all()
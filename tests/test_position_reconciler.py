@@ -0,0 +1,222 @@
+"""
+Unit tests for the position reconciler.
+"""
+
+import asyncio
+import sys
+import os
+from datetime import datetime
+from dataclasses import FrozenInstanceError
+
+import pytest
+
+# Add the project root to the path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.risk_management.position_reconciler import (
+    BrokerPosition,
+    BrokerPositionBatch,
+    Direction,
+    PositionReconciler,
+    PositionRecord,
+    PositionState,
+)
+
+
+def _open(reconciler, reference, deal_id, direction="BUY", size=1.0, price=100.0):
+    reconciler.add_pending_position(reference, "IX.D.FTSE.DAILY.IP", direction, size)
+    assert reconciler.confirm_position_opened(reference, deal_id, price)
+
+
+def _broker(deal_id, direction="BUY", size=1.0, level=100.0, current_price=None):
+    return BrokerPosition(deal_id, "IX.D.FTSE.DAILY.IP", direction, size, level, current_price)
+
+
+class TestStateBuckets:
+    """Per-state deal ID buckets stay in step with the records"""
+
+    def test_transitions_move_buckets(self):
+        reconciler = PositionReconciler()
+        _open(reconciler, "REF1", "D1")
+        _open(reconciler, "REF2", "D2")
+        reconciler.mark_position_closing("D2")
+        reconciler.confirm_position_closed("D2", 101.0, 1.0)
+
+        assert list(reconciler.get_open_positions()) == ["D1"]
+        summary = reconciler.get_position_summary()
+        assert (summary["OPEN"], summary["CLOSING"], summary["CLOSED"]) == (1, 0, 1)
+
+    def test_pending_kept_apart_from_confirmed(self):
+        reconciler = PositionReconciler()
+        reconciler.add_pending_position("REF1", "IX.D.FTSE.DAILY.IP", "BUY", 1.0)
+        assert list(reconciler.pending_positions) == ["REF1"]
+        assert reconciler.get_position_summary()["PENDING"] == 1
+        assert list(reconciler.internal_positions) == ["PENDING_REF1"]
+
+        assert reconciler.confirm_position_opened("REF1", "D1", 100.0)
+        assert not reconciler.pending_positions
+        assert list(reconciler.confirmed_positions) == ["D1"]
+        assert reconciler.get_position_summary()["PENDING"] == 0
+
+    def test_internal_positions_read_only(self):
+        reconciler = PositionReconciler()
+        _open(reconciler, "REF1", "D1")
+        reconciler.add_pending_position("REF2", "IX.D.FTSE.DAILY.IP", "SELL", 1.0)
+
+        positions = reconciler.internal_positions
+        assert list(positions) == ["PENDING_REF2", "D1"]
+        with pytest.raises(TypeError):
+            positions["D2"] = positions["D1"]
+        with pytest.raises(TypeError):
+            del positions["D1"]
+
+        # Assigning the property replaces the tracked positions
+        reconciler.internal_positions = {"D1": positions["D1"]}
+        assert not reconciler.pending_positions
+        assert list(reconciler.get_open_positions()) == ["D1"]
+
+    def test_retracked_deal_counted_once(self):
+        reconciler = PositionReconciler()
+        _open(reconciler, "REF1", "D1")
+        reconciler.confirm_position_closed("D1", 101.0, 1.0)
+
+        # The broker still reports D1, so it is tracked again as OPEN
+        result = reconciler.reconcile_positions([_broker("D1")])
+
+        assert result.missing_from_internal == ("D1",)
+        assert result.total_internal == 1
+        assert list(reconciler.get_open_positions()) == ["D1"]
+        summary = reconciler.get_position_summary()
+        assert (summary["OPEN"], summary["CLOSED"]) == (1, 0)
+
+    def test_reused_deal_id_on_confirm(self):
+        reconciler = PositionReconciler()
+        _open(reconciler, "REF1", "D1")
+        reconciler.confirm_position_closed("D1", 101.0, 1.0)
+        _open(reconciler, "REF2", "D1", price=105.0)
+
+        assert reconciler.get_open_positions()["D1"].entry_price == 105.0
+        summary = reconciler.get_position_summary()
+        assert (summary["OPEN"], summary["CLOSED"]) == (1, 0)
+
+
+class TestPositionRecord:
+    """Times are stored as nanoseconds behind the datetime API"""
+
+    def test_datetime_keywords(self):
+        opened = datetime(2025, 1, 2, 9, 30)
+        closed = datetime(2025, 1, 2, 15, 45)
+        record = PositionRecord(
+            deal_id="D1", epic="IX.D.FTSE.DAILY.IP", direction="SELL", size=1.0,
+            entry_time=opened, close_time=closed, last_updated=closed,
+        )
+
+        assert record.direction is Direction.SELL
+        assert (record.entry_time, record.close_time, record.last_updated) == (opened, closed, closed)
+        assert record.entry_time_ns == int(opened.timestamp() * 1_000_000_000)
+
+    def test_datetime_properties(self):
+        record = PositionRecord("D1", "IX.D.FTSE.DAILY.IP", "BUY", 1.0)
+        assert record.entry_time is None and record.close_time is None
+        assert isinstance(record.last_updated, datetime)
+
+        closed = datetime(2025, 1, 2, 15, 45)
+        record.close_time = closed
+        assert record.close_time == closed
+        assert record.close_time_ns == int(closed.timestamp() * 1_000_000_000)
+        record.close_time = None
+        assert record.close_time_ns is None
+
+
+class TestReconciliation:
+    """Matching internal records against broker positions"""
+
+    def test_synchronized(self):
+        reconciler = PositionReconciler()
+        _open(reconciler, "REF1", "D1", direction="SELL", size=2.0)
+
+        result = reconciler.reconcile_positions([_broker("D1", "SELL", 2.0, current_price=90.0)])
+
+        assert result.is_synchronized
+        assert result.matched_positions == 1
+        position = reconciler.confirmed_positions["D1"]
+        assert position.direction is Direction.SELL
+        assert position.pnl == 20.0  # (90 - 100) * -1 * 2
+
+    def test_missing_positions_both_ways(self):
+        reconciler = PositionReconciler()
+        _open(reconciler, "REF1", "D1")
+
+        result = reconciler.reconcile_positions([_broker("D2")])
+
+        assert result.missing_from_internal == ("D2",)
+        assert result.missing_from_broker == ("D1",)
+        assert not result.is_synchronized
+        assert reconciler.confirmed_positions["D1"].state == PositionState.CLOSED
+        assert list(reconciler.get_open_positions()) == ["D2"]
+        assert result.total_internal == 1
+
+    def test_detail_mismatch(self):
+        reconciler = PositionReconciler()
+        _open(reconciler, "REF1", "D1", size=1.0)
+        _open(reconciler, "REF2", "D2", direction="SELL")
+
+        result = reconciler.reconcile_positions([_broker("D1", size=1.5), _broker("D2", "SELL")])
+
+        assert [deal_id for deal_id, _, _ in result.state_mismatches] == ["D1"]
+
+    def test_sizes_compared_with_tolerance(self):
+        reconciler = PositionReconciler()
+        _open(reconciler, "REF1", "D1", size=0.3)
+
+        result = reconciler.reconcile_positions([_broker("D1", size=0.1 + 0.2)])
+
+        assert result.is_synchronized
+
+    def test_batches_from_several_brokers(self):
+        reconciler = PositionReconciler()
+        _open(reconciler, "REF1", "D1")
+        _open(reconciler, "REF2", "D2", direction="SELL")
+
+        batch = BrokerPositionBatch.concat([
+            BrokerPositionBatch.from_list([_broker("D1")]),
+            BrokerPositionBatch.from_list([_broker("D2", "SELL")]),
+        ])
+        result = reconciler.reconcile_positions(batch)
+
+        assert result.is_synchronized
+        assert result.total_broker == 2
+        assert batch.position(1).direction is Direction.SELL
+
+    def test_result_is_frozen(self):
+        reconciler = PositionReconciler()
+        result = reconciler.reconcile_positions([_broker("D1")])
+
+        assert result.actions_taken == ("Added missing position D1 from broker",)
+        with pytest.raises(FrozenInstanceError):
+            result.is_synchronized = True
+
+
+class TestSingleWriter:
+    """State changes submitted through run() apply in order"""
+
+    def test_submit_applies_in_order(self):
+        async def main():
+            reconciler = PositionReconciler()
+            writer = asyncio.create_task(reconciler.run())
+            try:
+                await reconciler.submit("add_pending_position", "REF1", "IX.D.FTSE.DAILY.IP", "BUY", 1.0)
+                opened, closing = await asyncio.gather(
+                    reconciler.submit("confirm_position_opened", "REF1", "D1", 100.0),
+                    reconciler.submit("mark_position_closing", "D1"),
+                )
+                assert opened and closing
+                assert reconciler.confirmed_positions["D1"].state == PositionState.CLOSING
+
+                # Read-only methods are not writer calls
+                with pytest.raises(ValueError):
+                    await reconciler.submit("get_open_positions")
+            finally:
+                writer.cancel()
+
+        asyncio.run(main())
@@ -0,0 +1,224 @@
+"""
+Unit tests for the Quantum Time-Warp learner.
+
+Each test runs in its own temporary working directory, where the learner
+keeps its state snapshot and delta log.
+"""
+
+import sys
+import os
+import time
+
+import numpy as np
+import pytest
+
+# Add the project root to the path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.models import quantum_time_warp_learner
+from core.models._twl_kernels import NO_RECENT_TRADES, _evolve_numpy, evolve_confidence
+from core.models.quantum_time_warp_learner import QuantumTimeWarpLearner
+
+
+@pytest.fixture(autouse=True)
+def _in_tmp_path(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+
+
+def _trade(symbol="IX.D.FTSE.DAILY.IP", regime="BREAKOUT_MOMENTUM", win=True, roi=0.02):
+    return {
+        "symbol": symbol,
+        "direction": "BUY",
+        "actual_roi": roi if win else -roi,
+        "regime": regime,
+        "win": win,
+    }
+
+
+def _predictions(confidence=70.0):
+    return [
+        {"asset_name": "IX.D.FTSE.DAILY.IP", "optimal_regime": "BREAKOUT_MOMENTUM", "confidence_pct": confidence},
+        {"asset_name": "CS.D.EURUSD.MINI.IP", "optimal_regime": "UNSEEN", "confidence_pct": confidence},
+    ]
+
+
+class TestTradeIndex:
+    """Recent-trade lookups over the struct-of-arrays index"""
+
+    def test_recent_trades_per_symbol(self):
+        learner = QuantumTimeWarpLearner()
+        # Past the initial capacity of the index arrays
+        for i in range(100):
+            symbol = "IX.D.FTSE.DAILY.IP" if i % 2 else "CS.D.EURUSD.MINI.IP"
+            learner.record_trade_result(_trade(symbol, win=i % 3 == 0))
+
+        recent = learner._get_recent_trades("IX.D.FTSE.DAILY.IP")
+        assert recent.tolist() == [i % 3 == 0 for i in range(1, 100, 2)]
+        assert learner._get_recent_trades("IX.D.FTSE.DAILY.IP", hours=0).size == 0
+        assert learner._get_recent_trades("UNKNOWN").size == 0
+        learner.flush_learning_state()
+
+    def test_bounded_history_keeps_running_totals(self, monkeypatch):
+        monkeypatch.setattr(QuantumTimeWarpLearner, "MAX_TRADE_HISTORY", 8)
+        learner = QuantumTimeWarpLearner()
+        for i in range(40):
+            learner.record_trade_result(_trade(win=i % 4 == 0))
+
+        assert len(learner.trade_history) == 8
+        assert learner._n_trades <= 16
+        assert learner._get_recent_trades("IX.D.FTSE.DAILY.IP").tolist()[-8:] == [i % 4 == 0 for i in range(32, 40)]
+
+        analysis = learner.analyze_performance()
+        assert (analysis["total_trades"], analysis["wins"]) == (40, 10)
+        assert analysis["recent_win_rate"] == 0.2
+        learner.flush_learning_state()
+
+    def test_slots(self):
+        learner = QuantumTimeWarpLearner()
+        assert not hasattr(learner, "__dict__")
+        with pytest.raises(AttributeError):
+            learner.unknown_attribute = 1
+
+
+class TestEvolutionMemo:
+    """Repeated evolutions reuse the adjustments until the inputs change"""
+
+    def test_same_inputs_reuse_generation(self):
+        learner = QuantumTimeWarpLearner()
+        learner.record_trade_result(_trade())
+
+        first = learner.evolve_predictions(_predictions())
+        second = learner.evolve_predictions(_predictions())
+
+        assert learner.evolution_generation == 1
+        assert [p["confidence_pct"] for p in second] == [p["confidence_pct"] for p in first]
+
+        # A new trade or new prediction inputs start a new generation
+        learner.record_trade_result(_trade(win=False))
+        learner.evolve_predictions(_predictions())
+        learner.evolve_predictions(_predictions(confidence=80.0))
+        assert learner.evolution_generation == 3
+        learner.flush_learning_state()
+
+    def test_hash_collision_recomputed(self):
+        learner = QuantumTimeWarpLearner()
+        learner.record_trade_result(_trade())
+
+        # hash(-1.0) == hash(-2.0) in CPython, so these inputs share a hash
+        assert hash(-1.0) == hash(-2.0)
+        learner.evolve_predictions(_predictions(confidence=-1.0))
+        learner.evolve_predictions(_predictions(confidence=-2.0))
+
+        assert learner.evolution_generation == 2
+        learner.flush_learning_state()
+
+    def test_aged_out_trades_recomputed(self, monkeypatch):
+        learner = QuantumTimeWarpLearner()
+        learner.record_trade_result(_trade())
+        with_recent = learner.evolve_predictions(_predictions())[0]["adjustment_factor"]
+
+        # A day later the trade has left the 24h window with no new trade recorded
+        later = time.time() + 25 * 3600
+        monkeypatch.setattr(quantum_time_warp_learner.time, "time", lambda: later)
+        aged_out = learner.evolve_predictions(_predictions())[0]["adjustment_factor"]
+
+        assert learner.evolution_generation == 2
+        assert aged_out < with_recent
+        learner.flush_learning_state()
+
+
+class TestLearningStatePersistence:
+    """Snapshot plus delta log round trip"""
+
+    def test_delta_log_replayed(self):
+        learner = QuantumTimeWarpLearner(checkpoint_interval=10)
+        learner.record_trade_result(_trade())
+        learner.record_trade_result(_trade(win=False))
+        learner.evolve_predictions(_predictions())
+        learner.flush_learning_state()
+
+        assert not learner.state_file.exists()
+        restored = QuantumTimeWarpLearner()
+        assert restored.evolution_generation == 1
+        assert restored.regime_performance == learner.regime_performance
+
+    def test_snapshot_truncates_delta_log(self):
+        learner = QuantumTimeWarpLearner(checkpoint_interval=2)
+        for confidence in (60.0, 70.0):
+            learner.record_trade_result(_trade())
+            learner.evolve_predictions(_predictions(confidence))
+        learner.flush_learning_state()
+
+        assert learner.state_file.exists()
+        assert learner.delta_log_file.stat().st_size == 0
+
+        # Deltas after the snapshot are replayed on top of it
+        learner.record_trade_result(_trade(regime="RANGE_BOUND", win=False))
+        learner.flush_learning_state()
+        restored = QuantumTimeWarpLearner()
+        assert restored.evolution_generation == 2
+        assert restored.regime_performance == learner.regime_performance
+
+    def test_deltas_in_snapshot_not_replayed(self):
+        learner = QuantumTimeWarpLearner(checkpoint_interval=1)
+        learner.record_trade_result(_trade())
+        learner.flush_learning_state()
+        logged = learner.delta_log_file.read_bytes()
+        learner.evolve_predictions(_predictions())
+        learner.flush_learning_state()
+
+        # Crash between replacing the snapshot and truncating the delta log
+        learner.delta_log_file.write_bytes(logged)
+        restored = QuantumTimeWarpLearner()
+        assert restored.regime_performance == learner.regime_performance
+
+        # Later deltas continue the sequence and are replayed
+        restored.record_trade_result(_trade(win=False))
+        restored.flush_learning_state()
+        again = QuantumTimeWarpLearner()
+        assert again.regime_performance["BREAKOUT_MOMENTUM"]["total_trades"] == 2
+
+    def test_torn_delta_record_ignored(self):
+        learner = QuantumTimeWarpLearner()
+        learner.record_trade_result(_trade())
+        learner.flush_learning_state()
+        with open(learner.delta_log_file, "ab") as f:
+            f.write(b"\x80\x05\x95torn")
+
+        restored = QuantumTimeWarpLearner()
+        assert restored.regime_performance["BREAKOUT_MOMENTUM"]["total_trades"] == 1
+
+    def test_batch_coalesces_to_last_snapshot(self):
+        learner = QuantumTimeWarpLearner()
+        learner._write_batch([
+            ("delta", {"generation": 1}),
+            ("snapshot", {"generation": 2}),
+            ("delta", {"generation": 3}),
+            ("snapshot", {"generation": 4}),
+            ("delta", {"generation": 5}),
+        ])
+
+        restored = QuantumTimeWarpLearner()
+        assert restored.evolution_generation == 5
+        assert restored._replay_delta_log() == 1  # Only the delta after the last snapshot
+
+
+class TestTimeWarpKernels:
+    """The compiled adjustment matches its NumPy definition"""
+
+    def test_evolve_confidence_matches_numpy(self):
+        rng = np.random.default_rng(2)
+        n = 200
+        conf = rng.uniform(30, 100, n)
+        regime_acc = rng.uniform(0, 1, n)
+        win_rate = np.where(rng.random(n) < 0.3, NO_RECENT_TRADES, rng.uniform(0, 1, n))
+
+        outputs = []
+        for kernel in (evolve_confidence, _evolve_numpy):
+            out_conf, out_adj = np.empty(n), np.empty(n)
+            kernel(conf, regime_acc, win_rate, 0.15, out_conf, out_adj)
+            outputs.append((out_conf, out_adj))
+
+        assert np.allclose(outputs[0][0], outputs[1][0])
+        assert np.allclose(outputs[0][1], outputs[1][1])
+        assert outputs[0][0].min() >= 40.0 and outputs[0][0].max() <= 95.0
@@ -0,0 +1,244 @@
+"""
+Unit tests for the SSE risk engine.
+
+Checks the compiled scenario kernels against plain NumPy references and
+runs a full pre-trade validation through the engine.
+"""
+
+import asyncio
+import json
+import sys
+import os
+
+import numpy as np
+
+# Add the project root to the path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.sse import SSERiskEngine, TradeProposal
+from core.sse import _sse_kernels
+
+
+def _scenarios(n=10000, seed=7):
+    rng = np.random.default_rng(seed)
+    return 0.05 + 0.1 * rng.standard_normal(n)
+
+
+class TestSSEKernels:
+    """Scenario reductions match their NumPy definitions"""
+
+    def test_fused_stats_matches_numpy(self):
+        scenarios = _scenarios()
+        for kernel in (_sse_kernels.fused_stats, _sse_kernels._fused_stats_numpy):
+            n_win, n_loss, n_ruin, mean, std, skewness, kurtosis = kernel(scenarios, 0.2)
+
+            z = (scenarios - scenarios.mean()) / scenarios.std()
+            assert n_win == np.count_nonzero(scenarios > 0.0)
+            assert n_loss == np.count_nonzero(scenarios < 0.0)
+            assert n_ruin == np.count_nonzero(scenarios < -0.2)
+            assert np.isclose(mean, scenarios.mean(), rtol=1e-9)
+            assert np.isclose(std, scenarios.std(), rtol=1e-9)
+            assert np.isclose(skewness, np.mean(z ** 3), rtol=1e-6, atol=1e-9)
+            assert np.isclose(kurtosis, np.mean(z ** 4) - 3.0, rtol=1e-6, atol=1e-9)
+
+    def test_specialized_kernels_match_generic(self):
+        scenarios = _scenarios(5000)
+        simulate_batch, simulate_batch_parallel, fused_stats = _sse_kernels.make_kernels(5000)
+
+        assert np.allclose(fused_stats(scenarios, 0.2), _sse_kernels.fused_stats(scenarios, 0.2))
+        for kernel in (simulate_batch, simulate_batch_parallel):
+            out = np.empty((2, 5000))
+            kernel(out, np.array([0.2, 0.7]), np.array([0.01, 0.01]), np.zeros((2, 4)))
+            assert np.allclose(out.mean(axis=1), [0.2, 0.7], atol=2e-3)
+
+    def test_fused_stats_constant_scenarios(self):
+        stats = _sse_kernels.fused_stats(np.full(100, 0.3), 0.2)
+        assert stats == (100, 0, 0, 0.3, 0.0, 0.0, 0.0)
+
+    def test_simulate_scenarios_distribution(self):
+        for kernel in (
+            _sse_kernels.simulate_scenarios,
+            _sse_kernels.simulate_scenarios_parallel,
+            _sse_kernels._simulate_numpy,
+        ):
+            out = np.empty(100_000)
+            kernel(out, 0.5, 0.02, 0.0, 0.0, 0.0, 0.0)
+            assert abs(out.mean() - 0.5) < 1e-3
+            assert abs(out.std() - 0.02) < 1e-3
+
+            # Every scenario takes a market crash shock (~N(-0.2, 0.05))
+            kernel(out, 0.5, 0.02, 1.0, 0.0, 0.0, 0.0)
+            assert abs(out.mean() - 0.3) < 1e-3
+
+    def test_simulate_batch_rows(self):
+        bases = np.array([0.1, 0.5, 0.9])
+        vols = np.array([0.01, 0.02, 0.03])
+        shock_probs = np.array([[0.0, 0.0, 0.0, 0.0], [1.0, 0.0, 0.0, 0.0], [0.0, 0.0, 0.0, 1.0]])
+        for kernel in (
+            _sse_kernels.simulate_batch,
+            _sse_kernels.simulate_batch_parallel,
+            _sse_kernels._simulate_batch_numpy,
+        ):
+            out = np.empty((3, 50_000))
+            kernel(out, bases, vols, shock_probs)
+            assert np.allclose(out.mean(axis=1), [0.1, 0.3, 1.0], atol=2e-3)
+            assert abs(out[0].std() - 0.01) < 1e-3
+
+    def test_partition_percentiles_matches_numpy(self):
+        q = [5, 25, 50, 75, 95]
+        for n in (1, 2, 7, 1000, 10000):
+            scenarios = _scenarios(n)
+            expected = np.percentile(scenarios, q)
+            assert np.allclose(
+                _sse_kernels.partition_percentiles(scenarios, q),
+                expected,
+                rtol=0, atol=1e-12
+            )
+            assert np.allclose(
+                _sse_kernels.partition_percentiles(scenarios, q, overwrite_input=True),
+                expected,
+                rtol=0, atol=1e-12
+            )
+
+    def test_fused_stats_float32(self):
+        scenarios = _scenarios().astype(np.float32)
+        n_win, _, _, mean, std, _, _ = _sse_kernels.fused_stats(scenarios, 0.2)
+
+        assert n_win == np.count_nonzero(scenarios > 0.0)
+        assert np.isclose(mean, scenarios.astype(np.float64).mean(), rtol=1e-6)
+        assert np.isclose(std, scenarios.astype(np.float64).std(), rtol=1e-6)
+
+
+class TestSSERiskEngine:
+    """End-to-end validation through the engine"""
+
+    def test_validate_trade_metrics(self):
+        engine = SSERiskEngine({})
+        proposal = TradeProposal(
+            epic="CS.D.EURUSD.MINI.IP",
+            direction="BUY",
+            size=1.0,
+            entry_price=1.1,
+            confidence_score=0.8,
+        )
+
+        result = asyncio.run(engine.validate_trade(proposal))
+        metrics = result.simulation_metrics
+
+        assert result.scenarios_analyzed == engine.n_simulations
+        assert 0.0 <= result.win_probability <= 1.0
+        assert 0.0 <= result.risk_of_ruin <= 1.0
+        assert metrics["probability_of_loss"] + result.win_probability <= 1.0
+        p = metrics["percentiles"]
+        assert p["p5"] <= p["p25"] <= p["p50"] <= p["p75"] <= p["p95"]
+        assert engine.approved_trades + engine.blocked_trades == 1
+
+    def test_prescreen_rejects_without_simulating(self):
+        engine = SSERiskEngine({})
+        engine._simulate_scenarios = None  # Any simulation attempt would fail the validation
+        proposal = TradeProposal(
+            epic="IX.D.FTSE.DAILY.IP",
+            direction="SELL",
+            size=1.0,
+            entry_price=7500.0,
+            confidence_score=0.02,
+        )
+
+        result = engine.validate_trade_sync(proposal)
+
+        assert not result.approved
+        assert result.scenarios_analyzed == 0
+        assert result.rejection_reason.startswith("Prescreen")
+        assert engine.blocked_trades == 1
+
+    def test_prescreen_passes_viable_trades_to_simulation(self):
+        engine = SSERiskEngine({})
+        proposal = TradeProposal(
+            epic="CS.D.EURUSD.MINI.IP",
+            direction="BUY",
+            size=1.0,
+            entry_price=1.1,
+            confidence_score=0.8,
+        )
+
+        assert engine._prescreen(proposal, engine._calculate_market_volatility(proposal)) is None
+
+    def test_validate_trades_batch(self):
+        engine = SSERiskEngine({})
+        proposals = [
+            TradeProposal("CS.D.EURUSD.MINI.IP", "BUY", 1.0, 1.1, confidence_score=0.8),
+            TradeProposal("IX.D.FTSE.DAILY.IP", "SELL", 1.0, 7500.0, confidence_score=0.02),
+            TradeProposal("CC.D.LCO.USS.IP", "BUY", 1.0, 80.0, confidence_score=0.6),
+        ]
+
+        results = engine.validate_trades_batch(proposals)
+
+        assert len(results) == 3
+        assert results[0].scenarios_analyzed == engine.n_simulations
+        assert results[1].rejection_reason.startswith("Prescreen")
+        assert results[2].scenarios_analyzed == engine.n_simulations
+        assert abs(results[0].expected_value - 0.8) < 0.01
+        assert abs(results[2].expected_value - 0.6) < 0.01
+        assert engine.approved_trades + engine.blocked_trades == 3
+
+    def test_scenario_precision(self):
+        proposal = TradeProposal("CS.D.EURUSD.MINI.IP", "BUY", 1.0, 1.1, confidence_score=0.8)
+        expected = {}
+        for precision in ("float32", "float64"):
+            engine = SSERiskEngine({"trading": {"sse": {"precision": precision}}})
+            result = engine.validate_trade_sync(proposal)
+
+            assert engine._scenario_buf.dtype == np.dtype(precision)
+            assert isinstance(result.expected_value, float)
+            expected[precision] = result.expected_value
+
+        assert abs(expected["float32"] - expected["float64"]) < 0.01
+
+    def test_validation_history_is_bounded(self):
+        engine = SSERiskEngine({"trading": {"sse": {"n_simulations": 100}}})
+        proposal = TradeProposal("CS.D.EURUSD.MINI.IP", "BUY", 1.0, 1.1, confidence_score=0.8)
+        engine.validate_trades_batch([proposal] * (engine.MAX_VALIDATION_HISTORY + 5))
+
+        assert len(engine.validation_history) == engine.MAX_VALIDATION_HISTORY
+
+    def test_export_history(self):
+        engine = SSERiskEngine({"trading": {"sse": {"n_simulations": 100}}})
+        proposal = TradeProposal("CS.D.EURUSD.MINI.IP", "BUY", 1.0, 1.1, confidence_score=0.8)
+        result = engine.validate_trade_sync(proposal)
+
+        records = json.loads(engine._export_history())
+
+        assert len(records) == 1
+        assert records[0]["epic"] == proposal.epic
+        assert records[0]["approved"] == result.approved
+        assert records[0]["scenarios_analyzed"] == result.scenarios_analyzed
+        assert "T" in records[0]["timestamp"]
+
+    def test_gates_report_only_failed_checks(self):
+        engine = SSERiskEngine({})
+        proposal = TradeProposal("CS.D.EURUSD.MINI.IP", "BUY", 1.0, 1.1)
+        analysis = {
+            "win_probability": 0.9,
+            "risk_of_ruin": 0.5,
+            "expected_value": 0.5,
+            "confidence_level": 0.5,
+            "scenarios_count": 1,
+        }
+
+        result = engine._apply_monte_carlo_gates(analysis, proposal)
+        assert not result.approved
+        assert result.rejection_reason == "Risk of ruin 50.0% > 5.0%; Confidence level 50.0% < 99.0%"
+
+        engine.block_high_risk_trades = False
+        result = engine._apply_monte_carlo_gates(analysis, proposal)
+        assert result.approved and result.rejection_reason is None
+
+    def test_seeded_engines_are_reproducible(self):
+        config = {"trading": {"sse": {"seed": 1234, "n_simulations": 5000}}}
+        proposal = TradeProposal("CS.D.EURUSD.MINI.IP", "BUY", 1.0, 1.1, confidence_score=0.8)
+
+        first = SSERiskEngine(config).validate_trade_sync(proposal)
+        second = SSERiskEngine(config).validate_trade_sync(proposal)
+
+        assert first.expected_value == second.expected_value
+        assert first.simulation_metrics["percentiles"] == second.simulation_metrics["percentiles"]